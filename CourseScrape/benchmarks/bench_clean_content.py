@@ -0,0 +1,90 @@
+"""
+Benchmark ContentExtractor._clean_content against the cleaner it replaced.
+
+Builds a synthetic documentation page, cleans it with the previous
+copy-and-find_all implementation and with the current single-pass one,
+and reports the best of several runs plus whether the extracted text
+matches. Run from the CourseScrape directory:
+
+    python benchmarks/bench_clean_content.py --sections 400 --parser html.parser
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from copy import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django
+
+django.setup()
+
+from course_gen.services.knowledge_scraper import ContentCleaner, ContentExtractor
+from course_gen.utils.html_parser import parse_html
+
+
+def build_page(sections: int) -> str:
+    """Documentation-style page: nav, many sections with ads, code, lists and empty wrappers"""
+    body = "".join(f"""
+        <section class="doc-section" id="s{i}"><h2>Section {i}</h2>
+        <div class="sidebar-ad"><a href="/ad">ad</a></div>
+        <p>{"lorem ipsum dolor sit amet " * 20}</p><span></span><div><div><span> </span></div></div>
+        <pre><code>print({i})</code></pre><ul>{"".join(f"<li>item {j} text</li>" for j in range(10))}</ul>
+        <div class="share"><button>share</button></div><table><tr><td>a</td><td></td></tr></table>
+        </section>""" for i in range(sections))
+    return (f'<html><head><title>Doc</title></head><body><nav class="navbar"><a href="/">home</a></nav>'
+            f'<main>{body}</main><footer>f</footer></body></html>')
+
+
+def old_clean_content(extractor: ContentExtractor, soup):
+    """The cleaner before the single-pass rewrite"""
+    clean_soup = copy(soup)
+    for tag in extractor.elements_to_remove:
+        for element in clean_soup.find_all(tag):
+            element.decompose()
+    for class_name in extractor.non_content_cases:
+        for element in clean_soup.find_all(class_=re.compile(class_name, re.I)):
+            element.decompose()
+        for element in clean_soup.find_all(id=re.compile(class_name, re.I)):
+            element.decompose()
+    for element in clean_soup.find_all():
+        if not element.get_text(strip=True) and not element.find_all():
+            element.decompose()
+    return clean_soup
+
+
+def best_of(clean, html: str, parser: str, repeat: int):
+    """Fastest of `repeat` runs on a fresh parse each time; parsing is not timed"""
+    timings, result = [], None
+    for _ in range(repeat):
+        soup = parse_html(html, parser)
+        started = time.perf_counter()
+        result = clean(soup)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=400, help="Sections in the synthetic page")
+    parser.add_argument("--parser", default="html.parser", help="BeautifulSoup tree builder")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation")
+    args = parser.parse_args()
+
+    html = build_page(args.sections)
+    extractor = ContentExtractor(ContentCleaner())
+
+    old_time, old = best_of(lambda soup: old_clean_content(extractor, soup), html, args.parser, args.repeat)
+    new_time, new = best_of(extractor._clean_content, html, args.parser, args.repeat)
+
+    print(f"page: {len(html) / 1024:.0f} KB, {args.sections} sections, parser {args.parser}")
+    print(f"old cleaner: {old_time * 1000:8.1f} ms")
+    print(f"new cleaner: {new_time * 1000:8.1f} ms  ({old_time / new_time:.1f}x faster)")
+    print(f"extracted text identical: {old.get_text(' ', strip=True) == new.get_text(' ', strip=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from course_gen.core.globals import APIView, HttpResponse
+
+from course_gen.utils.metrics import REGISTRY
+
+# Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsView(APIView):
+    """Scraper stage and per-domain metrics of this server process, for Prometheus to scrape"""
+
+    def get(self, request):
+        return HttpResponse(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -5,3 +5,4 @@ class WebScrapeRequestSerializer(serializers.Serializer):
     level = serializers.CharField(default="beginner")
     max_results = serializers.IntegerField(default=5)
     save_to_db = serializers.BooleanField(default=False)
+    stream = serializers.BooleanField(default=False)
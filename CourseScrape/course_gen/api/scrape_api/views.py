@@ -1,4 +1,7 @@
-from course_gen.core.globals import (logging, APIView, Response, status, async_to_sync)
+from course_gen.core.globals import (
+    logging, json, asyncio, threading, queue, APIView, Response, status, async_to_sync, aclosing,
+    StreamingHttpResponse, Callable, AsyncIterator, Iterable
+)
 
 from .serializer import WebScrapeRequestSerializer
 from course_gen.services.course_generator import CourseGenerator
@@ -25,6 +28,61 @@ scraper = PlaywrightScraper(
 new_knowledge = []
 search_results = []  # Store temporary search results
 
+
+def iterate_in_thread(make_stream: Callable[[], AsyncIterator[str]]) -> Iterable[str]:
+    """
+    Drive an async generator on a private event loop thread and yield its
+    items synchronously. WSGI servers consume a sync iterator chunk by chunk,
+    whereas Django's WSGI handler buffers async iterators completely. Closing
+    the returned generator (client disconnect) signals the loop to cancel the
+    async one and returns at once; the thread finishes its cleanup alone.
+    """
+    items: queue.Queue = queue.Queue()
+    end = object()
+    loop = asyncio.new_event_loop()
+    stop_requested = loop.create_future()
+
+    async def consume() -> None:
+        async with aclosing(make_stream()) as stream:
+            async for item in stream:
+                items.put(item)
+
+    async def pump() -> None:
+        consumer = asyncio.ensure_future(consume())
+        try:
+            await asyncio.wait([consumer, stop_requested], return_when=asyncio.FIRST_COMPLETED)
+            consumer.cancel()
+            # Let the scrape release browsers and connections
+            await asyncio.gather(consumer, return_exceptions=True)
+            if not consumer.cancelled() and consumer.exception() is not None:
+                logger.error(f"Result stream failed: {str(consumer.exception())}")
+        finally:
+            items.put(end)
+
+    def run() -> None:
+        try:
+            loop.run_until_complete(pump())
+        finally:
+            loop.close()
+
+    def request_stop() -> None:
+        if not stop_requested.done():
+            stop_requested.set_result(None)
+
+    threading.Thread(target=run, name="stream-loop", daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is end:
+                break
+            yield item
+    finally:
+        try:
+            loop.call_soon_threadsafe(request_stop)
+        except RuntimeError:
+            # The loop already finished and closed
+            pass
+
 class ScrapedContentView(APIView):
     def post(self, request):
         serializer = WebScrapeRequestSerializer(data=request.data)
@@ -40,6 +98,13 @@ class ScrapedContentView(APIView):
         if not query:
             return Response({"detail": "Query cannot be empty."}, status=status.HTTP_400_BAD_REQUEST)
 
+        if data.get("stream", False):
+            # One JSON object per line, sent as soon as each page is scraped
+            return StreamingHttpResponse(
+                iterate_in_thread(lambda: self.stream_results(query, level, max_results, save_to_db)),
+                content_type="application/x-ndjson"
+            )
+
         try:
             # 1. Fetch and scrape data
             search_results = async_to_sync(scraper.search_and_scrape_async)(query, level, max_results)
@@ -48,7 +113,7 @@ class ScrapedContentView(APIView):
             FileManager.save_to_knowledge_base(search_results)
 
             # 3. Optional DB save
-            if save_to_db and hasattr(self, 'db_manager'):
+            if save_to_db:
                 db_manager.store_knowledge(search_results)
 
             return Response({
@@ -60,4 +125,27 @@ class ScrapedContentView(APIView):
 
         except Exception as e:
             logger.error(f"Web search failed: {str(e)}", exc_info=True)
-            return Response({"detail": f"Error: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({"detail": f"Error: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def stream_results(self, query: str, level: str, max_results: int, save_to_db: bool):
+        """Yield scraped results as NDJSON lines, then save them and report the totals"""
+        results = []
+        try:
+            async with aclosing(scraper.search_and_scrape_iter(query, level, max_results)) as stream:
+                async for content_dict in stream:
+                    results.append(content_dict)
+                    yield json.dumps({"result": content_dict}) + "\n"
+
+            await asyncio.to_thread(FileManager.save_to_knowledge_base, results)
+            if save_to_db:
+                await asyncio.to_thread(db_manager.store_knowledge, results)
+
+            yield json.dumps({
+                "message": f"Found {len(results)} results.",
+                "saved_to_file": "knowledge_base.json",
+                "saved_to_db": save_to_db
+            }) + "\n"
+
+        except Exception as e:
+            logger.error(f"Web search failed: {str(e)}", exc_info=True)
+            yield json.dumps({"detail": f"Error: {str(e)}"}) + "\n"
@@ -4,6 +4,7 @@ from django.urls import path, include
 
 urlpatterns = [
     path('scraper/', include('course_gen.api.scrape_api.urls')),
-    path('course/', include('course_gen.api.course_api.urls'))
+    path('course/', include('course_gen.api.course_api.urls')),
+    path('metrics/', include('course_gen.api.metrics_api.urls'))
 ]
  
\ No newline at end of file
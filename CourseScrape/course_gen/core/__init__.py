@@ -1,14 +1,16 @@
-from .datatypes import ScrapedContent, SourceConfig
+from .datatypes import ScrapedContent, SourceConfig, PageClassification
 from .constants import (
     USER_AGENTS, BASE_HEADERS, CODE_SELECTORS, ADVANCED_INDICATORS, 
     BASIC_INDICATORS, ELEMENTS_TO_REMOVE, NON_CONTENT_CASES, PAYWALL_PATTERNS, 
     CONSENT_SELECTORS, MODAL_SELECTORS, COMMON_CONTENT_SELECTORS, COURSE_TEMPLATE,
-    LEVEL_MAP, SPECIAL_TOKENS
+    LEVEL_MAP, SPECIAL_TOKENS, BROWSER_LAUNCH_PROFILES, HTML_PARSERS,
+    RESOURCE_BLOCKING_PROFILES, TRACKER_HOSTS, BLOCKED_RESOURCE_SIZE_ESTIMATES
 )
 __all__ = [
     # datatypes.py
     'ScrapedContent',
     'SourceConfig',
+    'PageClassification',
     
     # constants.py
     'USER_AGENTS',
@@ -24,5 +26,10 @@ __all__ = [
     'COMMON_CONTENT_SELECTORS',
     'COURSE_TEMPLATE',
     'LEVEL_MAP',
-    'SPECIAL_TOKENS'
+    'SPECIAL_TOKENS',
+    'BROWSER_LAUNCH_PROFILES',
+    'HTML_PARSERS',
+    'RESOURCE_BLOCKING_PROFILES',
+    'TRACKER_HOSTS',
+    'BLOCKED_RESOURCE_SIZE_ESTIMATES'
 ]
\ No newline at end of file
@@ -178,6 +178,32 @@ COMMON_CONTENT_SELECTORS = [
     ".lesson-content", ".course-content", ".study-material", ".exam-content"
 ]
 
+# Chromium launch profiles for the shared browser pool
+BROWSER_LAUNCH_PROFILES = {
+    "default": [
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--no-first-run",
+    ],
+    "low_memory": [
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+        "--renderer-process-limit=2",
+        "--js-flags=--max-old-space-size=256",
+    ]
+}
+
 #################################################################################
 # Used in course_gen.py
 
@@ -295,4 +321,43 @@ SPECIAL_TOKENS = {
                     'advanced': '<|advanced|>',
                     'expert': '<|expert|>',
                     'title': '<|title|>'
-}
\ No newline at end of file
+}
+# BeautifulSoup tree builders in order of preference; the first installed one is used
+HTML_PARSERS = ["lxml", "html.parser"]
+
+# Resource types aborted by each browser request-blocking profile
+# (page documents and scripts are never blocked by type)
+RESOURCE_BLOCKING_PROFILES = {
+    "none": [],
+    "lean": ["image", "media", "font"],
+    "text_only": [
+        "image", "media", "font", "stylesheet", "texttrack",
+        "manifest", "eventsource", "websocket"
+    ]
+}
+
+# Ad, analytics and tracking hosts (matched as domain suffixes), blocked by
+# every profile except "none"
+TRACKER_HOSTS = [
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+    "adservice.google.com", "amazon-adsystem.com", "adnxs.com", "criteo.com",
+    "criteo.net", "taboola.com", "outbrain.com", "scorecardresearch.com",
+    "quantserve.com", "hotjar.com", "hotjar.io", "facebook.net", "connect.facebook.net",
+    "clarity.ms", "segment.com", "segment.io", "mixpanel.com", "newrelic.com",
+    "nr-data.net", "optimizely.com", "chartbeat.com", "chartbeat.net",
+    "moatads.com", "pubmatic.com", "rubiconproject.com", "openx.net",
+    "adsrvr.org", "casalemedia.com", "sharethrough.com", "bidswitch.net",
+    "ezoic.net", "mediavine.com", "adthrive.com", "disqus.com", "addthis.com",
+    "sharethis.com", "onesignal.com", "intercom.io", "hubspot.com", "hs-analytics.net"
+]
+
+# Rough median transfer sizes used to estimate bytes saved by blocking
+BLOCKED_RESOURCE_SIZE_ESTIMATES = {
+    "image": 30_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 15_000,
+    "script": 25_000,
+    "default": 5_000
+}
@@ -1,5 +1,5 @@
 from course_gen.core.globals import (
-    Dict, List, Union, dataclass, field
+    Dict, List, Optional, Union, dataclass, field
 )
 
 @dataclass
@@ -11,6 +11,8 @@ class ScrapedContent:
     url: str = ""
     topic: str = ""
     level: str = "intermediate"
+    # Fingerprint of the fetched page, for recrawl change detection (not serialized)
+    content_hash: str = ""
 
     def to_dict(self) -> Dict:
         """Convert to dictionary (for JSON, MongoDB, etc.)"""
@@ -48,3 +50,23 @@ class SourceConfig:
     content_selectors: List[str] = field(default_factory=list)
     code_selectors: List[str] = field(default_factory=list)
     avoid_urls: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PageClassification:
+    """Login, paywall and content-type signals for one page."""
+    url: str
+    status: Optional[int] = None
+    final_url: str = ""
+    content_type: str = ""
+    is_html: bool = True
+    login_required: bool = False
+    paywall: bool = False
+    login_keyword_count: int = 0
+    paywall_keyword_count: int = 0
+    text_length: int = 0
+
+    @property
+    def accessible(self) -> bool:
+        """Whether the page can be scraped without logging in or paying"""
+        return not (self.login_required or self.paywall)
@@ -8,33 +8,44 @@ import os
 import time
 import re
 import random
+import math
 import logging
 import urllib
-from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Optional, Tuple, Any, Union, Set, TYPE_CHECKING
-from collections import defaultdict
+from urllib.parse import urljoin, urlparse, urlencode, parse_qsl
+from typing import List, Dict, Optional, Tuple, Any, Union, Set, Iterable, Callable, AsyncIterator, TYPE_CHECKING
+from collections import defaultdict, deque
 from datetime import datetime
 from dotenv import load_dotenv
 from duckduckgo_search import DDGS
 import asyncio
 import nest_asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager, asynccontextmanager, aclosing
 from copy import copy
 import sys
 from rest_framework import serializers
 from threading import Lock
+import threading
+import queue
+import weakref
+import sqlite3
+import atexit
 import uuid
+import hashlib
+from email.utils import parsedate_to_datetime
 from datetime import datetime
 # APIs
 from asgiref.sync import async_to_sync
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.http import HttpResponse, StreamingHttpResponse
 
 # Third-Party Libraries (Direct imports - medium weight)
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4.element import PreformattedString
 import markdown
 import pymongo
 from bson.objectid import ObjectId
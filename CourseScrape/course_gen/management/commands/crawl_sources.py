@@ -0,0 +1,71 @@
+from course_gen.core.globals import json, asdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from course_gen.core import SourceConfig
+from course_gen.services.knowledge_scraper import (
+    StandardScraper, URLManager, ContentCleaner, ContentExtractor, StandardDetector
+)
+from course_gen.utils.crawl_jobs import CrawlJobStore
+
+
+class Command(BaseCommand):
+    help = "Crawl the configured sources as a checkpointed job that can be resumed after a crash"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sources", help="JSON file mapping source names to SourceConfig fields")
+        parser.add_argument("--name", default="configured_sources", help="Job name used to find jobs to resume")
+        parser.add_argument("--resume", nargs="?", const="latest", default=None, metavar="JOB_ID",
+                            help="Resume a job (default: the latest unfinished job with --name)")
+        parser.add_argument("--checkpoint-every", type=int, default=20,
+                            help="Finished URLs per checkpoint")
+        parser.add_argument("--jobs-db", default="crawl_jobs.db")
+        parser.add_argument("--knowledge-file", default="knowledge_base.json")
+
+    def handle(self, *args, **options):
+        store = CrawlJobStore(options["jobs_db"])
+
+        if options["resume"]:
+            if options["resume"] == "latest":
+                job = store.latest_unfinished(options["name"])
+            else:
+                job = store.get_job(options["resume"])
+            if job is None:
+                raise CommandError(f"No unfinished crawl job to resume for '{options['name']}'")
+            job_id = job["job_id"]
+            retried = store.retry_failed(job_id)
+            self.stdout.write(f"Resuming job {job_id} {store.progress(job_id)}, retrying {retried} failed URLs")
+            sources = job["config"]
+        else:
+            if not options["sources"]:
+                raise CommandError("--sources is required when starting a new job")
+            try:
+                with open(options["sources"], "r", encoding="utf-8") as f:
+                    sources = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                raise CommandError(f"Could not read sources file: {str(e)}")
+
+        try:
+            configs = {name: SourceConfig(**fields) for name, fields in sources.items()}
+        except TypeError as e:
+            raise CommandError(f"Invalid source configuration: {str(e)}")
+
+        if not options["resume"]:
+            job_id = store.create_job(options["name"], {name: asdict(c) for name, c in configs.items()})
+            self.stdout.write(f"Started job {job_id}")
+
+        content_cleaner = ContentCleaner()
+        scraper = StandardScraper(
+            url_manager=URLManager(),
+            content_cleaner=content_cleaner,
+            extractor=ContentExtractor(content_cleaner),
+            detector=StandardDetector()
+        )
+        scraper.sources = configs
+
+        items = scraper.run_crawl_job(
+            store, job_id, options["checkpoint_every"], options["knowledge_file"]
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Job {job_id} completed: {store.progress(job_id)}, {len(items)} items saved to {options['knowledge_file']}"
+        ))
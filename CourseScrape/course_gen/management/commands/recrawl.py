@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from course_gen.services.knowledge_scraper import (
+    PlaywrightScraper, URLManager, ContentCleaner, ContentExtractor, StandardDetector
+)
+
+
+class Command(BaseCommand):
+    help = "Revisit scraped pages that are due per the recrawl schedule and update changed ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=50, help="Most pages to revisit in this run")
+        parser.add_argument("--knowledge-file", default="knowledge_base.json")
+
+    def handle(self, *args, **options):
+        url_manager = URLManager()
+        content_cleaner = ContentCleaner()
+        scraper = PlaywrightScraper(
+            url_manager=url_manager,
+            content_cleaner=content_cleaner,
+            extractor=ContentExtractor(content_cleaner),
+            detector=StandardDetector()
+        )
+
+        due = len(url_manager.recrawl_scheduler.due(options["limit"]))
+        if not due:
+            self.stdout.write("No pages are due for recrawl")
+            return
+
+        try:
+            updated = scraper.recrawl(options["limit"], options["knowledge_file"])
+        finally:
+            # Recrawl schedules are written in the background; persist them before exiting
+            url_manager.state_store.flush()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Recrawled {due} due pages: {len(updated)} changed, saved to {options['knowledge_file']}"
+        ))
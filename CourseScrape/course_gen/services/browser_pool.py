@@ -0,0 +1,293 @@
+from course_gen.core.globals import (
+    logging, asyncio, random, dataclass, field, asynccontextmanager, Any, List, Optional
+)
+
+from playwright.async_api import async_playwright
+from course_gen.core import USER_AGENTS, BASE_HEADERS, BROWSER_LAUNCH_PROFILES
+from course_gen.utils.http_cache import ResponseCache
+from course_gen.utils.loop_state import LoopLocal
+from .request_blocker import RequestBlocker
+
+logger = logging.getLogger("browser_pool")
+
+# Set on documents fulfilled from the ResponseCache without contacting the site
+CACHE_HIT_HEADER = "x-scraper-cache"
+
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+"""
+
+
+@dataclass
+class BrowserSlot:
+    """A warm browser together with its current context and reusable page"""
+    browser: Any = None
+    context: Any = None
+    page: Any = None
+    context_pages: int = 0
+    browser_pages: int = 0
+    blocking_profile: str = "none"
+
+
+@dataclass
+class LoopBrowsers:
+    """Playwright, browsers and users of the pool on one event loop"""
+    playwright_manager: Any = None
+    playwright: Any = None
+    slots: Optional[asyncio.Queue] = None
+    all_slots: List[BrowserSlot] = field(default_factory=list)
+    users: int = 0
+    start_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class BrowserPool:
+    """
+    Long-lived pool of warm Chromium browsers shared by PlaywrightScraper.
+
+    The pool is reference counted: every ``async with pool:`` block keeps it
+    alive and the browsers are only shut down when the outermost block exits,
+    so a whole scrape job reuses the same processes. Contexts are recycled
+    after ``max_pages_per_context`` pages and browsers after
+    ``max_pages_per_browser`` pages to bound renderer memory growth.
+    Every request goes through one route handler. The RequestBlocker aborts
+    heavy resources and trackers for the page's domain profile, and with a
+    ResponseCache, page documents are served through the cache. Fresh hits
+    carry the CACHE_HIT_HEADER so callers can tell them from network responses.
+
+    Playwright objects only work on the loop that created them, and the pool
+    is shared by requests that each run on their own loop, so every loop
+    gets its own Playwright, ``size`` slots and reference count.
+    """
+
+    def __init__(self, size: int = 2, profile: str = "low_memory",
+                 max_pages_per_context: int = 20, max_pages_per_browser: int = 100,
+                 headless: bool = True, response_cache: Optional[ResponseCache] = None,
+                 request_blocker: Optional[RequestBlocker] = None):
+        self.size = size
+        self.response_cache = response_cache
+        self.request_blocker = request_blocker or RequestBlocker()
+        self.launch_args = BROWSER_LAUNCH_PROFILES.get(profile, BROWSER_LAUNCH_PROFILES["default"])
+        self.max_pages_per_context = max_pages_per_context
+        self.max_pages_per_browser = max_pages_per_browser
+        self.headless = headless
+
+        self._loops = LoopLocal(LoopBrowsers)
+
+    async def __aenter__(self) -> "BrowserPool":
+        self._loops.get().users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        state = self._loops.get()
+        state.users = max(0, state.users - 1)
+        if state.users == 0:
+            await self.close()
+
+    async def _ensure_started(self) -> LoopBrowsers:
+        """Start Playwright and fill the slot queue on first use on this loop"""
+        state = self._loops.get()
+        async with state.start_lock:
+            if state.slots is not None:
+                return state
+
+            state.playwright_manager = async_playwright()
+            state.playwright = await state.playwright_manager.start()
+            state.slots = asyncio.Queue()
+            state.all_slots = [BrowserSlot() for _ in range(self.size)]
+            for slot in state.all_slots:
+                state.slots.put_nowait(slot)
+            logger.info(f"Browser pool started with {self.size} slots")
+            return state
+
+    async def _launch_browser(self, state: LoopBrowsers):
+        return await state.playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args
+        )
+
+    async def _new_context(self, browser, slot: BrowserSlot):
+        headers = {**BASE_HEADERS, "User-Agent": random.choice(USER_AGENTS)}
+        context = await browser.new_context(
+            viewport={"width": 1280, "height": 800},
+            user_agent=headers["User-Agent"],
+            extra_http_headers={
+                k: v for k, v in headers.items()
+                if k.lower() not in ['user-agent']
+            }
+        )
+        try:
+            await context.add_init_script(STEALTH_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Could not add init script: {str(e)}")
+
+        async def handle_route(route) -> None:
+            await self._handle_route(route, slot)
+
+        await context.route("**/*", handle_route)
+        return context
+
+    async def _handle_route(self, route, slot: BrowserSlot) -> None:
+        """Single interception point: block, serve from cache, or pass through"""
+        request = route.request
+        try:
+            main_document = (request.resource_type == "document" and
+                             request.frame.parent_frame is None)
+        except Exception:
+            main_document = False
+
+        try:
+            if self.request_blocker.should_block(request.resource_type, request.url,
+                                                 slot.blocking_profile, main_document):
+                await route.abort("blockedbyclient")
+                return
+
+            if (self.response_cache is not None and request.resource_type == "document"
+                    and request.method == "GET"):
+                await self._route_through_cache(route)
+                return
+
+            await route.continue_()
+        except Exception as e:
+            logger.debug(f"Route handling failed for {request.url}: {str(e)}")
+
+    async def _route_through_cache(self, route) -> None:
+        """Serve a page document from the response cache, revalidating stale entries"""
+        request = route.request
+        try:
+            cached = await asyncio.to_thread(self.response_cache.lookup, request.url)
+            if cached is not None and cached.is_fresh():
+                await route.fulfill(
+                    status=cached.status, headers={**cached.headers, CACHE_HIT_HEADER: "hit"}, body=cached.body
+                )
+                return
+
+            headers = dict(request.headers)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+            response = await route.fetch(headers=headers)
+            if response.status == 304 and cached is not None:
+                cached = await asyncio.to_thread(self.response_cache.refresh, cached, response.headers)
+                await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+                return
+
+            body = await response.text()
+            if response.status == 200:
+                await asyncio.to_thread(
+                    self.response_cache.store, request.url, response.status, response.headers, body
+                )
+            await route.fulfill(response=response, body=body)
+        except Exception as e:
+            logger.warning(f"Cache routing failed for {request.url}: {str(e)}")
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+
+    async def _checkout(self, state: LoopBrowsers, slot: BrowserSlot):
+        """Make sure the slot has a live browser, context and page"""
+        if slot.browser is None or not slot.browser.is_connected():
+            await self._close_slot(slot)
+            slot.browser = await self._launch_browser(state)
+
+        if slot.context is None:
+            slot.context = await self._new_context(slot.browser, slot)
+            slot.context_pages = 0
+
+        if slot.page is None or slot.page.is_closed():
+            slot.page = await slot.context.new_page()
+
+        return slot.page
+
+    async def _release(self, state: LoopBrowsers, slot: BrowserSlot, healthy: bool) -> None:
+        """Return a slot to the pool, recycling whatever has served enough pages"""
+        slot.context_pages += 1
+        slot.browser_pages += 1
+
+        try:
+            if not healthy:
+                await self._safe_close_page(slot.page)
+                slot.page = None
+
+            if slot.browser_pages >= self.max_pages_per_browser:
+                logger.info(f"Recycling browser after {slot.browser_pages} pages")
+                await self._close_slot(slot)
+            elif slot.context_pages >= self.max_pages_per_context:
+                await self._safe_close_context(slot.context)
+                slot.context = None
+                slot.page = None
+            elif slot.page is not None:
+                # Drop the previous document so its DOM can be reclaimed
+                await slot.page.goto("about:blank")
+        except Exception as e:
+            logger.warning(f"Error recycling browser slot: {str(e)}")
+            await self._close_slot(slot)
+        finally:
+            state.slots.put_nowait(slot)
+
+    @asynccontextmanager
+    async def page(self, url: Optional[str] = None):
+        """Borrow a ready-to-use page, blocking requests per the profile for url's domain"""
+        state = await self._ensure_started()
+        slot = await state.slots.get()
+        slot.blocking_profile = self.request_blocker.profile_for(url)
+        healthy = True
+        try:
+            page = await self._checkout(state, slot)
+            yield page
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            await self._release(state, slot, healthy)
+
+    async def close(self) -> None:
+        """Close this loop's browsers and stop its Playwright"""
+        state = self._loops.peek()
+        self._loops.discard()
+        if state is None:
+            return
+
+        self.request_blocker.log_summary()
+        for slot in state.all_slots:
+            await self._close_slot(slot)
+
+        if state.playwright_manager is not None:
+            try:
+                await state.playwright_manager.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {str(e)}")
+
+    async def _close_slot(self, slot: BrowserSlot) -> None:
+        await self._safe_close_page(slot.page)
+        await self._safe_close_context(slot.context)
+        await self._safe_close_browser(slot.browser)
+        slot.page = None
+        slot.context = None
+        slot.browser = None
+        slot.context_pages = 0
+        slot.browser_pages = 0
+
+    async def _safe_close_page(self, page):
+        """Safely close a page with error handling"""
+        if page is not None:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning(f"Error closing page: {str(e)}")
+
+    async def _safe_close_context(self, context):
+        """Safely close a context with error handling"""
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing context: {str(e)}")
+
+    async def _safe_close_browser(self, browser):
+        """Safely close a browser with error handling"""
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {str(e)}")
@@ -1,10 +1,11 @@
 import os
 import json
 import aiohttp
-from bs4 import BeautifulSoup
 from datetime import datetime
 from googlesearch import search
 
+from course_gen.utils.html_parser import parse_html
+
 class ContentScraper:
     TRUSTED_SOURCES = [
         "wikipedia.org", "khanacademy.org", "edx.org",
@@ -56,7 +57,7 @@ class ContentScraper:
         return list(search(query, num_results=num_results))
     
     def _clean_page(self, html, url):
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parse_html(html)
         for element in soup(['script', 'style', 'nav', 'footer']):
             element.decompose()
         
@@ -6,7 +6,7 @@
 '''
 from course_gen.core.globals import (
     lazy, logger, re, Dict, List, defaultdict, Optional, uuid, datetime,
-    Lock, traceback, async_to_sync
+    Lock, traceback, async_to_sync, aclosing
 )
 
 from .content_enhancer import AIContentEnhancer
@@ -48,6 +48,16 @@ class CourseGenerator:
             self._current_module_num += 1
             return current_num
 
+    async def _scrape_topic(self, topic: str, level: str, enough: int, max_results: int = 5) -> List[Dict]:
+        """Stream search results for a topic, cancelling the remaining scrapes once enough arrived"""
+        results = []
+        async with aclosing(self.scraper.search_and_scrape_iter(topic, level, max_results)) as stream:
+            async for content_dict in stream:
+                results.append(content_dict)
+                if len(results) >= enough:
+                    break
+        return results
+
     def generate_course(self, topic: str, level: str = "any level", 
                     modules_count: int = 5,
                     instructor_notes: Optional[str] = None,
@@ -81,12 +91,14 @@ class CourseGenerator:
             try:
                 # Attempt to scrape content for the topic - only if scraper is available
                 if hasattr(self, 'scraper') and self.scraper:
-                    # Try two search queries for better results
-                    scraped_results = async_to_sync(self.scraper.search_and_scrape_async)(topic, level, 5)
+                    # Try two search queries for better results; stop as soon as 3 are in
+                    scraped_results = async_to_sync(self._scrape_topic)(topic, level, 3)
                     
                     # If first search didn't yield enough results, try another query
                     if len(scraped_results) < 3:
-                        additional_results = async_to_sync(self.scraper.search_and_scrape_async)(topic, level, 5)
+                        additional_results = async_to_sync(self._scrape_topic)(
+                            topic, level, 3 - len(scraped_results)
+                        )
                         scraped_results.extend(additional_results)
                     
                     if scraped_results:
@@ -1,5 +1,5 @@
 from course_gen.core.globals import (
-    logging, pymongo, Dict, datetime, Optional, ObjectId, List, os, load_dotenv
+    logging, pymongo, Dict, datetime, Optional, ObjectId, List, os, load_dotenv, Lock
 )
 
 load_dotenv()
@@ -8,6 +8,8 @@ class DatabaseManager:
     """MongoDB database manager for storing full course documents"""
     _instance = None
     _initialized = False
+    _knowledge_indexed = False
+    _knowledge_index_lock = Lock()
 
     # Singleton pattern for multiple DatabaseManager class initializations
     def __new__(cls, *args, **kwargs):
@@ -28,6 +30,10 @@ class DatabaseManager:
             self.courses = self.db[collection_name]
             self.courses.create_index("title")
             
+            # Scraped knowledge entries, one document per page URL; the unique
+            # index is built on first write, after deduplicating older data
+            self.knowledge = self.db[os.getenv("MONGODB_KNOWLEDGE_COLLECTION_NAME", "knowledge")]
+            
             if not self.__class__._initialized:
                 logging.info("Connected to MongoDB successfully")
                 self.__class__._initialized = True
@@ -80,6 +86,51 @@ class DatabaseManager:
         logging.info(f"Inserted course with ID: {result.inserted_id}")
         return str(result.inserted_id)
 
+    def _ensure_knowledge_index(self) -> None:
+        """Remove duplicate knowledge entries per URL (keeping the newest), then index URLs uniquely"""
+        if self.__class__._knowledge_indexed:
+            return
+
+        with self._knowledge_index_lock:
+            if self.__class__._knowledge_indexed:
+                return
+            try:
+                duplicates = self.knowledge.aggregate([
+                    {"$match": {"url": {"$type": "string"}}},
+                    {"$sort": {"updated_at": -1, "_id": -1}},
+                    {"$group": {"_id": "$url", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+                    {"$match": {"count": {"$gt": 1}}}
+                ], allowDiskUse=True)
+                removed = 0
+                for group in duplicates:
+                    removed += self.knowledge.delete_many({"_id": {"$in": group["ids"][1:]}}).deleted_count
+                if removed:
+                    logging.info(f"Removed {removed} duplicate knowledge entries before indexing URLs")
+
+                self.knowledge.create_index(
+                    "url", unique=True, partialFilterExpression={"url": {"$type": "string"}}
+                )
+                self.__class__._knowledge_indexed = True
+            except Exception as e:
+                # Upserts by URL still work without the index; try again on the next write
+                logging.error(f"Could not index knowledge URLs: {str(e)}")
+
+    def store_knowledge(self, items: List[Dict]) -> int:
+        """Upsert scraped knowledge entries by URL; returns how many were written"""
+        self._ensure_knowledge_index()
+        now = datetime.utcnow()
+        operations = [
+            pymongo.UpdateOne({"url": item["url"]}, {"$set": {**item, "updated_at": now}}, upsert=True)
+            for item in items if item.get("url")
+        ]
+        if not operations:
+            return 0
+
+        result = self.knowledge.bulk_write(operations, ordered=False)
+        written = result.upserted_count + result.modified_count
+        logging.info(f"Stored {written} knowledge entries")
+        return written
+
     def get_course_by_id(self, course_id: str) -> Optional[Dict]:
         """Retrieve a full course document by its MongoDB ID"""
         course = self.courses.find_one({"_id": ObjectId(course_id)})
@@ -0,0 +1,101 @@
+from course_gen.core.globals import (
+    logging, asyncio, os, sys, time, Any, Callable, Optional, Tuple
+)
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from course_gen.utils.loop_state import SharedSemaphore
+
+logger = logging.getLogger("extraction_pool")
+
+
+def _ping() -> int:
+    """Warm-up job; the short sleep keeps one worker from answering every ping"""
+    time.sleep(0.05)
+    return os.getpid()
+
+
+class ExtractionPool:
+    """
+    Process pool for the CPU-bound parse/extract stage of scraping.
+
+    Jobs are plain module-level functions that receive raw HTML and return
+    small picklable results, so concurrent scrapes use every core instead of
+    stalling the event loop. ``initializer`` builds per-process state once per
+    worker, and ``start`` spawns and warms all workers ahead of the first
+    page. At most ``max_pending`` jobs are in flight across every event loop
+    using the pool; further callers wait (back-pressure) rather than
+    queueing unbounded HTML in the executor.
+    With ``max_workers=0``, or if the pool breaks, jobs run in a thread of
+    this process instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 initializer: Optional[Callable] = None, initargs: Tuple = (),
+                 start_method: Optional[str] = None):
+        self.max_workers = max_workers if max_workers is not None else max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.max_pending = max_pending or max(1, self.max_workers * 2)
+        self.initializer = initializer
+        self.initargs = initargs
+
+        # Workers must not fork a multi-threaded parent: forkserver where
+        # available, spawn elsewhere
+        if start_method is None:
+            start_method = "spawn" if sys.platform == "win32" else "forkserver"
+        self.start_method = start_method
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inline_ready = False
+        self._pending = SharedSemaphore(self.max_pending)
+
+    def start(self) -> None:
+        """Create the executor and warm every worker in the background (idempotent)"""
+        if self._executor is not None or self.max_workers == 0:
+            return
+
+        try:
+            context = multiprocessing.get_context(self.start_method)
+            if self.start_method == "forkserver" and self.initializer is not None:
+                # Import the job module once in the fork server instead of in every worker
+                context.set_forkserver_preload([self.initializer.__module__])
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=self.initializer,
+                initargs=self.initargs
+            )
+            for _ in range(self.max_workers):
+                self._executor.submit(_ping)
+            logger.info(f"Extraction pool starting {self.max_workers} workers ({self.start_method})")
+        except Exception as e:
+            logger.warning(f"Could not start extraction pool, extracting in-process: {str(e)}")
+            self._executor = None
+            self.max_workers = 0
+
+    def _run_inline(self, fn: Callable, *args) -> Any:
+        if not self._inline_ready:
+            if self.initializer is not None:
+                self.initializer(*self.initargs)
+            self._inline_ready = True
+        return fn(*args)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) in a worker process, waiting for a free slot first"""
+        self.start()
+        async with self._pending:
+            if self._executor is not None:
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+                except BrokenProcessPool as e:
+                    logger.error(f"Extraction pool broke, extracting in-process: {str(e)}")
+                    self.close()
+                    self.max_workers = 0
+            return await asyncio.to_thread(self._run_inline, fn, *args)
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,156 @@
+from course_gen.core.globals import (
+    logging, asyncio, time, random, aiohttp, dataclass, field, Dict, Optional
+)
+
+from course_gen.core import USER_AGENTS, BASE_HEADERS
+from course_gen.utils.http_cache import ResponseCache, CachedResponse
+from course_gen.utils.loop_state import LoopLocal
+from course_gen.utils.metrics import STAGE_SECONDS, PAGE_BYTES, FETCHES_TOTAL
+from course_gen.utils.url_utils import canonical_domain
+from .rate_controller import AdaptiveRateController
+
+logger = logging.getLogger("http_fetcher")
+
+
+@dataclass
+class LoopSession:
+    """The fetcher's session and users on one event loop"""
+    session: Optional[aiohttp.ClientSession] = None
+    users: int = 0
+
+
+@dataclass
+class FetchResult:
+    """Raw HTTP response for a fetched page"""
+    url: str
+    status: int
+    text: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+    @classmethod
+    def from_cached(cls, cached: CachedResponse) -> "FetchResult":
+        return cls(
+            url=cached.url,
+            status=cached.status,
+            text=cached.body,
+            headers=cached.headers,
+            from_cache=True
+        )
+
+
+class AsyncHTTPFetcher:
+    """
+    Connection-pooled aiohttp client used for plain HTTP page fetches.
+
+    Like BrowserPool it is reference counted with ``async with fetcher:`` so
+    one keep-alive session is shared for the duration of a scrape job.
+    Sessions are bound to the loop that created them, so each event loop
+    using the fetcher gets its own session and reference count.
+    With a ResponseCache, fresh pages are served from disk and stale ones are
+    revalidated with a conditional request. Network responses are reported
+    to the rate controller, if one is set, and to the scrape metrics.
+    """
+
+    def __init__(self, limit: int = 20, limit_per_host: int = 4, timeout: int = 15,
+                 cache: Optional[ResponseCache] = None,
+                 rate_controller: Optional[AdaptiveRateController] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_controller = rate_controller
+
+        self._loops = LoopLocal(LoopSession)
+
+    async def __aenter__(self) -> "AsyncHTTPFetcher":
+        self._loops.get().users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        state = self._loops.get()
+        state.users = max(0, state.users - 1)
+        if state.users == 0:
+            await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        state = self._loops.get()
+        if state.session is None or state.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300
+            )
+            state.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return state.session
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  revalidate: bool = False) -> Optional[FetchResult]:
+        """
+        GET a URL, returning None on network errors or non-HTML responses.
+        With revalidate, a fresh cache entry is still checked with the origin
+        (conditionally, so an unchanged page costs a 304).
+        """
+        domain = canonical_domain(url)
+        cached = await asyncio.to_thread(self.cache.lookup, url) if self.cache else None
+        if cached is not None and cached.is_fresh() and not revalidate:
+            FETCHES_TOTAL.inc(domain=domain, tier="static", status="cache")
+            return FetchResult.from_cached(cached)
+
+        request_headers = {**BASE_HEADERS, "User-Agent": random.choice(USER_AGENTS)}
+        request_headers.update(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+
+        started = time.monotonic()
+        try:
+            async with self._get_session().get(url, headers=request_headers, allow_redirects=True) as response:
+                if self.rate_controller is not None:
+                    self.rate_controller.record_response(
+                        url, response.status, time.monotonic() - started, dict(response.headers)
+                    )
+                
+                FETCHES_TOTAL.inc(domain=domain, tier="static", status=response.status)
+                
+                if response.status == 304 and cached is not None:
+                    STAGE_SECONDS.observe(time.monotonic() - started, stage="fetch", domain=domain)
+                    cached = await asyncio.to_thread(self.cache.refresh, cached, dict(response.headers))
+                    return FetchResult.from_cached(cached)
+
+                content_type = response.headers.get("Content-Type", "")
+                if response.status == 200 and "html" not in content_type.lower():
+                    logger.info(f"Skipping non-HTML response from {url} ({content_type})")
+                    return None
+
+                body = await response.read()
+                result = FetchResult(
+                    url=str(response.url),
+                    status=response.status,
+                    text=body.decode(response.get_encoding(), errors="replace"),
+                    headers=dict(response.headers)
+                )
+                STAGE_SECONDS.observe(time.monotonic() - started, stage="fetch", domain=domain)
+                PAGE_BYTES.observe(len(body), domain=domain, tier="static")
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {url}: {str(e)}")
+            FETCHES_TOTAL.inc(domain=domain, tier="static", status="error")
+            if self.rate_controller is not None:
+                self.rate_controller.record_response(url, None)
+            return None
+
+        if self.cache is not None and result.status == 200:
+            await asyncio.to_thread(self.cache.store, url, result.status, result.headers, result.text)
+        return result
+
+    async def close(self) -> None:
+        """Close this loop's pooled session"""
+        state = self._loops.peek()
+        self._loops.discard()
+        if state is not None and state.session is not None and not state.session.closed:
+            try:
+                await state.session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {str(e)}")
@@ -1,7 +1,8 @@
 from course_gen.core.globals import (
-    List, Dict, logger, Optional, asyncio, json, os, traceback
+    List, Dict, logger, Optional, asyncio, traceback
 )
 
+from course_gen.utils.file_manager import FileManager
 from .course_generator import CourseGenerator
 from .database_manager import DatabaseManager
 from .knowledge_scraper import StandardScraper, PlaywrightScraper, URLManager, ContentCleaner, ContentExtractor, BaseDetector, BaseScraper
@@ -139,19 +140,9 @@ class CourseBuilderInterface:
             self.generator.load_knowledge()
             print(f"Added {len(self._search_results)} items to in-memory knowledge base.")
                     
-            # Save to JSON file
+            # Save to JSON file, merging near-duplicates of existing entries
             file_path = "knowledge_base.json"
-            existing_knowledge = []
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    try:
-                        existing_knowledge = json.load(f)
-                    except json.JSONDecodeError:
-                        existing_knowledge = []
-
-            all_knowledge = existing_knowledge + self._search_results
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(all_knowledge, f, ensure_ascii=False, indent=4)
+            FileManager.save_to_knowledge_base(self._search_results, file_path, on_duplicate="merge")
             print(f"Saved to '{file_path}'.")
 
             # Optional DB save
@@ -226,19 +217,9 @@ class CourseBuilderInterface:
             self.generator.load_knowledge()
             print(f"Added {len(self._search_results)} items to in-memory knowledge base.")
                     
-            # Save to JSON file
+            # Save to JSON file, merging near-duplicates of existing entries
             file_path = "knowledge_base.json"
-            existing_knowledge = []
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    try:
-                        existing_knowledge = json.load(f)
-                    except json.JSONDecodeError:
-                        existing_knowledge = []
-
-            all_knowledge = existing_knowledge + self._search_results
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(all_knowledge, f, ensure_ascii=False, indent=4)
+            FileManager.save_to_knowledge_base(self._search_results, file_path, on_duplicate="merge")
             print(f"Saved to '{file_path}'.")
             
             print("\nKnowledge base updated successfully!")
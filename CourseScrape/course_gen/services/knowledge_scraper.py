@@ -1,17 +1,37 @@
 from course_gen.core.globals import (
     requests, logger, urljoin, urlparse, BeautifulSoup, time, json, logging,
-    ABC, re, random, copy, random, sys,
-    Dict, List, Optional, Set, Tuple, os, DDGS, asyncio
+    ABC, re, random, random, sys, Tag, NavigableString, PreformattedString,
+    Dict, List, Optional, Set, Tuple, AsyncIterator, os, asyncio, deque, aclosing, dataclass, aiohttp
 )
 
-from playwright.async_api import async_playwright
-from course_gen.core import ScrapedContent
+from course_gen.core import ScrapedContent, SourceConfig, PageClassification
 from course_gen.core import (
     USER_AGENTS, BASE_HEADERS, CODE_SELECTORS, ADVANCED_INDICATORS, 
     BASIC_INDICATORS, ELEMENTS_TO_REMOVE, NON_CONTENT_CASES, PAYWALL_PATTERNS, 
     CONSENT_SELECTORS, MODAL_SELECTORS, COMMON_CONTENT_SELECTORS
 )
 from course_gen.utils.file_manager import FileManager
+from course_gen.utils.http_cache import ResponseCache
+from course_gen.utils.url_store import URLStateStore, STATUS_SCRAPED, STATUS_BAD
+from course_gen.utils.circuit_breaker import DomainCircuitBreaker, CircuitOpenError
+from course_gen.utils.recrawl_scheduler import RecrawlScheduler, page_fingerprint
+from course_gen.utils.crawl_jobs import (
+    CrawlJobStore, JOB_COMPLETED, URL_DONE, URL_FAILED, KIND_TOPIC, KIND_LINK
+)
+from course_gen.utils.html_parser import parse_html, select_each
+from course_gen.utils.metrics import (
+    REGISTRY, STAGE_SECONDS, PAGE_BYTES, FETCHES_TOTAL, EXTRACTIONS_TOTAL,
+    EXTRACTED_WORDS, SKIPS_TOTAL, ERRORS_TOTAL
+)
+from course_gen.utils.domain_rules import DomainRule, DomainRuleIndex
+from course_gen.utils.url_utils import BloomFilter, canonicalize_url, canonical_domain, clean_url
+from .browser_pool import BrowserPool, CACHE_HIT_HEADER
+from .search_provider import SearchProvider, DDGSSearchProvider, CachedSearchProvider
+from .scheduler import PolitenessScheduler
+from .rate_controller import AdaptiveRateController
+from .http_fetcher import AsyncHTTPFetcher
+from .extraction_pool import ExtractionPool
+from .page_readiness import PageReadiness
 
 # Configure logging
 logger = logging.getLogger("knowledge_scraper")
@@ -47,6 +67,47 @@ class ContentExtractionError(ScraperException):
     """Raised when content cannot be extracted"""
     pass
 
+class ServerError(ScraperException):
+    """Raised for 5xx responses"""
+    pass
+
+class BlockedError(ScraperException):
+    """Raised when the site refuses or rate-limits the scraper (403/429)"""
+    pass
+
+def error_for_status(url: str, status: int, check_paywall: bool = True) -> Optional[ScraperException]:
+    """Exception for an unusable HTTP status, or None for 200 (and for 401/402 without check_paywall)"""
+    if status == 200:
+        return None
+    if status in (403, 429):
+        return BlockedError(f"HTTP {status} from {url}")
+    if status >= 500:
+        return ServerError(f"HTTP {status} from {url}")
+    if status == 401:
+        return LoginRequiredError(f"Login required at {url}") if check_paywall else None
+    if status == 402:
+        return PaywallError(f"Paywall detected at {url}") if check_paywall else None
+    if 400 <= status < 500:
+        return ContentExtractionError(f"HTTP {status} from {url}")
+    return NetworkError(f"Unexpected HTTP {status} from {url}")
+
+def failure_category(error: Exception) -> str:
+    """Circuit breaker category for a scraping failure"""
+    if isinstance(error, (PaywallError, LoginRequiredError)):
+        return "paywall"
+    if isinstance(error, BlockedError):
+        return "blocked"
+    if isinstance(error, ServerError):
+        return "server"
+    if isinstance(error, ContentExtractionError):
+        return "content"
+    if isinstance(error, (NetworkError, TimeoutError, ConnectionError, aiohttp.ClientError)):
+        return "network"
+    # Playwright's navigation TimeoutError is not a builtin TimeoutError
+    if type(error).__name__ == "TimeoutError":
+        return "network"
+    return "error"
+
 # Global headers function
 def get_random_headers():
         """Return headers with a random user agent"""
@@ -59,11 +120,26 @@ def get_random_headers():
 class URLManager:
     """Manages URL processing, storage and retrieval"""
     def __init__(self, scraped_urls_file: str = "scraped_urls.json", 
-                 bad_urls_file: str = "bad_urls.json"):
+                 bad_urls_file: str = "bad_urls.json",
+                 state_store: Optional[URLStateStore] = None):
         self.scraped_urls_file = scraped_urls_file
         self.bad_urls_file = bad_urls_file
-        self.scraped_urls = self._load_urls_file(self.scraped_urls_file)
-        self.bad_urls = self._load_urls_file(self.bad_urls_file)
+        
+        # Scraped/bad state lives in an indexed store that is opened lazily;
+        # the JSON files are only read once to migrate existing entries
+        self.state_store = state_store or URLStateStore(
+            legacy_files={STATUS_SCRAPED: scraped_urls_file, STATUS_BAD: bad_urls_file}
+        )
+        
+        # Bloom filter over every canonical URL/domain in the store; a miss
+        # means "never seen" without touching the database
+        self.seen_filter: Optional[BloomFilter] = None
+        
+        # Failing domains are paused and re-probed instead of banned
+        self.circuit_breaker = DomainCircuitBreaker(self.state_store)
+        
+        # Scraped pages are revisited on a schedule adapted to how often they change
+        self.recrawl_scheduler = RecrawlScheduler(self.state_store)
         
         # Cache URL results to avoid redundant processing
         self.url_results_cache = {}
@@ -98,15 +174,19 @@ class URLManager:
         self.skip_patterns = [
             "/watch", "/signin", "/login", "/video"
         ]
+        
+        # Trust/avoid/delay/priority compiled into one suffix lookup
+        self.rebuild_domain_rules()
     
-    def _load_urls_file(self, file_path: str) -> Set[str]:
-        """Load URLs from JSON file using the generic loader."""
-        try:
-            data = FileManager.load_json(file_path)
-            return set(data) if isinstance(data, list) else set()
-        except Exception:
-            logger.warning(f"Falling back to empty set for {file_path}")
-            return set()
+    def rebuild_domain_rules(self) -> None:
+        """Recompile the domain rule index after changing the domain settings"""
+        self.domain_rules = DomainRuleIndex.from_config(
+            self.trusted_domains, self.avoid_domains, self.default_delay
+        )
+    
+    def domain_rule(self, url: str) -> DomainRule:
+        """Trust, avoid flag, delay range and priority for a URL's domain"""
+        return self.domain_rules.lookup(url)
     
     def extract_domain(self, url: str) -> str:
         """Extract domain from URL safely"""
@@ -119,29 +199,39 @@ class URLManager:
     
     def is_trusted_domain(self, url: str) -> bool:
         """Check if URL belongs to a trusted domain"""
-        domain = self.extract_domain(url)
-        return any(trusted in domain for trusted in self.trusted_domains.keys())
+        return self.domain_rule(url).trusted
     
     def should_avoid_domain(self, url: str) -> bool:
         """Check if URL belongs to a domain that should be avoided"""
-        domain = self.extract_domain(url)
-        return any(avoid in domain for avoid in self.avoid_domains)\
-            
+        return self.domain_rule(url).avoid
+    
     def should_avoid_pattern(self, url: str) -> bool:
         if any(pattern in url for pattern in self.skip_patterns):
             return False
     
     def get_delay_for_domain(self, url: str) -> Tuple[float, float]:
         """Get appropriate delay range for a domain"""
-        domain = self.extract_domain(url)
-        for trusted, delay in self.trusted_domains.items():
-            if trusted in domain:
-                return delay
-        return self.default_delay
+        return self.domain_rule(url).delay
+    
+    def _get_seen_filter(self) -> BloomFilter:
+        """Build the seen filter from the state store on first use"""
+        if self.seen_filter is None:
+            seen_filter = BloomFilter()
+            for key in self.state_store.iter_keys():
+                seen_filter.add(key)
+            self.seen_filter = seen_filter
+        return self.seen_filter
     
     def should_skip(self, url: str) -> Tuple[bool, str]:
         """Check if URL should be skipped and return reason if so"""
-        domain = self.extract_domain(url)
+        should_skip, reason = self._check_skip(url)
+        if should_skip:
+            SKIPS_TOTAL.inc(domain=canonical_domain(url), reason=reason)
+        return should_skip, reason
+    
+    def _check_skip(self, url: str) -> Tuple[bool, str]:
+        key = canonicalize_url(url)
+        domain = canonical_domain(url)
         
         if url in self.trusted_domains.keys():
             return False, ""
@@ -150,91 +240,118 @@ class URLManager:
         if self.should_avoid_domain(url):
             return True, "Avoided domain"
         
-        # Skip if URL or its domain is already in bad_urls
-        if url in self.bad_urls or domain in self.bad_urls:
+        # Skip while the domain's circuit is open (or another request is probing it);
+        # the probe itself is only claimed by the scheduler right before fetching
+        if self.circuit_breaker.is_open(domain):
+            return True, "Domain circuit open"
+        
+        # Neither the page nor its domain has ever been recorded
+        seen_filter = self._get_seen_filter()
+        if key not in seen_filter and domain not in seen_filter:
+            return False, ""
+        
+        # Skip if URL or its domain is marked bad (bad entries expire;
+        # domain rows only remain from before the circuit breaker)
+        url_status = self.state_store.get_status(key)
+        if url_status == STATUS_BAD or self.state_store.get_status(domain) == STATUS_BAD:
             return True, "Bad URL"
         
         # Skip if already scraped
-        if url in self.scraped_urls:
+        if url_status == STATUS_SCRAPED:
             return True, "Already scraped"
             
         return False, ""
     
-    def mark_as_scraped(self, url: str) -> None:
-        """Mark URL as successfully scraped"""
+    def mark_as_scraped(self, url: str, content_hash: str = "", topic: str = "") -> None:
+        """Mark URL as successfully scraped and schedule its recrawl"""
         try:
-            self.scraped_urls.add(url)
-            
-            if not isinstance(self.scraped_urls_file, (str, os.PathLike)):
-                logger.error(f"Invalid output_file: {self.scraped_urls_file}")
-                raise ValueError("Scraped urls output path must be a string")
-            
-            FileManager.save_json(self.scraped_urls, self.scraped_urls_file)
+            key = canonicalize_url(url)
+            self.state_store.mark(key, STATUS_SCRAPED)
+            self._get_seen_filter().add(key)
+            self.circuit_breaker.record_success(canonical_domain(url))
+            # Schedule lookup and write happen on the store's writer thread
+            self.state_store.run_in_writer(self.recrawl_scheduler.register, url, content_hash, topic)
         except Exception as e:
             logger.error(f"Scraped urls save failed: {e}")
             raise
     
-    def mark_as_bad(self, url: str) -> None:
-        """Mark URL or domain as bad"""
+    def mark_as_bad(self, url: str, reason: str = "", category: str = "error") -> None:
+        """Mark URL as bad and count a failure of the given category against its domain"""
         try:
-            domain = self.extract_domain(url)
-            self.bad_urls.add(domain)
-            
-            if not isinstance(self.bad_urls_file, (str, os.PathLike)):
-                logger.error(f"Invalid output_file: {self.bad_urls_file}")
-                raise ValueError("Bad urls output path must be a string")
-            
-            FileManager.save_json(self.bad_urls, self.bad_urls_file)
+            key = canonicalize_url(url)
+            ERRORS_TOTAL.inc(domain=canonical_domain(url), category=category)
+            self.state_store.mark(key, STATUS_BAD, reason=reason or category)
+            self._get_seen_filter().add(key)
+            self.circuit_breaker.record_failure(canonical_domain(url), category)
         except Exception as e:
             logger.error(f"Bad urls save failed: {e}")
             raise
+    
+    def flush(self) -> None:
+        """Wait for pending URL state writes to reach disk"""
+        self.state_store.flush()
 
 class ContentCleaner:
     """Handles cleaning and normalization of scraped content"""
     
-    @staticmethod
-    def clean_text(text: str) -> str:
+    # Common ads/cookie notice text
+    REMOVE_PATTERNS = [
+        r'accept all cookies',
+        r'we use cookies',
+        r'cookie policy',
+        r'privacy policy',
+        r'terms of service',
+        r'all rights reserved',
+        r'copyright \d{4}',
+    ]
+    
+    _whitespace_re = re.compile(r'\s+')
+    
+    # Control characters, citations like [1] and boilerplate removed in one pass
+    _noise_re = re.compile(
+        r'[\x00-\x1f\x7f-\x9f]|\[\d+\]|' + '|'.join(REMOVE_PATTERNS),
+        re.IGNORECASE
+    )
+    
+    _shell_prompt_re = re.compile(r'^\s*[$>]\s*', re.MULTILINE)
+    _trailing_space_re = re.compile(r'\s+\n')
+    _blank_lines_re = re.compile(r'\n\s+\n')
+    
+    # Private-use character that joins texts for batch cleaning; none of the
+    # patterns above can match across it
+    _BATCH_SEPARATOR = '\ue000'
+    
+    @classmethod
+    def clean_text(cls, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ""
-            
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Remove control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-        
-        # Remove citations like [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
-        
-        # Remove common ads/cookie notice text
-        remove_patterns = [
-            r'accept all cookies',
-            r'we use cookies',
-            r'cookie policy',
-            r'privacy policy',
-            r'terms of service',
-            r'all rights reserved',
-            r'copyright \d{4}',
-        ]
         
-        for pattern in remove_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        text = cls._whitespace_re.sub(' ', text).strip()
+        return cls._noise_re.sub('', text).strip()
+    
+    @classmethod
+    def clean_many(cls, texts: List[str]) -> List[str]:
+        """Clean a batch of texts with one pass of each pattern over the whole batch"""
+        if any(cls._BATCH_SEPARATOR in text for text in texts if text):
+            return [cls.clean_text(text) for text in texts]
         
-        return text.strip()
+        joined = cls._BATCH_SEPARATOR.join(text or "" for text in texts)
+        joined = cls._noise_re.sub('', cls._whitespace_re.sub(' ', joined))
+        return [text.strip() for text in joined.split(cls._BATCH_SEPARATOR)]
 
-    @staticmethod
-    def clean_code(code: str) -> str:
+    @classmethod
+    def clean_code(cls, code: str) -> str:
         """Clean code examples"""
         if not code:
             return ""
             
         # Remove shell prompts ($ or > at the beginning of lines)
-        code = re.sub(r'^\s*[$>]\s*', '', code, flags=re.MULTILINE)
+        code = cls._shell_prompt_re.sub('', code)
         
         # Remove extra line breaks and normalize whitespace
-        code = re.sub(r'\s+\n', '\n', code)
-        code = re.sub(r'\n\s+\n', '\n\n', code)
+        code = cls._trailing_space_re.sub('\n', code)
+        code = cls._blank_lines_re.sub('\n\n', code)
         
         return code.strip()
 
@@ -248,6 +365,12 @@ class ContentExtractor:
         self.basic_indicators = BASIC_INDICATORS
         self.elements_to_remove = ELEMENTS_TO_REMOVE
         self.non_content_cases = NON_CONTENT_CASES
+        
+        # Removal rules compiled once: a tag-name set and one class/id pattern
+        self._remove_tags = frozenset(tag.lower() for tag in self.elements_to_remove)
+        self._non_content_re = re.compile(
+            "|".join(re.escape(case) for case in self.non_content_cases), re.I
+        )
     
     def get_title(self, soup: BeautifulSoup) -> str:
         """Extract page title"""
@@ -272,17 +395,16 @@ class ContentExtractor:
             
             # Try all common content containers with minimum text check
             containers = []
-            for selector in ["main", "article", "#content", ".content", 
-                            "#main", ".main", "div.content", "div.main",
-                            "section", ".post", ".article", ".entry"]:
-                elements = clean_soup.select(selector)
+            for elements in select_each(clean_soup, ["main", "article", "#content", ".content", 
+                                                     "#main", ".main", "div.content", "div.main",
+                                                     "section", ".post", ".article", ".entry"]):
                 for el in elements:
                     if len(el.get_text(strip=True)) > 50:  # Minimum text length
                         containers.append(el)
             
             if containers:
                 # Combine all matching containers
-                combined = BeautifulSoup("", "html.parser")
+                combined = parse_html("")
                 for container in containers:
                     combined.append(container)
                 return combined
@@ -295,7 +417,7 @@ class ContentExtractor:
                     paragraphs.append(p)
             
             if len(paragraphs) >= 3:  # Require at least 3 substantial paragraphs
-                combined = BeautifulSoup("", "html.parser")
+                combined = parse_html("")
                 for p in paragraphs:
                     combined.append(p)
                 return combined
@@ -311,8 +433,8 @@ class ContentExtractor:
         
         try:
             # Look for code blocks in pre and code tags 
-            for selector in self.code_selectors:
-                for code_block in soup.select(selector):
+            for code_blocks in select_each(soup, self.code_selectors):
+                for code_block in code_blocks:
                     code = self.cleaner.clean_code(code_block.get_text(strip=True))
                     if code:
                         code_examples.append(code)
@@ -329,45 +451,47 @@ class ContentExtractor:
         content = {"text": "", "code": []}
         
         try:
-            # Clean the soup first
-            clean_soup = self._clean_content(soup)
-            
-            # Try all content selectors
-            for selector in content_selectors:
-                elements = clean_soup.select(selector)
-                for element in elements:
-                    text = self.cleaner.clean_text(element.get_text())
-                    if text and len(text) > 100:  # Minimum content threshold
-                        content["text"] += f"\n{text}"
-            
-            # Try all code selectors (from original soup)
-            for selector in self.code_selectors:
-                code_blocks = soup.select(selector)
+            # Try all code selectors (before cleaning removes them)
+            for code_blocks in select_each(soup, self.code_selectors):
                 for block in code_blocks:
                     code = self.cleaner.clean_code(block.get_text())
                     if code:
                         content["code"].append(code)
+            
+            # Clean the soup
+            clean_soup = self._clean_content(soup)
+            
+            # Try all content selectors, cleaning every match in one batch
+            raw_texts = [
+                element.get_text()
+                for elements in select_each(clean_soup, content_selectors)
+                for element in elements
+            ]
+            content["text"] = "".join(
+                f"\n{text}" for text in self.cleaner.clean_many(raw_texts)
+                if text and len(text) > 100  # Minimum content threshold
+            )
         except Exception as e:
             logger.error(f"Error extracting content with selectors: {e}")
         
         return content if content["text"] else None
 
     def find_links(self, soup: BeautifulSoup, base_url: str, avoid_patterns: List[str]) -> List[str]:
-        """Find relevant links on a page"""
-        links = set()
+        """Find relevant links on a page, one per canonical URL"""
+        links = {}
         try:
             for a in soup.find_all("a", href=True):
                 href = a["href"]
                 if href.startswith("#") or href.lower().startswith("javascript:"):
                     continue
 
-                full_url = urljoin(base_url, href)
+                full_url = clean_url(urljoin(base_url, href))
                 if not any(p in full_url for p in avoid_patterns):
-                    links.add(full_url)
+                    links.setdefault(canonicalize_url(full_url), full_url)
         except Exception as e:
             logger.error(f"Error finding links: {e}")
             
-        return list(links)
+        return list(links.values())
 
     def determine_level(self, content: str, url: str) -> str:
         """Determine content difficulty level based on content and URL"""
@@ -403,30 +527,58 @@ class ContentExtractor:
             logger.error(f"Error determining level: {e}")
             return "any level"
         
-    def _clean_content(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Remove non-content elements from the soup"""
-        # Make a copy to avoid modifying the original
-        clean_soup = copy(soup)
+    def _is_non_content(self, element: Tag) -> bool:
+        """Check an element against the tag, class and id removal rules"""
+        if element.name.lower() in self._remove_tags:
+            return True
         
-        # Remove unwanted elements by tag name
-        for tag in self.elements_to_remove:
-            for element in clean_soup.find_all(tag):
-                element.decompose()
+        classes = element.get("class")
+        if classes:
+            if not isinstance(classes, str):
+                classes = " ".join(classes)
+            if self._non_content_re.search(classes):
+                return True
         
-        # Remove elements with non-content classes/IDs
-        for class_name in self.non_content_cases:
-            # Match class or ID containing the pattern
-            for element in clean_soup.find_all(class_=re.compile(class_name, re.I)):
-                element.decompose()
-            for element in clean_soup.find_all(id=re.compile(class_name, re.I)):
-                element.decompose()
+        element_id = element.get("id")
+        return bool(element_id and self._non_content_re.search(element_id))
+    
+    @staticmethod
+    def _is_empty(element: Tag) -> bool:
+        """True if an element has no child tags and no visible text"""
+        for child in element.contents:
+            if isinstance(child, Tag):
+                return False
+            if (isinstance(child, NavigableString) and not isinstance(child, PreformattedString)
+                    and child.strip()):
+                return False
+        return True
+    
+    def _clean_content(self, soup: BeautifulSoup) -> BeautifulSoup:
+        """
+        Remove non-content and empty elements from the soup in one pass.
         
-        # Remove empty elements
-        for element in clean_soup.find_all():
-            if not element.get_text(strip=True) and not element.find_all():
+        The tree is cleaned in place, so read code blocks, links and titles
+        from the soup before calling this.
+        """
+        # Iterative post-order walk: removal rules are checked on the way down
+        # (skipping the whole subtree), empty nodes are pruned on the way up
+        stack = [(soup, False)]
+        while stack:
+            element, children_done = stack.pop()
+            
+            if children_done:
+                if element is not soup and self._is_empty(element):
+                    element.decompose()
+                continue
+            
+            if element is not soup and self._is_non_content(element):
                 element.decompose()
+                continue
+            
+            stack.append((element, True))
+            stack.extend((child, False) for child in element.contents if isinstance(child, Tag))
         
-        return clean_soup
+        return soup
 
 class BaseDetector:
     """Base class for detecting paywalls, logins, etc."""
@@ -438,81 +590,312 @@ class BaseDetector:
 class StandardDetector(BaseDetector):
     """Standard detector using regular HTTP requests"""
     
+    login_keywords = ["login", "sign in", "register", "create account"]
+    
     def __init__(self):
         super().__init__()
         self.headers = get_random_headers()
     
-    def is_login_required(self, url: str) -> bool:
+    def classify(self, url: str, html: Optional[str] = None, status: Optional[int] = None,
+                 final_url: Optional[str] = None, content_type: str = "",
+                 soup: Optional[BeautifulSoup] = None) -> Optional[PageClassification]:
+        """
+        Compute login, paywall and content-type signals for a page in one pass.
+        
+        The page is fetched only when neither html nor soup is given, and parsed
+        at most once; scrapers pass the HTML (or soup) they already have.
+        Returns None if the page could not be fetched.
+        """
+        if html is None and soup is None:
+            try:
+                response = requests.get(url, headers=self.headers, timeout=10, allow_redirects=True)
+            except Exception as e:
+                logger.error(f"Error classifying {url}: {str(e)}")
+                return None
+            html = response.text
+            status = response.status_code
+            final_url = response.url
+            content_type = response.headers.get("Content-Type", "")
+        
+        result = PageClassification(
+            url=url,
+            status=status,
+            final_url=final_url or url,
+            content_type=content_type.split(";")[0].strip().lower()
+        )
+        result.is_html = not result.content_type or "html" in result.content_type or "xml" in result.content_type
+        
+        # Access denied outright, or bounced to a login page
+        if status in [401, 402, 403]:
+            result.login_required = result.paywall = True
+        if any(marker in result.final_url.lower() for marker in ["login", "signin", "account"]):
+            result.login_required = True
+        
+        if not result.is_html:
+            return result
+        
+        if soup is None:
+            soup = parse_html(html or "")
+        text = soup.get_text().lower()
+        result.text_length = len(text)
+        
+        # Count keyword appearances on the shared page text
+        result.login_keyword_count = sum(text.count(keyword) for keyword in self.login_keywords)
+        result.paywall_keyword_count = sum(text.count(keyword) for keyword in self.paywall_patterns)
+        
+        # Login forms and paywall containers, found in a single walk
+        login_forms = paywall_elements = 0
+        for element in soup.find_all(["form", "div", "section"]):
+            markers = [(element.get("id") or "").lower(), " ".join(element.get("class") or []).lower()]
+            if element.name == "form":
+                if any(keyword in marker for marker in markers for keyword in self.login_keywords):
+                    login_forms += 1
+            elif any(keyword in marker for marker in markers for keyword in ["paywall", "subscribe"]):
+                paywall_elements += 1
+        
+        # If multiple indicators are present, the page is likely login-required/paywalled
+        result.login_required = result.login_required or login_forms > 0 or result.login_keyword_count > 3
+        result.paywall = result.paywall or paywall_elements > 0 or result.paywall_keyword_count > 3
+        return result
+    
+    def is_login_required(self, url: str, html: Optional[str] = None) -> bool:
         """Check if a URL requires login"""
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10, allow_redirects=True)
-            
-            # Check HTTP status code
-            if response.status_code in [401, 403, 402]:
-                return True
-            
-            # Check for login redirects
-            final_url = response.url.lower()
-            if "login" in final_url or "signin" in final_url or "account" in final_url:
-                return True
-            
-            # Check for login-related content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text = soup.get_text().lower()
-            
-            login_keywords = ["login", "sign in", "register", "create account"]
-            login_forms = soup.find_all("form", id=lambda x: x and any(keyword in x.lower() for keyword in login_keywords))
-            login_forms += soup.find_all("form", class_=lambda x: x and any(keyword in x.lower() for keyword in login_keywords))
-            
-            # Count login keyword appearances
-            login_count = sum(text.count(keyword) for keyword in login_keywords)
-            
-            # If multiple login indicators present, it's likely login-required
-            return len(login_forms) > 0 or login_count > 3
-            
-        except Exception as e:
-            logger.error(f"Error checking login requirement for {url}: {str(e)}")
-            return True  # Skip if error occurs
+        result = self.classify(url, html)
+        return True if result is None else result.login_required  # Skip if error occurs
 
-    def is_paywall_present(self, url: str) -> bool:
+    def is_paywall_present(self, url: str, html: Optional[str] = None) -> bool:
         """Check if a URL has a paywall"""
+        result = self.classify(url, html)
+        return True if result is None else result.paywall  # Skip if error occurs
+
+@dataclass
+class PageExtraction:
+    """Compact result of the parse/extract stage for one page"""
+    content: Optional[ScrapedContent] = None
+    next_url: Optional[str] = None
+    paywall_text: bool = False
+    js_rendered: bool = False
+    # Measured in the worker and recorded by the caller's process
+    parse_seconds: float = 0.0
+    extract_seconds: float = 0.0
+
+class PageProcessor:
+    """
+    CPU-bound parse and extraction stage for fetched pages.
+    
+    Takes raw HTML and returns a PageExtraction, so it can run in
+    ExtractionPool worker processes; nothing here touches the network.
+    """
+    
+    # Pagination patterns for static HTML (soupsieve syntax)
+    static_pagination_selectors = [
+        "a:-soup-contains('Next')", "a:-soup-contains('Continue')", 
+        ".next a", ".pagination a:last-child", "a#nextbtn", "#nextbtn a"
+    ]
+    
+    def __init__(self, code_selectors: Optional[List[str]] = None,
+                 common_content_selectors: Optional[List[str]] = None):
+        self.cleaner = ContentCleaner()
+        self.extractor = ContentExtractor(self.cleaner)
+        self.code_selectors = code_selectors if code_selectors is not None else CODE_SELECTORS
+        self.common_content_selectors = (common_content_selectors if common_content_selectors is not None
+                                         else COMMON_CONTENT_SELECTORS)
+    
+    def process_static(self, html: str, url: str, topic: str = "",
+                       check_paywall: bool = False) -> PageExtraction:
+        """Classify and extract a page fetched over plain HTTP"""
+        started = time.perf_counter()
+        soup = parse_html(html)
+        parse_seconds = time.perf_counter() - started
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            result = self._process_static(soup, html, url, topic, check_paywall)
+            result.parse_seconds = parse_seconds
+            result.extract_seconds = time.perf_counter() - started - parse_seconds
+            return result
+        finally:
+            # Release the parsed tree now that everything has been extracted
+            soup.decompose()
+    
+    def _process_static(self, soup: BeautifulSoup, html: str, url: str, topic: str,
+                        check_paywall: bool) -> PageExtraction:
+        # Modal paywalls can only be confirmed in a rendered page
+        if check_paywall and self.has_paywall_text(soup):
+            return PageExtraction(paywall_text=True)
+        if self.looks_js_rendered(soup):
+            return PageExtraction(js_rendered=True)
             
-            # Check HTTP status
-            if response.status_code in [401, 402, 403]:
+        # Pagination links live in navigation that content extraction removes
+        next_url = None
+        for selector in self.static_pagination_selectors:
+            try:
+                next_link = soup.select_one(selector)
+                href = next_link.get("href") if next_link else None
+                if href and not href.startswith("#"):
+                    next_url = clean_url(urljoin(url, href))
+                    break
+            except Exception:
+                continue
+        
+        scraped = self.extract_page_content(soup, url, topic)
+        if scraped is None:
+            return PageExtraction()
+        
+        # Same fingerprint the recrawl scheduler computes from a plain fetch
+        scraped.content_hash = page_fingerprint(html)
+        return PageExtraction(content=scraped, next_url=next_url)
+    
+    def process_rendered(self, html: str, url: str, topic: str = "",
+                         check_paywall: bool = False) -> PageExtraction:
+        """Extract a page rendered by the browser; paywall modals are confirmed by the caller"""
+        started = time.perf_counter()
+        soup = parse_html(html)
+        parse_seconds = time.perf_counter() - started
+        try:
+            paywall_text = check_paywall and self.has_paywall_text(soup)
+            return PageExtraction(
+                content=self.extract_page_content(soup, url, topic),
+                paywall_text=paywall_text,
+                parse_seconds=parse_seconds,
+                extract_seconds=time.perf_counter() - started - parse_seconds
+            )
+        finally:
+            soup.decompose()
+    
+    def has_paywall_text(self, soup: BeautifulSoup) -> bool:
+        """Check the page text for strong paywall wording and no free-content hints"""
+        text = soup.get_text().lower()
+
+        # Specifically look for text that suggests free content
+        free_indicators = ["free", "tutorial", "learn", "documentation", "guide", "how to"]
+        if any(indicator in text for indicator in free_indicators):
+            return False
+
+        paywall_keywords = ['subscribe', 'subscription', 'premium', 'paid membership', 'paywall']
+        paywall_count = sum(text.count(kw) for kw in paywall_keywords)
+
+        # Only suspect a paywall when there are multiple strong indicators
+        return paywall_count > 5
+
+    def looks_js_rendered(self, soup: BeautifulSoup) -> bool:
+        """Heuristic for client-rendered pages whose static HTML is only a shell"""
+        for noscript in soup.find_all("noscript"):
+            if "javascript" in noscript.get_text().lower():
+                body = soup.body
+                if body is None or len(body.get_text(strip=True)) < 500:
+                    return True
+
+        for root_id in ["root", "app", "__next", "__nuxt"]:
+            root = soup.find(id=root_id)
+            if root is not None and not root.get_text(strip=True):
                 return True
-                
-            # Check for paywall indicators in the page content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text = soup.get_text().lower()
-            
-            # Count paywall keyword appearances
-            paywall_count = sum(text.count(keyword) for keyword in self.paywall_patterns)
-            
-            # Check for paywall-related elements
-            paywall_elements = soup.find_all(["div", "section"], id=lambda x: x and "paywall" in x.lower())
-            paywall_elements += soup.find_all(["div", "section"], class_=lambda x: x and "paywall" in x.lower())
-            paywall_elements += soup.find_all(["div", "section"], id=lambda x: x and "subscribe" in x.lower())
-            paywall_elements += soup.find_all(["div", "section"], class_=lambda x: x and "subscribe" in x.lower())
-            
-            # If multiple paywall indicators present, it's likely a paywall
-            return len(paywall_elements) > 0 or paywall_count > 3
+
+        return False
+
+    def extract_page_content(self, soup: BeautifulSoup, url: str, topic: str = "") -> Optional[ScrapedContent]:
+        """Extract validated ScrapedContent from a parsed page"""
+        # Extract title with null check
+        title = self.extractor.get_title(soup) or "No title found"
+        
+        # Extract code examples with fallbacks, before cleaning removes them
+        code_examples = self.extractor.extract_code_examples(soup) or []
+        if (any(keyword in url.lower() for keyword in ["tutorial", "learn", "guide", "howto"]) and 
+            any(tech in url.lower() for tech in ["python", "javascript", "java", "sql", "code"]) and 
+            not code_examples):
             
+            for selector in self.code_selectors:
+                try:
+                    elements = soup.select(selector)
+                    if elements:
+                        code_examples = [el.get_text() for el in elements]
+                        break
+                except Exception:
+                    continue
+        
+        # The fallback container is read from the untouched tree, since
+        # extract_main_content cleans the soup in place
+        fallback_text = ""
+        try:
+            for elements in select_each(soup, self.common_content_selectors):
+                if elements and elements[0].get_text().strip():
+                    fallback_text = elements[0].get_text()
+                    break
         except Exception as e:
-            logger.error(f"Error checking paywall for {url}: {str(e)}")
-            return True  # Skip if error occurs
+            logger.debug(f"Fallback content selectors failed on {url}: {str(e)}")
+        
+        # Extract main content with fallbacks
+        main_content = self.extractor.extract_main_content(soup)
+        raw_text = main_content.get_text() if main_content is not None else ""
+        if not raw_text.strip():
+            raw_text = fallback_text
+        
+        if not raw_text.strip():
+            logger.warning(f"Could not extract main content from {url}")
+            return None
+
+        # Clean and validate text
+        text = self.cleaner.clean_text(raw_text)
+        if len(text.split()) < 50:
+            logger.warning(f"Content from {url} is too short ({len(text.split())} words)")
+            return None
+
+        return ScrapedContent(
+            title=title,
+            text=text,
+            code=code_examples,
+            url=url,
+            topic=topic,
+            level=self.extractor.determine_level(text, url)
+        )
+
+# Per-process PageProcessor used by extraction jobs
+_page_processor: Optional[PageProcessor] = None
+
+def init_page_processor(code_selectors: Optional[List[str]] = None,
+                        common_content_selectors: Optional[List[str]] = None) -> None:
+    """ExtractionPool initializer: build this process's PageProcessor once"""
+    global _page_processor
+    _page_processor = PageProcessor(code_selectors, common_content_selectors)
+
+def process_page(mode: str, html: str, url: str, topic: str = "",
+                 check_paywall: bool = False) -> PageExtraction:
+    """Extraction job: run one page's HTML through this process's PageProcessor"""
+    if _page_processor is None:
+        init_page_processor()
+    if mode == "static":
+        return _page_processor.process_static(html, url, topic, check_paywall)
+    return _page_processor.process_rendered(html, url, topic, check_paywall)
+
+def record_extraction(url: str, tier: str, result: PageExtraction) -> None:
+    """Report a page's parse/extract timings, outcome and yield to the scrape metrics"""
+    domain = canonical_domain(url)
+    STAGE_SECONDS.observe(result.parse_seconds, stage="parse", domain=domain)
+    STAGE_SECONDS.observe(result.extract_seconds, stage="extract", domain=domain)
+    
+    if result.content is not None:
+        outcome = "extracted"
+        EXTRACTED_WORDS.observe(len(result.content.text.split()), domain=domain)
+    elif result.paywall_text:
+        outcome = "paywall"
+    elif result.js_rendered:
+        outcome = "js_rendered"
+    else:
+        outcome = "empty"
+    EXTRACTIONS_TOTAL.inc(domain=domain, tier=tier, outcome=outcome)
 
 class BaseScraper(ABC):
     """Abstract base class for content scrapers"""
     
     def __init__(self, url_manager: URLManager, content_cleaner: ContentCleaner, 
-                 extractor: ContentExtractor, detector: BaseDetector):
+                 extractor: ContentExtractor, detector: BaseDetector,
+                 response_cache: Optional[ResponseCache] = None):
         self.url_manager = url_manager
         self.cleaner = content_cleaner
         self.extractor = extractor
         self.detector = detector
         
+        # On-disk HTTP cache shared by the static and browser fetch paths
+        self.response_cache = response_cache or ResponseCache()
+        
         self.headers = get_random_headers()
         
         self.code_selectors = CODE_SELECTORS
@@ -527,123 +910,321 @@ class StandardScraper(BaseScraper):
     """Standard scraper using regular HTTP requests"""
     
     def __init__(self, url_manager: URLManager, content_cleaner: ContentCleaner, 
-                 extractor: ContentExtractor, detector: StandardDetector):
-        super().__init__(url_manager, content_cleaner, extractor, detector)
+                 extractor: ContentExtractor, detector: StandardDetector,
+                 http_fetcher: Optional[AsyncHTTPFetcher] = None, max_concurrency: int = 4,
+                 response_cache: Optional[ResponseCache] = None):
+        super().__init__(url_manager, content_cleaner, extractor, detector, response_cache)
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         
-    def _scrape_page(self, url: str) -> Dict:
+        # Keep-alive connection pool (bounded per host) for configured source crawls
+        # Fetcher and scheduler share one adaptive per-domain rate controller
+        self.rate_controller = AdaptiveRateController(url_manager)
+        self.http_fetcher = http_fetcher or AsyncHTTPFetcher(
+            limit_per_host=2, cache=self.response_cache, rate_controller=self.rate_controller
+        )
+        self.scheduler = PolitenessScheduler(
+            url_manager, max_concurrency=max_concurrency, rate_controller=self.rate_controller
+        )
+        
+    def _scrape_page(self, url: str, topic: str = "") -> Optional[ScrapedContent]:
         """Scrape content from a single page"""
         try:
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Extract title
-            title = self.extractor.get_title(soup)
-            
-            # Extract main content
-            main_content = self.extractor.extract_main_content(soup)
-            if not main_content:
-                return None
-                
-            # Clean text content
-            text = self.cleaner.clean_text(main_content.get_text())
-            
-            # Extract code examples
-            code_examples = self.extractor.extract_code_examples(soup)
-            
-            return {
-                "title": title, 
-                "text": text, 
-                "code": code_examples
-            }
+            return self._parse_page(response.text, url, topic)
             
         except Exception as e:
             logger.error(f"Error scraping {url}: {str(e)}")
             return None
 
-    def scrape_configured_sources(self) -> List[Dict]:
-        """Scrape content from pre-configured sources"""
+    async def _scrape_page_async(self, url: str, topic: str = "") -> Optional[ScrapedContent]:
+        """Scrape content from a single page over the pooled async session"""
+        async with self.scheduler.slot(url):
+            response = await self.http_fetcher.get(url)
+        
+        if response is None:
+            raise NetworkError(f"Failed to fetch {url}")
+        if response.status != 200:
+            raise error_for_status(url, response.status)
+        return self._parse_page(response.text, url, topic)
+
+    def _parse_page(self, html: str, url: str, topic: str = "") -> Optional[ScrapedContent]:
+        """Extract ScrapedContent from a page's HTML"""
+        started = time.perf_counter()
+        soup = parse_html(html)
+        result = PageExtraction(parse_seconds=time.perf_counter() - started)
+        result.content = self._extract_page(soup, html, url, topic)
+        result.extract_seconds = time.perf_counter() - started - result.parse_seconds
+        record_extraction(url, "static", result)
+        return result.content
+
+    def _extract_page(self, soup: BeautifulSoup, html: str, url: str,
+                      topic: str) -> Optional[ScrapedContent]:
+        content_hash = page_fingerprint(html)
+        
+        # Title and code come from the raw tree; content extraction cleans it
+        title = self.extractor.get_title(soup)
+        code_examples = self.extractor.extract_code_examples(soup)
+        
+        # Extract main content
+        main_content = self.extractor.extract_main_content(soup)
+        if not main_content:
+            return None
+            
+        # Clean text content
+        text = self.cleaner.clean_text(main_content.get_text())
+        
+        return ScrapedContent(
+            title=title,
+            text=text,
+            code=code_examples,
+            url=url,
+            topic=topic,
+            level=self.extractor.determine_level(text, url),
+            content_hash=content_hash
+        )
+
+    async def scrape_configured_sources_async(self) -> List[Dict]:
+        """Scrape content from pre-configured sources, crawling topics concurrently"""
+        since = REGISTRY.snapshot()
+        async with self.http_fetcher:
+            results = await asyncio.gather(*(
+                self._scrape_topic_async(source_name, config, topic, topic_config)
+                for source_name, config in self.sources.items()
+                for topic, topic_config in config.topics.items()
+            ))
+        
+        REGISTRY.log_summary("Configured source scrape", since)
+        return [item for topic_items in results for item in topic_items]
+
+    async def _scrape_topic_async(self, source_name: str, config: SourceConfig,
+                                  topic: str, topic_config: Dict) -> List[Dict]:
+        """Scrape one configured topic page and the links found on it"""
         knowledge = []
+        logger.info(f"Scraping {topic} from {source_name}")
+
+        try:
+            base_url = urljoin(config.base_url, topic_config["url"])
+            content, page_links = await self._scrape_topic_page(config, topic, base_url)
+            
+            if content is not None:
+                knowledge.append(content.to_dict())
+                self.url_manager.mark_as_scraped(base_url, content.content_hash, topic)
+
+            # Find and process additional pages concurrently; the scheduler
+            # still spaces out requests to the same domain
+            link_results = await asyncio.gather(*(
+                self._scrape_link_async(link, topic)
+                for link in page_links[:topic_config["depth"]]
+            ))
+            knowledge.extend(item for item in link_results if item)
+
+        except Exception as e:
+            logger.error(f"Error scraping {topic} from {source_name}: {str(e)}")
+
+        return knowledge
+
+    async def _scrape_topic_page(self, config: SourceConfig, topic: str,
+                                 base_url: str) -> Tuple[Optional[ScrapedContent], List[str]]:
+        """Fetch a configured topic page and return its content and the links found on it"""
+        async with self.scheduler.slot(base_url):
+            response = await self.http_fetcher.get(base_url)
+        if response is None:
+            raise NetworkError(f"Failed to fetch {base_url}")
+        if response.status != 200:
+            raise error_for_status(base_url, response.status)
+        started = time.perf_counter()
+        soup = parse_html(response.text)
+        result = PageExtraction(parse_seconds=time.perf_counter() - started)
         
-        for source_name, config in self.sources.items():
-            for topic, topic_config in config.topics.items():
-                logger.info(f"Scraping {topic} from {source_name}")
+        # Read title and links before content extraction cleans the tree
+        title = self.extractor.get_title(soup)
+        page_links = self.extractor.find_links(soup, base_url, config.avoid_urls)
 
-                try:
-                    base_url = urljoin(config.base_url, topic_config["url"])
-                    
-                    delay_range = self.url_manager.get_delay_for_domain(base_url)
-                    time.sleep(random.uniform(*delay_range))
-                    
-                    response = self.session.get(base_url, timeout=15)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, "html.parser")
-
-                    # Extract content using source-specific selectors
-                    main_content = self.extractor.extract_content_with_selectors(
-                        soup, 
-                        config.content_selectors,
-                        config.code_selectors
-                    )
+        # Extract content using source-specific selectors
+        main_content = self.extractor.extract_content_with_selectors(
+            soup, 
+            config.content_selectors,
+            config.code_selectors
+        )
+        result.extract_seconds = time.perf_counter() - started - result.parse_seconds
+        
+        if not main_content or not main_content.get("text"):
+            logger.warning(f"No main content found at {base_url}")
+            record_extraction(base_url, "static", result)
+            return None, page_links
+        
+        result.content = ScrapedContent(
+            title=title or f"{topic.capitalize()} Tutorial",
+            text=main_content["text"],
+            code=main_content.get("code", []),
+            url=base_url,
+            topic=topic,
+            level=self.extractor.determine_level(main_content["text"], base_url),
+            content_hash=page_fingerprint(response.text)
+        )
+        record_extraction(base_url, "static", result)
+        return result.content, page_links
+
+    async def _scrape_link_async(self, link: str, topic: str) -> Optional[Dict]:
+        """Scrape a page linked from a configured topic page"""
+        try:
+            # Skip if already processed
+            should_skip, reason = self.url_manager.should_skip(link)
+            if should_skip:
+                logger.info(f"Skipping {link}: {reason}")
+                return None
                 
-                    if main_content and main_content.get("text"):
-                        content = ScrapedContent(
-                            title=self.extractor.get_title(soup) or f"{topic.capitalize()} Tutorial",
-                            text=main_content["text"],
-                            code=main_content.get("code", []),
-                            url=base_url,
-                            topic=topic,
-                            level=self.extractor.determine_level(main_content["text"], base_url)
-                        )
-                        
-                        knowledge.append(content.to_dict())
-                        self.url_manager.mark_as_scraped(base_url)
-                    else:
-                        logger.warning(f"No main content found at {base_url}")
-
-                    # Find and process additional pages
-                    page_links = self.extractor.find_links(soup, base_url, config.avoid_urls)
-                    for link in page_links[:topic_config["depth"]]:
-                        try:
-                            time.sleep(random.uniform(*self.url_manager.get_delay_for_domain(link)))
-                            
-                            # Skip if already processed
-                            should_skip, reason = self.url_manager.should_skip(link)
-                            if should_skip:
-                                logger.info(f"Skipping {link}: {reason}")
-                                continue
-                                
-                            page_content = self._scrape_page(link, topic)
-                            if page_content and page_content.is_valid():
-                                knowledge.append(page_content.to_dict())
-                                self.url_manager.mark_as_scraped(link)
-                        except Exception as e:
-                            logger.error(f"Error scraping {link}: {str(e)}")
-                            self.url_manager.mark_as_bad(link)
-
-                except Exception as e:
-                    logger.error(f"Error scraping {topic} from {source_name}: {str(e)}")
+            page_content = await self._scrape_page_async(link, topic)
+            if page_content and page_content.is_valid():
+                self.url_manager.mark_as_scraped(link, page_content.content_hash, topic)
+                return page_content.to_dict()
+        except CircuitOpenError as e:
+            logger.info(f"Skipping {link}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error scraping {link}: {str(e)}")
+            self.url_manager.mark_as_bad(link, str(e), failure_category(e))
+        
+        return None
 
+    def scrape_configured_sources(self) -> List[Dict]:
+        """Synchronous wrapper for the async scrape_configured_sources method"""
+        return asyncio.run(self.scrape_configured_sources_async())
+
+    async def run_crawl_job_async(self, job_store: CrawlJobStore, job_id: str,
+                                  checkpoint_every: int = 20,
+                                  knowledge_file: str = "knowledge_base.json") -> List[Dict]:
+        """
+        Crawl the configured sources as a resumable job.
+        
+        Topic pages and the links found on them form a persisted frontier.
+        Every checkpoint_every finished URLs, their status, items and newly
+        found links are committed together, so running the same job again
+        after a crash only crawls what is still pending. When the frontier is
+        exhausted the items are saved to the knowledge base and the job is
+        marked completed.
+        """
+        since = REGISTRY.snapshot()
+        if not job_store.progress(job_id):
+            job_store.add_urls(job_id, [
+                (urljoin(config.base_url, topic_config["url"]), KIND_TOPIC, source_name, topic)
+                for source_name, config in self.sources.items()
+                for topic, topic_config in config.topics.items()
+            ])
+        
+        results: List[Tuple[str, str, Optional[str]]] = []
+        items: List[Tuple[str, Dict]] = []
+        discovered: List[Tuple[str, str, str, str]] = []
+        
+        async def checkpoint() -> None:
+            # Take the buffers before yielding so concurrent crawls start new ones
+            batch = (results[:], items[:], discovered[:])
+            results.clear(); items.clear(); discovered.clear()
+            if batch[0]:
+                await asyncio.to_thread(job_store.checkpoint, job_id, *batch)
+        
+        async def crawl(entry: Dict) -> None:
+            url, source, topic = entry["url"], entry["source"], entry["topic"]
+            try:
+                config = self.sources[source]
+                if entry["kind"] == KIND_TOPIC:
+                    content, page_links = await self._scrape_topic_page(config, topic, url)
+                    for link in page_links[:config.topics[topic]["depth"]]:
+                        should_skip, reason = self.url_manager.should_skip(link)
+                        if should_skip:
+                            logger.info(f"Skipping {link}: {reason}")
+                            continue
+                        discovered.append((link, KIND_LINK, source, topic))
+                else:
+                    content = await self._scrape_page_async(url, topic)
+                
+                if content is not None and content.is_valid():
+                    items.append((url, content.to_dict()))
+                    self.url_manager.mark_as_scraped(url, content.content_hash, topic)
+                results.append((url, URL_DONE, None))
+            except CircuitOpenError as e:
+                # Not the page's fault; retried when the job is resumed
+                logger.info(f"Skipping {url}: {str(e)}")
+                results.append((url, URL_FAILED, str(e)))
+            except Exception as e:
+                logger.error(f"Error crawling {url}: {str(e)}")
+                if entry["kind"] == KIND_LINK:
+                    self.url_manager.mark_as_bad(url, str(e), failure_category(e))
+                results.append((url, URL_FAILED, str(e)))
+            
+            if len(results) >= checkpoint_every:
+                await checkpoint()
+        
+        async with self.http_fetcher:
+            # Topic pages first, then the links they discovered
+            while True:
+                entries = await asyncio.to_thread(job_store.pending, job_id)
+                if not entries:
+                    break
+                logger.info(f"Crawl job {job_id}: {len(entries)} pending URLs")
+                await asyncio.gather(*(crawl(entry) for entry in entries))
+                await checkpoint()
+        
+        knowledge = job_store.items(job_id)
+        if knowledge:
+            await asyncio.to_thread(FileManager.save_to_knowledge_base, knowledge, knowledge_file)
+        job_store.set_status(job_id, JOB_COMPLETED)
+        logger.info(f"Crawl job {job_id} completed: {job_store.progress(job_id)}, {len(knowledge)} items")
+        REGISTRY.log_summary(f"Crawl job {job_id}", since)
         return knowledge
 
+    def run_crawl_job(self, job_store: CrawlJobStore, job_id: str, checkpoint_every: int = 20,
+                      knowledge_file: str = "knowledge_base.json") -> List[Dict]:
+        """Synchronous wrapper for the async run_crawl_job method"""
+        return asyncio.run(self.run_crawl_job_async(job_store, job_id, checkpoint_every, knowledge_file))
+
 class PlaywrightScraper(BaseScraper):
-    """Playwright-based scraper for JavaScript-heavy pages"""
+    """Playwright-based scraper for JavaScript-heavy pages, with a static HTTP fast path"""
     
     def __init__(self, url_manager: URLManager, content_cleaner: ContentCleaner, 
-                 extractor: ContentExtractor, detector: BaseDetector):
-        super().__init__(url_manager, content_cleaner, extractor, detector)
+                 extractor: ContentExtractor, detector: BaseDetector,
+                 browser_pool: Optional[BrowserPool] = None, max_concurrency: int = 3,
+                 http_fetcher: Optional[AsyncHTTPFetcher] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 search_provider: Optional[SearchProvider] = None,
+                 extraction_pool: Optional[ExtractionPool] = None,
+                 readiness: Optional[PageReadiness] = None):
+        super().__init__(url_manager, content_cleaner, extractor, detector, response_cache)
         
         self.headers = get_random_headers()
         
-        self.last_search_time = 0
-        self.search_delay = (3, 6)  # Random delay between 3-6 seconds
-        self.max_retries = 3
+        # Warm browsers shared by every page this scraper opens
+        self.browser_pool = browser_pool or BrowserPool(
+            size=max_concurrency, response_cache=self.response_cache
+        )
+        
+        # Pooled HTTP client for the static fetch tier, and the tier that last
+        # worked per domain ("static" or "browser")
+        self.rate_controller = AdaptiveRateController(url_manager)
+        self.http_fetcher = http_fetcher or AsyncHTTPFetcher(
+            cache=self.response_cache, rate_controller=self.rate_controller
+        )
+        self.domain_tiers: Dict[str, str] = {}
+        
+        # Concurrent scraping with adaptive per-domain politeness delays
+        self.scheduler = PolitenessScheduler(
+            url_manager, max_concurrency=max_concurrency, rate_controller=self.rate_controller
+        )
         
-        self.visited_urls = set()  # Track visited URLs
-        self.current_domain = None  # Track current domain being scraped
+        # Web search off the event loop, with repeat queries served from disk
+        self.search_provider = search_provider or CachedSearchProvider(
+            DDGSSearchProvider(search_delay=(3, 6), max_retries=3)
+        )
+        
+        # Parsing and extraction run in worker processes, off the event loop
+        self.extraction_pool = extraction_pool or ExtractionPool(
+            initializer=init_page_processor,
+            initargs=(self.code_selectors, self.common_content_selectors)
+        )
+        
+        # Waits for rendered content to settle, with per-domain learned timeouts
+        self.readiness = readiness or PageReadiness(self.common_content_selectors)
         
         self.pagination_selectors = [
             "a:has-text('Next')", "a:has-text('Next ❯')", 
@@ -658,479 +1239,481 @@ class PlaywrightScraper(BaseScraper):
                 element = await page.query_selector(selector)
                 if element is not None and await element.is_visible():
                     await element.click()
-                    await page.wait_for_timeout(1000)
+                    try:
+                        # Done as soon as the banner is gone, not after a fixed delay
+                        await element.wait_for_element_state("hidden", timeout=1000)
+                    except Exception:
+                        pass
                     return True
             except Exception:
                 continue
         return False
     
-    async def _is_paywall_present_with_playwright(self, url: str, timeout: int = 10) -> bool:
-        """Wrapper method to handle exceptions gracefully during paywall detection"""
-        if self.url_manager.is_trusted_domain(url):
-            return False
-        
-        try:
-            return await self._is_paywall_present_async(url, timeout)
-        except Exception as e:
-            logger.error(f"Error checking paywall with Playwright for {url}: {str(e)}")
-            return False
-
-    async def _is_paywall_present_async(self, url: str, timeout: int = 10) -> bool:
-        """Check if a URL has a paywall using Playwright (async implementation)"""    
+    async def _detect_paywall(self, page, response, paywall_text: bool) -> bool:
+        """Decide whether an already loaded page is paywalled, given its text verdict (statuses are checked by the caller)"""
         try:
-            async with async_playwright() as p:
-                if not p:
-                    logger.error(f"Failed to initialize playwright for {url}")
-                    return False
-                    
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    viewport={"width": 1280, "height": 800},
-                    user_agent=get_random_headers()["User-Agent"],
-                    extra_http_headers={
-                        k: v for k, v in self.headers.items() 
-                        if k.lower() not in ['user-agent']
-                    }
-                )
-
-                # Avoid detection
-                await context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                """)
-
-                page = await context.new_page()
-                page.set_default_timeout(timeout * 1000)
+            if not paywall_text:
+                return False
 
+            for selector in self.modal_selectors:
                 try:
-                    # Use a more flexible approach with timeout handling
-                    response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
-                    # Wait a bit for potential dynamic content
-                    await page.wait_for_timeout(2000)
-                except Exception as nav_error:
-                    logger.warning(f"Navigation issue for {url}: {str(nav_error)}")
-                    await browser.close()
-                    return False  # Don't mark as paywall just because of navigation issues
-
-                # Handle cookies
-                await self._handle_cookie_popups(page)
-
-                if response.status in [401, 402, 403]:
-                    await browser.close()
-                    return True
-
-                content = await page.content()
-                soup = BeautifulSoup(content, "html.parser")
-                text = soup.get_text().lower()
-
-                paywall_keywords = ['subscribe', 'subscription', 'premium', 'paid membership', 'paywall']
-                paywall_count = sum(text.count(kw) for kw in paywall_keywords)
-
-                has_modal = False
-                for selector in self.modal_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        for el in elements:
-                            if await el.is_visible():
-                                has_modal = True
-                                break
-                        if has_modal:
-                            break
-                    except Exception:
-                        continue
-
-                # Specifically look for text that suggests free content
-                free_indicators = ["free", "tutorial", "learn", "documentation", "guide", "how to"]
-                has_free_indicator = any(indicator in text for indicator in free_indicators)
-
-                await browser.close()
-                
-                # Only mark as paywall if we have multiple strong indicators
-                # and no free content indicators
-                if has_free_indicator:
-                    return False
-                    
-                return has_modal and paywall_count > 5
+                    elements = await page.query_selector_all(selector)
+                    for el in elements:
+                        if await el.is_visible():
+                            return True
+                except Exception:
+                    continue
 
+            return False
         except Exception as e:
-            logger.error(f"Error in async paywall check for {url}: {str(e)}")
+            logger.error(f"Error checking paywall for {page.url}: {str(e)}")
             return False
-    
-    async def scrape_page_async(self, url: str, topic: str = "", depth=0, max_depth=5) -> Optional[ScrapedContent]:
-        """Scrape content from a JavaScript-heavy page using Playwright and return ScrapedContent"""
-        self.headers = get_random_headers()
+
+    async def scrape_page_async(self, url: str, topic: str = "", max_depth: int = 5,
+                                check_paywall: bool = False) -> Optional[ScrapedContent]:
+        """
+        Scrape content from a page, trying a plain HTTP fetch before Playwright.
+        "Next" pagination links on the same domain are followed iteratively, up to
+        max_depth pages. With check_paywall, the paywall verdict is taken from the
+        first page and PaywallError is raised instead of returning content.
+        Blocked, server and network failures of the first page are raised as
+        ScraperException subclasses so callers can categorize them.
+        """
+        domain = urlparse(url).netloc
+        self.extraction_pool.start()
         
-        # Initialize domain tracking if this is the first page
-        if depth == 0:
-            self.current_domain = urlparse(url).netloc
-            self.visited_urls = set()  # Reset for new scraping session
+        try:
+            async with self.http_fetcher, self.browser_pool:
+                # Escalate to the browser only when the static tier can't do the job,
+                # and remember per domain which tier worked
+                if self.domain_tiers.get(domain) != "browser":
+                    scraped = await self._follow_pagination(
+                        url, max_depth, check_paywall,
+                        lambda page_url, check: self._scrape_static_page(page_url, topic, check)
+                    )
+                    if scraped is not None:
+                        self.domain_tiers[domain] = "static"
+                        return scraped
+                    logger.info(f"Static fetch insufficient for {url}, using Playwright")
+                
+                # One borrowed page serves the whole pagination chain
+                async with self.browser_pool.page(url) as page:
+                    scraped = await self._follow_pagination(
+                        url, max_depth, check_paywall,
+                        lambda page_url, check: self._scrape_loaded_page(page, page_url, topic, check)
+                    )
+                if scraped is not None:
+                    self.domain_tiers[domain] = "browser"
+                return scraped
         
-        # Check if we've already visited this URL
-        if url in self.visited_urls:
-            logger.info(f"Skipping already visited URL: {url}")
+        except (ScraperException, CircuitOpenError):
+            raise
+        except Exception as e:
+            logger.error(f"Scraping error at {url}: {str(e)}")
             return None
+
+    async def _follow_pagination(self, url: str, max_depth: int, check_paywall: bool,
+                                 load_page) -> Optional[ScrapedContent]:
+        """Walk a pagination chain with an explicit frontier, collecting each page's content"""
+        current_domain = urlparse(url).netloc
+        frontier = deque([url])
+        visited_urls: Set[str] = set()
+        
+        scraped = None
+        text_chunks: List[str] = []
+        code_examples: List[str] = []
+        
+        while frontier and len(visited_urls) < max_depth:
+            page_url = frontier.popleft()
+            visited_urls.add(canonicalize_url(page_url))
+            
+            try:
+                page_content, next_url = await load_page(page_url, check_paywall and scraped is None)
+            except ScraperException as e:
+                # A failing later page only ends the chain
+                if scraped is None:
+                    raise
+                logger.info(f"Stopping pagination at {page_url}: {str(e)}")
+                break
+            if page_content is None:
+                break
             
-        self.visited_urls.add(url)
+            if scraped is None:
+                scraped = page_content
+            text_chunks.append(page_content.text)
+            code_examples.extend(page_content.code)
+            
+            if next_url:
+                # Only follow if same domain and not visited
+                if (urlparse(next_url).netloc == current_domain and
+                    canonicalize_url(next_url) not in visited_urls):
+                    logger.info(f"Following next page link: {next_url}")
+                    frontier.append(next_url)
+                else:
+                    logger.info(f"Skipping next link (domain/visited): {next_url}")
         
-        if depth >= max_depth:
+        if scraped is None:
             return None
         
-        browser = None
-        context = None
-        page = None
+        scraped.text = "\n\n".join(text_chunks)
+        scraped.code = code_examples
         
-        try:
-            # Initialize Playwright
-            async with async_playwright() as p:
-                if p is None:
-                    logger.error(f"Failed to initialize Playwright for {url}")
-                    return None
-                
-                try:
-                    # Launch browser with null checks
-                    browser = await p.chromium.launch(headless=True)
-                    if browser is None:
-                        logger.error(f"Failed to launch browser for {url}")
-                        return None
-                    
-                    # Create context with null checks
-                    context = await browser.new_context(
-                        viewport={"width": 1280, "height": 800},
-                        user_agent=self.headers["User-Agent"]
-                    )
-                    if context is None:
-                        logger.error(f"Failed to create context for {url}")
-                        await self._safe_close_browser(browser)
-                        return None
+        # Validate scraped content
+        if not scraped.is_valid():
+            logger.warning(f"Scraped content validation failed for {url}")
+            return None
 
-                    # Add stealth script
-                    try:
-                        await context.add_init_script(""" 
-                            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                        """)
-                    except Exception as e:
-                        logger.warning(f"Could not add init script for {url}: {str(e)}")
-
-                    # Create page with null checks
-                    page = await context.new_page()
-                    if page is None:
-                        logger.error(f"Failed to create page for {url}")
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    if page is not None:
-                        try:
-                            page.set_default_timeout(20000)
-                        except Exception as e:
-                            logger.warning(f"Could not set timeout for {url}: {str(e)}")
-                            
-                    # Navigation with response checking
-                    response = None
-                    try:
-                        response = await page.goto(url, wait_until="domcontentloaded", timeout=20000)
-                        if response is None:
-                            logger.warning(f"Navigation to {url} returned no response")
-                        await page.wait_for_timeout(2000)
-                    except Exception as e:
-                        logger.warning(f"Navigation issue for {url}, but continuing: {str(e)}")
-
-                    # Handle cookie popups
-                    try:
-                        if page is not None:
-                            await self._handle_cookie_popups(page)
-                    except Exception as e:
-                        logger.warning(f"Could not handle cookie popups for {url}: {str(e)}")
+        return scraped
 
-                    # Get page content with null checks
-                    html_content = None
-                    try:
-                        if page is not None:
-                            html_content = await page.content()
-                    except Exception as e:
-                        logger.error(f"Could not get page content for {url}: {str(e)}")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    if html_content is None:
-                        logger.error(f"No content retrieved for {url}")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    # Parse content
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    if soup is None:
-                        logger.error(f"Could not parse HTML for {url}")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    # Extract title with null check
-                    title = self.extractor.get_title(soup) or "No title found"
-                    
-                    # Extract main content with fallbacks
-                    main_content = self.extractor.extract_main_content(soup)
-                    if main_content is None or not main_content.get_text().strip(): 
-                        for selector in self.common_content_selectors:
-                            try:
-                                elements = soup.select(selector)
-                                if elements and elements[0].get_text().strip():
-                                    main_content = elements[0]
-                                    break
-                            except Exception:
-                                continue
-                    
-                    if main_content is None or not main_content.get_text().strip():
-                        logger.warning(f"Could not extract main content from {url}")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    # Clean and validate text
-                    text = self.cleaner.clean_text(main_content.get_text())
-                    if len(text.split()) < 50:
-                        logger.warning(f"Content from {url} is too short ({len(text.split())} words)")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-                    
-                    # Extract code examples with fallbacks
-                    code_examples = self.extractor.extract_code_examples(soup) or []
-                    if (any(keyword in url.lower() for keyword in ["tutorial", "learn", "guide", "howto"]) and 
-                        any(tech in url.lower() for tech in ["python", "javascript", "java", "sql", "code"]) and 
-                        not code_examples):
-                        
-                        for selector in self.code_selectors:
-                            try:
-                                elements = soup.select(selector)
-                                if elements:
-                                    code_examples = [el.get_text() for el in elements]
-                                    break
-                            except Exception:
-                                continue
-
-                    # Create and return scraped content
-                    scraped = ScrapedContent(
-                        title=title,
-                        text=text,
-                        code=code_examples,
-                        url=url,
-                        topic=topic,
-                        level=self.extractor.determine_level(text, url)
-                    )
-                    
-                    # Check for pagination/next links (W3Schools-specific and general patterns)
-                    next_links = []
-                    
-                    for selector in self.pagination_selectors:
-                        try:
-                            next_link = await page.query_selector(selector)
-                            if next_link:
-                                href = await next_link.get_attribute("href")
-                                if href and not href.startswith("#"):
-                                    next_url = urljoin(url, href)
-                                    next_links.append(next_url)
-                        except Exception:
-                            continue
+    async def _scrape_static_page(self, url: str, topic: str = "",
+                                  check_paywall: bool = False) -> Tuple[Optional[ScrapedContent], Optional[str]]:
+        """Fetch a page over plain HTTP and extract its content and next pagination link"""
+        response = await self.http_fetcher.get(url)
+        if response is None:
+            return None, None
+        
+        # Login and payment walls are final; blocks, server errors and other
+        # statuses may still work in the browser
+        status_error = error_for_status(url, response.status, check_paywall)
+        if isinstance(status_error, (PaywallError, LoginRequiredError)):
+            raise status_error
+        if response.status != 200:
+            return None, None
+        
+        result = await self._extract_page("static", response.text, url, topic, check_paywall)
+        if result.js_rendered:
+            logger.info(f"{url} looks client-rendered")
+        return result.content, result.next_url
 
-                    # Follow the first valid next link found
-                    if next_links:
-                        next_url = next_links[0]
-                        parsed_next = urlparse(next_url)
-                        
-                        # Only follow if same domain and not visited
-                        if (parsed_next.netloc == self.current_domain and 
-                            next_url not in self.visited_urls and
-                            depth < max_depth):
-                            
-                            logger.info(f"Following next page link: {next_url}")
-                            next_content = await self.scrape_page_async(
-                                next_url, topic, depth + 1, max_depth
-                            )
-                            if next_content:
-                                scraped.text += f"\n\n{next_content.text}"
-                                scraped.code.extend(next_content.code)
-                        else:
-                            logger.info(f"Skipping next link (domain/visited/depth): {next_url}")
-        
-                    # Validate scraped content
-                    if not hasattr(scraped, 'is_valid') or not scraped.is_valid():
-                        logger.warning(f"Scraped content validation failed for {url}")
-                        await self._safe_close_page(page)
-                        await self._safe_close_context(context)
-                        await self._safe_close_browser(browser)
-                        return None
-
-                    await self._safe_close_page(page)
-                    await self._safe_close_context(context)
-                    await self._safe_close_browser(browser)
-                    return scraped
-                except Exception as e:
-                    print(e)
-                    
+    async def _scrape_loaded_page(self, page, url: str, topic: str = "",
+                                  check_paywall: bool = False) -> Tuple[Optional[ScrapedContent], Optional[str]]:
+        """Navigate the page to url and extract its content and next pagination link"""
+        domain = canonical_domain(url)
+        
+        # Navigation with response checking
+        response = None
+        navigation_error = None
+        started = time.monotonic()
+        try:
+            with STAGE_SECONDS.time(stage="navigate", domain=domain):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=20000)
+            if response is None:
+                logger.warning(f"Navigation to {url} returned no response")
+            else:
+                headers = await response.all_headers()
+                if CACHE_HIT_HEADER in headers:
+                    # Served by the route cache: no request reached the site
+                    FETCHES_TOTAL.inc(domain=domain, tier="browser", status="cache")
+                else:
+                    FETCHES_TOTAL.inc(domain=domain, tier="browser", status=response.status)
+                    self.rate_controller.record_response(
+                        url, response.status, time.monotonic() - started, headers
+                    )
         except Exception as e:
-            logger.error(f"Playwright scraping error at {url}: {str(e)}")
-            await self._safe_close_page(page)
-            await self._safe_close_context(context)
-            await self._safe_close_browser(browser)
-            return None
+            navigation_error = e
+            FETCHES_TOTAL.inc(domain=domain, tier="browser", status="error")
+            logger.warning(f"Navigation issue for {url}, but continuing: {str(e)}")
         
-    def scrape_page(self, url: str, topic: str = "") -> Optional[ScrapedContent]:
-        """Synchronous wrapper for the async scrape_page method"""
-        return asyncio.run(self.scrape_page_async(url, topic))
+        if response is not None:
+            status_error = error_for_status(url, response.status, check_paywall)
+            if status_error is not None:
+                raise status_error
+        
+        try:
+            with STAGE_SECONDS.time(stage="settle", domain=domain):
+                await self.readiness.wait(page, url)
+        except Exception as e:
+            logger.warning(f"Could not wait for {url} to settle: {str(e)}")
 
-    async def _safe_close_page(self, page):
-        """Safely close a page with error handling"""
-        if page is not None:
-            try:
-                await page.close()
-            except Exception as e:
-                logger.warning(f"Error closing page: {str(e)}")
+        # Handle cookie popups
+        try:
+            with STAGE_SECONDS.time(stage="consent", domain=domain):
+                await self._handle_cookie_popups(page)
+        except Exception as e:
+            logger.warning(f"Could not handle cookie popups for {url}: {str(e)}")
 
-    async def _safe_close_context(self, context):
-        """Safely close a context with error handling"""
-        if context is not None:
-            try:
-                await context.close()
-            except Exception as e:
-                logger.warning(f"Error closing context: {str(e)}")
+        # Get page content
+        try:
+            with STAGE_SECONDS.time(stage="render", domain=domain):
+                html_content = await page.content()
+        except Exception as e:
+            logger.error(f"Could not get page content for {url}: {str(e)}")
+            if navigation_error is not None:
+                raise NetworkError(f"Navigation to {url} failed: {str(navigation_error)}")
+            return None, None
+
+        if html_content is None:
+            logger.error(f"No content retrieved for {url}")
+            return None, None
+        PAGE_BYTES.observe(len(html_content.encode("utf-8", errors="replace")), domain=domain, tier="browser")
+
+        # Parse and extract in a worker; the paywall verdict comes from the same parse
+        result = await self._extract_page("rendered", html_content, url, topic, check_paywall)
+        if check_paywall and await self._detect_paywall(page, response, result.paywall_text):
+            raise PaywallError(f"Paywall detected at {url}")
 
-    async def _safe_close_browser(self, browser):
-        """Safely close a browser with error handling"""
-        if browser is not None:
+        scraped = result.content
+        if scraped is None:
+            if navigation_error is not None:
+                # Nothing usable arrived before the navigation failed
+                raise NetworkError(f"Navigation to {url} failed: {str(navigation_error)}")
+            return None, None
+        
+        # Check for pagination/next links (W3Schools-specific and general patterns)
+        for selector in self.pagination_selectors:
             try:
-                await browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {str(e)}")
+                next_link = await page.query_selector(selector)
+                if next_link:
+                    href = await next_link.get_attribute("href")
+                    if href and not href.startswith("#"):
+                        return scraped, clean_url(urljoin(url, href))
+            except Exception:
+                continue
+
+        return scraped, None
+
+    async def _extract_page(self, mode: str, html: str, url: str, topic: str,
+                            check_paywall: bool) -> PageExtraction:
+        """Run a page through the extraction pool and record its stage metrics"""
+        started = time.perf_counter()
+        result = await self.extraction_pool.run(process_page, mode, html, url, topic, check_paywall)
+        
+        # Whatever the worker did not spend parsing went to queueing and IPC
+        STAGE_SECONDS.observe(
+            max(0.0, time.perf_counter() - started - result.parse_seconds - result.extract_seconds),
+            stage="pool_wait", domain=canonical_domain(url)
+        )
+        record_extraction(url, "static" if mode == "static" else "browser", result)
+        return result
+
+    def scrape_page(self, url: str, topic: str = "") -> Optional[ScrapedContent]:
+        """Synchronous wrapper for the async scrape_page method"""
+        return asyncio.run(self.scrape_page_async(url, topic))
     
     async def search_and_scrape_async(self, query: str, level = "any level", max_results: int = 10) -> List[Dict]:
         """Async implementation of search and scrape"""
-        knowledge = []
-        try:
-            # Implement delay between searches to prevent ratelimiting
-            current_time = time.time()
-            time_since_last = current_time - self.last_search_time
-            if time_since_last < random.uniform(*self.search_delay):
-                delay = random.uniform(*self.search_delay) - time_since_last
-                await asyncio.sleep(delay)
-            
-            enhanced_query = f"{query} for {level} course OR tutorial OR guide OR learn"
-            results_list = []
+        scraped = {}
+        async with aclosing(self._iter_search_results(query, level, max_results)) as results:
+            async for index, content_dict in results:
+                scraped[index] = content_dict
+        
+        # Keep the domain priority order of the search results
+        return [scraped[i] for i in sorted(scraped)]
+
+    async def search_and_scrape_iter(self, query: str, level = "any level",
+                                     max_results: int = 10) -> AsyncIterator[Dict]:
+        """
+        Search and scrape, yielding each result as soon as it has been validated.
+        
+        Results arrive in completion order rather than domain priority order.
+        Closing the generator early (e.g. with ``aclosing`` after enough items)
+        cancels the scrapes that are still running.
+        """
+        async with aclosing(self._iter_search_results(query, level, max_results)) as results:
+            async for _, content_dict in results:
+                yield content_dict
+
+    async def _search_candidates(self, query: str, level: str, max_results: int) -> List[str]:
+        """Search for a query and return the result URLs worth scraping, best domains first"""
+        # Warm the extraction workers while the search runs
+        self.extraction_pool.start()
+        
+        enhanced_query = f"{query} for {level} course OR tutorial OR guide OR learn"
+        results_list = await self.search_provider.search(enhanced_query, max_results * 2)
+        
+        # Sort results to prioritize educational sites
+        results_list.sort(key=lambda x: self.url_manager.domain_rule(x['href']).priority)
+    
+        # Same filtering window as before: the first max_results * 2 results
+        candidates = []
+        seen_keys = set()
+        for result in results_list[:max_results * 2]:
+            url = clean_url(result['href'])
             
-            # Retry mechanism
-            for attempt in range(self.max_retries):
-                try:
-                    results = DDGS(headers=get_random_headers()).text(enhanced_query, max_results=max_results * 2)
-                    results_list = list(results)
-                    self.last_search_time = time.time()
-                    break
-                except Exception as search_error:
-                    if "Ratelimit" in str(search_error) or "429" in str(search_error):
-                        wait_time = (attempt + 1) * 5  # Exponential backoff
-                        logger.warning(f"Hit rate limit, waiting {wait_time} seconds (attempt {attempt + 1})")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    logger.error(f"Search engine error: {str(search_error)}")
-                    # Fall back to a simplified query on final attempt
-                    if attempt == self.max_retries - 1:
-                        try:
-                            results = DDGS(headers=get_random_headers()).text(enhanced_query, max_results=max_results * 3)
-                            results_list = list(results)
-                            self.last_search_time = time.time()
-                        except Exception as fallback_error:
-                            logger.error(f"Fallback search failed: {str(fallback_error)}")
-                            return knowledge
-                    continue
-                
-            # Sort results to prioritize educational sites
-            def domain_priority(url):
-                domain = urlparse(url).netloc
-                for i, edu_domain in enumerate(self.url_manager.trusted_domains.keys()):
-                    if edu_domain in domain:
-                        return i
-                return len(self.url_manager.trusted_domains.keys())
-                
-            results_list.sort(key=lambda x: domain_priority(x['href']))
+            # Search engines often return several variants of one page
+            key = canonicalize_url(url)
+            if key in seen_keys:
+                logger.info(f"Skipping duplicate result: {url}")
+                continue
+            seen_keys.add(key)
+        
+            # Skip certain problematic URLs
+            if self.url_manager.should_avoid_pattern(url):
+                logger.info(f"Skipping problematic URL: {url}")
+                continue
+
+            skip, reason = self.url_manager.should_skip(url)
+            if skip:
+                logger.info(f"Skipping {url}: {reason}")
+                continue
             
-            processed_count = 0
-            attempted_count = 0
-                
-            for result in results_list:
-                if processed_count >= max_results or attempted_count >= max_results * 2:
-                    break
+            candidates.append(url)
+        
+        return candidates
+
+    async def _iter_search_results(self, query: str, level: str,
+                                   max_results: int) -> AsyncIterator[Tuple[int, Dict]]:
+        """Yield (search rank, content dict) pairs as concurrent scrapes finish"""
+        since = REGISTRY.snapshot()
+        try:
+            async with self.http_fetcher, self.browser_pool:
+                candidates = await self._search_candidates(query, level, max_results)
                 
-                attempted_count += 1
-                url = result['href']
+                # Scrape concurrently; the scheduler spaces out same-domain requests
+                done: asyncio.Queue = asyncio.Queue()
                 
-                # Skip certain problematic URLs
-                if self.url_manager.should_avoid_pattern(url):
-                    logger.info(f"Skipping problematic URL: {url}")
-                    continue
-
-                skip, reason = self.url_manager.should_skip(url)
-                if skip:
-                    logger.info(f"Skipping {url}: {reason}")
-                    continue
+                async def scrape_candidate(index: int, url: str) -> None:
+                    content_dict = None
+                    try:
+                        async with self.scheduler.slot(url):
+                            content_dict = await self._scrape_search_result(url, query)
+                    except CircuitOpenError as e:
+                        logger.info(f"Skipping {url}: {str(e)}")
+                    finally:
+                        done.put_nowait((index, content_dict))
                 
+                tasks = [
+                    asyncio.create_task(scrape_candidate(i, url))
+                    for i, url in enumerate(candidates)
+                ]
                 try:
-                    delay_range = self.url_manager.get_delay_for_domain(url)
-                    await asyncio.sleep(random.uniform(*delay_range))
-                        
-                    # Skip paywall check for most educational sites to improve speed
-                    should_check_paywall = not self.url_manager.is_trusted_domain(url)
-                    
-                    if should_check_paywall:
-                        # Check for paywall, but be less strict
-                        has_paywall = await self._is_paywall_present_with_playwright(url)
-                        if has_paywall:
-                            logger.info(f"Skipping {url}: Paywall detected")
-                            self.url_manager.mark_as_bad(url)
-                            continue
-                        
-                    # Try Playwright scraping
-                    content = await self.scrape_page_async(url, query)
-                    
-                    if content:
-                        if isinstance(content, ScrapedContent):
-                            # Convert ScrapedContent to dict
-                            content_dict = content.to_dict()
-                            word_count = len(content.text.split())
-                        elif isinstance(content, dict):
-                            # Already a dictionary
-                            content_dict = content
-                            word_count = len(content.get('text', '').split())
-                        else:
-                            logger.info(f"Unexpected content type from {url}")
-                            continue
-                        
-                        if word_count < 25:
-                            logger.info(f"Skipping {url}: Content too short ({word_count} words)")
-                            continue
-                            
-                        knowledge.append(content_dict)
-                        self.url_manager.mark_as_scraped(url)
-                        processed_count += 1
-                        logger.info(f"Successfully scraped {url} ({word_count} words)")
-                    else:
-                        logger.info(f"No useful content found at {url}")
-                        self.url_manager.mark_as_bad(url)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing {url}: {str(e)}")
-                    self.url_manager.mark_as_bad(url)
-                    continue
-                    
+                    yielded = 0
+                    for _ in range(len(tasks)):
+                        index, content_dict = await done.get()
+                        if content_dict:
+                            yield index, content_dict
+                            yielded += 1
+                            if yielded >= max_results:
+                                break
+                finally:
+                    # Stop scrapes nobody is waiting for any more, before the
+                    # browser pool and fetcher shut down
+                    pending = [task for task in tasks if not task.done()]
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        logger.info(f"Cancelling {len(pending)} unfinished scrapes")
+                        await asyncio.gather(*pending, return_exceptions=True)
+        
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
+        finally:
+            REGISTRY.log_summary(f"Search for '{query}'", since)
+
+    async def _scrape_search_result(self, url: str, query: str) -> Optional[Dict]:
+        """Check and scrape a single search result, updating URL state"""
+        try:
+            # Skip paywall check for most educational sites to improve speed
+            should_check_paywall = not self.url_manager.is_trusted_domain(url)
             
-        return knowledge
+            # Scrape and classify in a single navigation
+            try:
+                content = await self.scrape_page_async(url, query, check_paywall=should_check_paywall)
+            except PaywallError:
+                logger.info(f"Skipping {url}: Paywall detected")
+                self.url_manager.mark_as_bad(url, "Paywall detected", "paywall")
+                return None
+        
+            if content:
+                if isinstance(content, ScrapedContent):
+                    # Convert ScrapedContent to dict
+                    content_dict = content.to_dict()
+                    word_count = len(content.text.split())
+                elif isinstance(content, dict):
+                    # Already a dictionary
+                    content_dict = content
+                    word_count = len(content.get('text', '').split())
+                else:
+                    logger.info(f"Unexpected content type from {url}")
+                    return None
+            
+                if word_count < 25:
+                    logger.info(f"Skipping {url}: Content too short ({word_count} words)")
+                    return None
+                
+                self.url_manager.mark_as_scraped(
+                    url, getattr(content, "content_hash", ""), content_dict.get("topic", query)
+                )
+                logger.info(f"Successfully scraped {url} ({word_count} words)")
+                return content_dict
+            
+            logger.info(f"No useful content found at {url}")
+            self.url_manager.mark_as_bad(url, "No useful content", "content")
+            
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            self.url_manager.mark_as_bad(url, str(e), failure_category(e))
+            
+        return None
 
     def search_and_scrape(self, query: str, level = "any level", max_results: int = 10) -> List[Dict]:
         """Synchronous wrapper for the async search_and_scrape method"""
-        return asyncio.run(self.search_and_scrape_async(query, level, max_results))
\ No newline at end of file
+        return asyncio.run(self.search_and_scrape_async(query, level, max_results))
+
+    async def recrawl_async(self, limit: int = 50,
+                            knowledge_file: str = "knowledge_base.json") -> List[Dict]:
+        """
+        Revisit scraped pages that are due per the recrawl schedule.
+        
+        Each page is fetched once and fingerprinted; only pages whose
+        fingerprint changed are re-extracted and written back to the knowledge
+        base, replacing their previous entry.
+        """
+        due = self.url_manager.recrawl_scheduler.due(limit)
+        if not due:
+            logger.info("No pages due for recrawl")
+            return []
+        
+        since = REGISTRY.snapshot()
+        async with self.http_fetcher, self.browser_pool:
+            results = await asyncio.gather(*(self._recrawl_page(state) for state in due))
+        
+        updated = [item for item in results if item]
+        if updated:
+            await asyncio.to_thread(FileManager.update_knowledge_base, updated, knowledge_file)
+        logger.info(f"Recrawled {len(due)} pages: {len(updated)} changed")
+        REGISTRY.log_summary("Recrawl", since)
+        return updated
+
+    async def _recrawl_page(self, state: Dict) -> Optional[Dict]:
+        """Re-extract one scheduled page if its content changed since the last check"""
+        url = state["url"]
+        recrawl_scheduler = self.url_manager.recrawl_scheduler
+        state_store = self.url_manager.state_store
+        try:
+            # Conditional request: an unchanged page usually costs a 304
+            async with self.scheduler.slot(url):
+                response = await self.http_fetcher.get(url, revalidate=True)
+            if response is None or response.status != 200:
+                logger.info(f"Recrawl of {url} failed, retrying later")
+                state_store.run_in_writer(recrawl_scheduler.defer, url)
+                return None
+            # A good response settles a half-open circuit before the re-scrape slot
+            self.url_manager.circuit_breaker.record_success(canonical_domain(url))
+            
+            # Recrawl rows are updated on the writer thread, in order with register()
+            fingerprint = page_fingerprint(response.text)
+            changed = await asyncio.wrap_future(
+                state_store.run_in_writer(recrawl_scheduler.record_check, url, fingerprint)
+            )
+            if not changed:
+                logger.info(f"Unchanged since last check: {url}")
+                return None
+            
+            # The static tier is served the response just cached by the check
+            async with self.scheduler.slot(url):
+                content = await self.scrape_page_async(url, state.get("topic", ""))
+            if content is None:
+                return None
+            
+            logger.info(f"Content changed at {url}")
+            return content.to_dict()
+        
+        except Exception as e:
+            logger.error(f"Recrawl error at {url}: {str(e)}")
+            state_store.run_in_writer(recrawl_scheduler.defer, url)
+            return None
+
+    def recrawl(self, limit: int = 50, knowledge_file: str = "knowledge_base.json") -> List[Dict]:
+        """Synchronous wrapper for the async recrawl method"""
+        return asyncio.run(self.recrawl_async(limit, knowledge_file))
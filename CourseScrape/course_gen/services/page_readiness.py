@@ -0,0 +1,129 @@
+from course_gen.core.globals import (
+    logging, asyncio, time, Dict, List
+)
+
+from course_gen.utils.url_utils import canonical_domain
+
+logger = logging.getLogger("page_readiness")
+
+# Polled in the page: true once the main content has held the same, non-empty
+# text length and no new resources have loaded for `stablePolls` checks in a row
+CONTENT_STABLE_SCRIPT = """
+([selectors, stablePolls]) => {
+    const state = window.__scraperReadiness ||
+        (window.__scraperReadiness = { length: -1, resources: -1, stable: 0 });
+    let root = null;
+    for (const selector of selectors) {
+        try {
+            root = document.querySelector(selector);
+        } catch (e) {
+            root = null;
+        }
+        if (root && root.innerText.trim()) break;
+        root = null;
+    }
+    root = root || document.body;
+    const length = root ? root.innerText.length : 0;
+    const resources = performance.getEntriesByType('resource').length;
+    if (length > 0 && length === state.length && resources === state.resources) {
+        state.stable += 1;
+    } else {
+        state.stable = 0;
+    }
+    state.length = length;
+    state.resources = resources;
+    return state.stable >= stablePolls;
+}
+"""
+
+
+class PageReadiness:
+    """
+    Decides when a navigated page is ready to extract.
+
+    Instead of sleeping a fixed time after ``domcontentloaded``, it returns as
+    soon as the main-content selectors hold stable text or the network goes
+    idle, whichever comes first. Waits never exceed ``max_wait`` seconds.
+    How long pages on each domain take to settle is learned (moving average
+    over pages that did settle), and later pages there give up after
+    ``headroom`` times that. After ``miss_limit`` misses in a row a domain
+    only gets ``min_wait``, so pages that never quiet down (tickers, polling
+    widgets) stop costing the full ceiling; a page that settles in time
+    lifts the cap again.
+    """
+
+    def __init__(self, content_selectors: List[str], max_wait: float = 5.0,
+                 min_wait: float = 1.0, poll_interval: float = 0.1, stable_polls: int = 3,
+                 headroom: float = 2.0, smoothing: float = 0.3, miss_limit: int = 2):
+        self.content_selectors = list(content_selectors)
+        self.max_wait = max_wait
+        self.min_wait = min(min_wait, max_wait)
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.miss_limit = miss_limit
+
+        # Learned seconds from domcontentloaded to ready, per domain
+        self.settle_times: Dict[str, float] = {}
+        # Pages in a row that hit their timeout without settling, per domain
+        self.misses: Dict[str, int] = {}
+
+    def timeout_for(self, domain: str) -> float:
+        """Longest wait for a page on this domain"""
+        if self.misses.get(domain, 0) >= self.miss_limit:
+            return self.min_wait
+        learned = self.settle_times.get(domain)
+        if learned is None:
+            return self.max_wait
+        return min(self.max_wait, max(self.min_wait, learned * self.headroom))
+
+    def _learn(self, domain: str, seconds: float) -> None:
+        previous = self.settle_times.get(domain)
+        self.settle_times[domain] = seconds if previous is None else (
+            self.smoothing * seconds + (1 - self.smoothing) * previous
+        )
+
+    async def wait(self, page, url: str) -> bool:
+        """Wait until the page at url is ready; returns False if the ceiling was hit"""
+        domain = canonical_domain(url)
+        timeout = self.timeout_for(domain)
+        started = time.monotonic()
+
+        checks = [
+            asyncio.ensure_future(page.wait_for_function(
+                CONTENT_STABLE_SCRIPT,
+                arg=[self.content_selectors, self.stable_polls],
+                polling=int(self.poll_interval * 1000),
+                timeout=timeout * 1000
+            )),
+            asyncio.ensure_future(page.wait_for_load_state("networkidle", timeout=timeout * 1000))
+        ]
+        ready = False
+        try:
+            pending = set(checks)
+            while pending and not ready:
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                # A check that failed (e.g. its context was destroyed by a
+                # redirect) leaves the other one to decide
+                ready = any(not task.cancelled() and task.exception() is None for task in done)
+        finally:
+            for task in checks:
+                task.cancel()
+            await asyncio.gather(*checks, return_exceptions=True)
+
+        elapsed = time.monotonic() - started
+        if ready:
+            self._learn(domain, elapsed)
+            self.misses.pop(domain, None)
+        else:
+            # A miss says nothing about how long settling takes, only that
+            # waiting did not help; it is counted, not learned
+            self.misses[domain] = self.misses.get(domain, 0) + 1
+            logger.info(f"{url} not settled after {elapsed:.2f}s, extracting anyway")
+        return ready
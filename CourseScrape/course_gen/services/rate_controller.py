@@ -0,0 +1,138 @@
+from course_gen.core.globals import (
+    logging, time, random, datetime, parsedate_to_datetime, dataclass, Dict, Optional
+)
+
+from course_gen.utils.url_utils import canonical_domain
+
+logger = logging.getLogger("rate_controller")
+
+
+@dataclass
+class DomainRate:
+    """Adaptive request rate state for one domain"""
+    delay: float
+    latency: Optional[float] = None
+    baseline_latency: Optional[float] = None
+    blocked_until: float = 0.0
+    responses: int = 0
+    throttles: int = 0
+
+
+class AdaptiveRateController:
+    """
+    AIMD control of the delay between requests to each domain.
+
+    State is kept per canonical domain, so www. and bare hosts share one
+    rate. Every domain starts at the middle of its URLManager delay range. Each
+    quick, successful response adds ``increase_step`` requests/second to the
+    domain's rate (additive increase), while 429/503 responses halve it and
+    errors or latency well above the domain's best observed latency cut it
+    back (multiplicative decrease). Retry-After is honored by blocking the
+    domain until the given time. PolitenessScheduler reads the resulting
+    delays; fetchers report responses through ``record_response``.
+    """
+
+    def __init__(self, url_manager, min_delay: float = 0.5, max_delay: float = 60.0,
+                 increase_step: float = 0.1, throttle_factor: float = 0.5,
+                 slowdown_factor: float = 0.8, slow_latency_ratio: float = 2.0,
+                 latency_smoothing: float = 0.3):
+        self.url_manager = url_manager
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.increase_step = increase_step
+        self.throttle_factor = throttle_factor
+        self.slowdown_factor = slowdown_factor
+        self.slow_latency_ratio = slow_latency_ratio
+        self.latency_smoothing = latency_smoothing
+
+        self.domains: Dict[str, DomainRate] = {}
+
+    def _state(self, url: str) -> DomainRate:
+        domain = canonical_domain(url)
+        state = self.domains.get(domain)
+        if state is None:
+            low, high = self.url_manager.get_delay_for_domain(url)
+            state = DomainRate(delay=min(max((low + high) / 2, self.min_delay), self.max_delay))
+            self.domains[domain] = state
+        return state
+
+    def _set_rate(self, state: DomainRate, rate: float) -> None:
+        state.delay = min(max(1.0 / rate, self.min_delay), self.max_delay)
+
+    def delay_for(self, url: str) -> float:
+        """Delay before the next request to this URL's domain, with jitter"""
+        return self._state(url).delay * random.uniform(0.8, 1.2)
+
+    def blocked_until(self, url: str) -> float:
+        """Wall-clock time before which the domain asked not to be contacted"""
+        return self._state(url).blocked_until
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except Exception:
+            return None
+
+    def record_response(self, url: str, status: Optional[int], latency: Optional[float] = None,
+                        headers: Optional[Dict[str, str]] = None) -> None:
+        """Feed one network response (status None for a failed request) into the controller"""
+        state = self._state(url)
+        state.responses += 1
+        rate = 1.0 / state.delay
+
+        if status in (429, 503):
+            state.throttles += 1
+            retry_after = self.parse_retry_after(
+                {k.lower(): v for k, v in (headers or {}).items()}.get("retry-after")
+            )
+            if retry_after:
+                state.blocked_until = max(state.blocked_until, time.time() + min(retry_after, 3600))
+            self._set_rate(state, rate * self.throttle_factor)
+            logger.warning(
+                f"{canonical_domain(url)} throttled ({status}); "
+                f"delay now {state.delay:.1f}s" + (f", retry after {retry_after:.0f}s" if retry_after else "")
+            )
+            return
+
+        if status is None or status >= 500:
+            self._set_rate(state, rate * self.slowdown_factor)
+            return
+        if status >= 400:
+            # Client errors say nothing about server load
+            return
+
+        if latency is not None:
+            state.latency = latency if state.latency is None else (
+                self.latency_smoothing * latency + (1 - self.latency_smoothing) * state.latency
+            )
+            if state.baseline_latency is None or state.latency < state.baseline_latency:
+                state.baseline_latency = state.latency
+
+            if state.latency > state.baseline_latency * self.slow_latency_ratio:
+                # The server is slowing down under our load
+                self._set_rate(state, rate * self.slowdown_factor)
+                return
+
+        self._set_rate(state, rate + self.increase_step)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Current delay and latency per domain"""
+        return {
+            domain: {
+                "delay": round(state.delay, 2),
+                "latency": round(state.latency, 3) if state.latency is not None else None,
+                "responses": state.responses,
+                "throttles": state.throttles,
+                "blocked_until": datetime.fromtimestamp(state.blocked_until).isoformat()
+                if state.blocked_until > time.time() else None
+            }
+            for domain, state in self.domains.items()
+        }
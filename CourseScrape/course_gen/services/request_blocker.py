@@ -0,0 +1,96 @@
+from course_gen.core.globals import (
+    logging, urlparse, defaultdict, dataclass, field, Dict, List, Optional
+)
+
+from course_gen.core import (
+    RESOURCE_BLOCKING_PROFILES, TRACKER_HOSTS, BLOCKED_RESOURCE_SIZE_ESTIMATES
+)
+
+logger = logging.getLogger("request_blocker")
+
+
+def _host_suffixes(host: str) -> List[str]:
+    """'a.b.example.com' -> ['a.b.example.com', 'b.example.com', 'example.com', 'com']"""
+    labels = host.lower().rstrip(".").split(".")
+    return [".".join(labels[i:]) for i in range(len(labels))]
+
+
+@dataclass
+class BlockingStats:
+    """Requests aborted by the blocker, by resource type"""
+    blocked: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    allowed: int = 0
+    estimated_bytes_saved: int = 0
+
+    @property
+    def requests_saved(self) -> int:
+        return sum(self.blocked.values())
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests_saved": self.requests_saved,
+            "requests_allowed": self.allowed,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+            "blocked_by_type": dict(self.blocked)
+        }
+
+
+class RequestBlocker:
+    """
+    Decides which browser subrequests to abort.
+
+    Each page gets a profile (by default ``default_profile``, overridable per
+    domain suffix in ``domain_profiles``) listing resource types to drop, and
+    every profile except "none" also drops requests to known ad/tracker hosts.
+    Page documents are never blocked. Aborted requests are counted, with
+    bytes saved estimated from typical transfer sizes since the response is
+    never downloaded.
+    """
+
+    def __init__(self, default_profile: str = "lean",
+                 domain_profiles: Optional[Dict[str, str]] = None,
+                 tracker_hosts: Optional[List[str]] = None):
+        self.default_profile = default_profile
+        self.domain_profiles = {k.lower(): v for k, v in (domain_profiles or {}).items()}
+        self.tracker_hosts = set(h.lower() for h in (tracker_hosts if tracker_hosts is not None else TRACKER_HOSTS))
+        self.stats = BlockingStats()
+
+    def profile_for(self, url: Optional[str]) -> str:
+        """Blocking profile for pages on a URL's domain"""
+        host = urlparse(url).hostname if url else None
+        if host:
+            for suffix in _host_suffixes(host):
+                if suffix in self.domain_profiles:
+                    return self.domain_profiles[suffix]
+        return self.default_profile
+
+    def is_tracker(self, url: str) -> bool:
+        host = urlparse(url).hostname or ""
+        return any(suffix in self.tracker_hosts for suffix in _host_suffixes(host))
+
+    def should_block(self, resource_type: str, url: str, profile: str,
+                     main_document: bool = False) -> bool:
+        """Whether to abort a request under a profile, recording the decision"""
+        if profile == "none" or main_document:
+            self.stats.allowed += 1
+            return False
+
+        # Subframe documents are only blocked when they come from a tracker
+        blocked_types = RESOURCE_BLOCKING_PROFILES.get(profile, RESOURCE_BLOCKING_PROFILES["lean"])
+        if (resource_type != "document" and resource_type in blocked_types) or self.is_tracker(url):
+            self.stats.blocked[resource_type] += 1
+            self.stats.estimated_bytes_saved += BLOCKED_RESOURCE_SIZE_ESTIMATES.get(
+                resource_type, BLOCKED_RESOURCE_SIZE_ESTIMATES["default"]
+            )
+            return True
+
+        self.stats.allowed += 1
+        return False
+
+    def log_summary(self) -> None:
+        if self.stats.requests_saved:
+            logger.info(
+                f"Blocked {self.stats.requests_saved} requests "
+                f"(~{self.stats.estimated_bytes_saved / 1_000_000:.1f} MB), "
+                f"allowed {self.stats.allowed}: {dict(self.stats.blocked)}"
+            )
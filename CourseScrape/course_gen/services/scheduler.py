@@ -0,0 +1,66 @@
+from course_gen.core.globals import (
+    logging, asyncio, time, asynccontextmanager, Lock, Dict, Optional
+)
+
+from course_gen.utils.circuit_breaker import CircuitOpenError
+from course_gen.utils.loop_state import SharedSemaphore
+from course_gen.utils.url_utils import canonical_domain
+from .rate_controller import AdaptiveRateController
+
+logger = logging.getLogger("scheduler")
+
+
+class PolitenessScheduler:
+    """
+    Runs scrape jobs concurrently up to a global limit while spacing out
+    requests to the same domain by the AdaptiveRateController's delays.
+
+    Requests to one domain are serialized and spaced out; requests to
+    different domains proceed in parallel, so a batch costs roughly as much
+    as its slowest domain instead of the sum of all delays. Entering a slot
+    is where a half-open circuit breaker hands out its probe; if the
+    domain's circuit refuses the request, CircuitOpenError is raised.
+    The limits hold across event loops, so concurrent API requests sharing
+    one scheduler are throttled together.
+    """
+
+    def __init__(self, url_manager, max_concurrency: int = 3,
+                 rate_controller: Optional[AdaptiveRateController] = None):
+        self.url_manager = url_manager
+        self.max_concurrency = max_concurrency
+        self.rate_controller = rate_controller or AdaptiveRateController(url_manager)
+
+        # Earliest time the next request to each domain may start
+        self.next_allowed: Dict[str, float] = {}
+
+        self._semaphore = SharedSemaphore(max_concurrency)
+        self._domain_locks: Dict[str, SharedSemaphore] = {}
+        self._lock = Lock()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait for this URL's domain turn and a free global slot"""
+        domain = canonical_domain(url)
+        with self._lock:
+            lock = self._domain_locks.setdefault(domain, SharedSemaphore(1))
+
+        async with lock:
+            with self._lock:
+                next_allowed = self.next_allowed.get(domain, 0)
+            wait = max(
+                next_allowed - time.monotonic(),
+                self.rate_controller.blocked_until(url) - time.time()
+            )
+            if wait > 0:
+                logger.debug(f"Waiting {wait:.1f}s before next request to {domain}")
+                await asyncio.sleep(wait)
+
+            if not self.url_manager.circuit_breaker.allow(domain):
+                raise CircuitOpenError(f"Circuit open for {domain}")
+
+            try:
+                async with self._semaphore:
+                    yield
+            finally:
+                with self._lock:
+                    self.next_allowed[domain] = time.monotonic() + self.rate_controller.delay_for(url)
@@ -0,0 +1,147 @@
+from course_gen.core.globals import (
+    logging, asyncio, time, random, os, re, DDGS, ABC, abstractmethod, Lock,
+    Dict, List, Optional, Tuple
+)
+
+from course_gen.core import USER_AGENTS, BASE_HEADERS
+from course_gen.utils.file_manager import FileManager
+
+logger = logging.getLogger("search_provider")
+
+
+class SearchProvider(ABC):
+    """Async web search returning DDGS-style result dicts (title, href, body)"""
+
+    @abstractmethod
+    async def search(self, query: str, max_results: int = 10) -> List[Dict]:
+        pass
+
+
+class DDGSSearchProvider(SearchProvider):
+    """
+    DuckDuckGo search run in a worker thread so the event loop keeps serving
+    scrapes. Spaces out consecutive searches and backs off on rate limits.
+    """
+
+    def __init__(self, search_delay: Tuple[float, float] = (3, 6), max_retries: int = 3):
+        self.search_delay = search_delay
+        self.max_retries = max_retries
+        self.last_search_time = 0
+
+    def _text_search(self, query: str, max_results: int) -> List[Dict]:
+        headers = {**BASE_HEADERS, "User-Agent": random.choice(USER_AGENTS)}
+        return list(DDGS(headers=headers).text(query, max_results=max_results))
+
+    async def search(self, query: str, max_results: int = 10) -> List[Dict]:
+        # Implement delay between searches to prevent ratelimiting
+        time_since_last = time.time() - self.last_search_time
+        if time_since_last < random.uniform(*self.search_delay):
+            await asyncio.sleep(random.uniform(*self.search_delay) - time_since_last)
+
+        for attempt in range(self.max_retries):
+            try:
+                results = await asyncio.to_thread(self._text_search, query, max_results)
+                self.last_search_time = time.time()
+                return results
+            except Exception as search_error:
+                if "Ratelimit" in str(search_error) or "429" in str(search_error):
+                    wait_time = (attempt + 1) * 5  # Exponential backoff
+                    logger.warning(f"Hit rate limit, waiting {wait_time} seconds (attempt {attempt + 1})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                logger.error(f"Search engine error: {str(search_error)}")
+
+        # One last, wider attempt before giving up
+        try:
+            results = await asyncio.to_thread(self._text_search, query, int(max_results * 1.5))
+            self.last_search_time = time.time()
+            return results
+        except Exception as fallback_error:
+            logger.error(f"Fallback search failed: {str(fallback_error)}")
+            return []
+
+
+class FixtureSearchProvider(SearchProvider):
+    """
+    Offline provider serving canned results, for tests and local runs.
+
+    Results come from a dict (or a JSON file of one) mapping queries to
+    result lists; unknown queries return no results.
+    """
+
+    def __init__(self, results: Optional[Dict[str, List[Dict]]] = None, fixture_file: Optional[str] = None):
+        self.results = dict(results or {})
+        if fixture_file:
+            self.results.update(FileManager.load_json(fixture_file) or {})
+
+    async def search(self, query: str, max_results: int = 10) -> List[Dict]:
+        return list(self.results.get(query, []))[:max_results]
+
+
+class CachedSearchProvider(SearchProvider):
+    """
+    Persistent TTL cache in front of another provider.
+
+    Results are stored per normalized query in a JSON file. A cached list
+    also answers smaller requests, and requests for more results than the
+    engine had at the time, so repeat topics skip the search round trip
+    and its rate-limit backoff entirely. Empty results are not cached.
+    """
+
+    def __init__(self, provider: SearchProvider, cache_file: str = "search_cache.json",
+                 ttl: int = 24 * 3600):
+        self.provider = provider
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock = Lock()
+
+    @staticmethod
+    def cache_key(query: str) -> str:
+        return re.sub(r"\s+", " ", query.strip().lower())
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            try:
+                data = FileManager.load_json(self.cache_file) if os.path.exists(self.cache_file) else {}
+                self._entries = data if isinstance(data, dict) else {}
+            except Exception as e:
+                logger.warning(f"Could not load search cache: {str(e)}")
+                self._entries = {}
+        return self._entries
+
+    def _lookup(self, query: str, max_results: int) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._load().get(self.cache_key(query))
+        if entry is None or entry["stored_at"] + self.ttl < time.time():
+            return None
+
+        results = entry["results"]
+        if len(results) >= max_results or entry["requested"] >= max_results:
+            return results[:max_results]
+        return None
+
+    def _store(self, query: str, max_results: int, results: List[Dict]) -> None:
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries[self.cache_key(query)] = {"stored_at": now, "requested": max_results, "results": results}
+
+            # Drop expired entries while we're rewriting the file anyway
+            for key in [k for k, v in entries.items() if v["stored_at"] + self.ttl < now]:
+                del entries[key]
+            try:
+                FileManager.save_json(entries, self.cache_file)
+            except Exception as e:
+                logger.warning(f"Could not save search cache: {str(e)}")
+
+    async def search(self, query: str, max_results: int = 10) -> List[Dict]:
+        cached = await asyncio.to_thread(self._lookup, query, max_results)
+        if cached is not None:
+            logger.info(f"Search cache hit for '{query}'")
+            return cached
+
+        results = await self.provider.search(query, max_results)
+        if results:
+            await asyncio.to_thread(self._store, query, max_results, results)
+        return list(results)
@@ -0,0 +1,190 @@
+from copy import copy
+
+from django.test import SimpleTestCase
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from course_gen.core import CODE_SELECTORS, COMMON_CONTENT_SELECTORS
+from course_gen.core.globals import re
+from course_gen.services.knowledge_scraper import ContentCleaner, ContentExtractor, PageProcessor
+from course_gen.utils.html_parser import parse_html, select_each
+
+PARSERS = [name for name in ("html.parser", "lxml") if builder_registry.lookup(name) is not None]
+
+CONTENT_SELECTORS = ["main", "article", "#content", ".content", "#main", ".main",
+                     "div.content", "div.main", "section", ".post", ".article", ".entry"]
+
+
+def _section(i: int) -> str:
+    return f"""
+    <section class="doc-section" id="s{i}"><h2>Section {i}</h2>
+      <div class="sidebar-ad"><a href="/ad">ad</a></div>
+      <p>{"lorem ipsum dolor sit amet " * 12}</p><span></span><div><div><span> </span></div></div>
+      <pre class="language-python"><code>print({i})</code></pre>
+      <ul>{"".join(f"<li>item {j} text</li>" for j in range(4))}</ul>
+      <div class="share"><button>share</button></div>
+      <table><tr><td>a</td><td></td></tr></table>
+    </section>"""
+
+
+DOCUMENTS = {
+    "docs": f"""<html><head><title>Python Tutorial</title><script>var x = 1;</script></head>
+        <body><nav class="navbar"><a href="/">home</a></nav>
+        <main id="main">{"".join(_section(i) for i in range(20))}</main>
+        <footer id="footer">footer links</footer></body></html>""",
+    "blog": """<html><head><title>Post</title><style>p {}</style></head><body>
+        <header class="site-header">Blog</header>
+        <div class="content"><article class="post entry">
+          <h1>Closures explained</h1>
+          <p>A closure captures variables from the enclosing scope, which lets inner functions keep state.</p>
+          <div class="highlight"><pre><code data-lang="js">function f() { return () => 1; }</code></pre></div>
+          <p>Each call to the outer function creates a fresh binding for the captured variables.</p>
+          <aside class="related-posts"><a href="/other">Other post</a></aside>
+          <div class="comments" id="comments">Leave a comment</div>
+        </article></div>
+        <div id="cookie-banner">We use cookies</div></body></html>""",
+    "paragraphs": """<html><body><div>
+        <p>First paragraph with enough words to pass the minimum paragraph length check.</p>
+        <p>Second paragraph with enough words to pass the minimum paragraph length check.</p>
+        <p>Third paragraph with enough words to pass the minimum paragraph length check.</p>
+        <p>short</p></div></body></html>""",
+    "broken": "<div class=content><p>" + "unclosed paragraph words here " * 10
+              + "<p>second<table><tr><td>cell<pre>x = 1</pre>",
+}
+
+
+# Pages where extract_main_content finds nothing and the common-selector fallback decides
+FALLBACK_DOCUMENTS = {
+    "tutorial_list": """<html><head><title>Loops</title></head><body>
+        <div class="tutorial-content"><h2>Loops</h2>
+          <ul>""" + "".join(f"<li>Step {i}: iterate over the list and print each value</li>" for i in range(12)) + """</ul>
+          <pre><code>for item in items:\n    print(item)</code></pre>
+          <div class="share-bar">Share this lesson</div>
+        </div></body></html>""",
+    "lesson_table": """<html><body><div class="lesson-content">
+        <table>""" + "".join(f"<tr><td>term {i}</td><td>definition of term {i} in a few words</td></tr>"
+                             for i in range(15)) + """</table>
+        <aside>Related lessons</aside></div></body></html>""",
+}
+
+
+def old_select(soup: BeautifulSoup, selectors):
+    """Selector lists as they were evaluated before select_each"""
+    return [soup.select(selector) for selector in selectors]
+
+
+def old_clean_content(extractor: ContentExtractor, soup: BeautifulSoup) -> BeautifulSoup:
+    """The copy-and-find_all cleaner that _clean_content replaced"""
+    clean_soup = copy(soup)
+    for tag in extractor.elements_to_remove:
+        for element in clean_soup.find_all(tag):
+            element.decompose()
+    for class_name in extractor.non_content_cases:
+        for element in clean_soup.find_all(class_=re.compile(class_name, re.I)):
+            element.decompose()
+        for element in clean_soup.find_all(id=re.compile(class_name, re.I)):
+            element.decompose()
+    for element in clean_soup.find_all():
+        if not element.get_text(strip=True) and not element.find_all():
+            element.decompose()
+    return clean_soup
+
+
+def old_main_content_text(extractor: ContentExtractor, soup: BeautifulSoup) -> str:
+    """extract_main_content text with the old cleaner, selectors and parser"""
+    clean_soup = old_clean_content(extractor, soup)
+    containers = [el for elements in old_select(clean_soup, CONTENT_SELECTORS)
+                  for el in elements if len(el.get_text(strip=True)) > 50]
+    if not containers:
+        containers = [p for p in clean_soup.find_all("p") if len(p.get_text(strip=True)) > 40]
+        if len(containers) < 3:
+            return ""
+    combined = BeautifulSoup("", "html.parser")
+    for container in containers:
+        combined.append(container)
+    return combined.get_text(" ", strip=True)
+
+
+class SelectorParityTests(SimpleTestCase):
+    """select_each must return exactly what one select() per selector did"""
+
+    selectors = CODE_SELECTORS + COMMON_CONTENT_SELECTORS + CONTENT_SELECTORS + [
+        "ul > li", "a:-soup-contains('Next')", "div.share button", "[data-lang*='j']"
+    ]
+
+    def test_same_elements_in_same_order(self):
+        for parser in PARSERS:
+            for name, html in DOCUMENTS.items():
+                with self.subTest(parser=parser, document=name):
+                    soup = parse_html(html, parser)
+                    expected = old_select(soup, self.selectors)
+                    actual = select_each(soup, self.selectors)
+                    self.assertEqual(len(expected), len(actual))
+                    for selector, old, new in zip(self.selectors, expected, actual):
+                        self.assertEqual([id(el) for el in old], [id(el) for el in new], selector)
+
+
+class CleanerParityTests(SimpleTestCase):
+    """The single-pass cleaner must keep the same text as the old one"""
+
+    def setUp(self):
+        self.extractor = ContentExtractor(ContentCleaner())
+
+    def test_cleaned_text_matches(self):
+        for parser in PARSERS:
+            for name, html in DOCUMENTS.items():
+                with self.subTest(parser=parser, document=name):
+                    old = old_clean_content(self.extractor, parse_html(html, parser))
+                    new = self.extractor._clean_content(parse_html(html, parser))
+                    self.assertEqual(old.get_text(" ", strip=True), new.get_text(" ", strip=True))
+
+    def test_main_content_matches_old_pipeline(self):
+        for name, html in DOCUMENTS.items():
+            with self.subTest(document=name):
+                expected = old_main_content_text(self.extractor, BeautifulSoup(html, "html.parser"))
+                for parser in PARSERS:
+                    content = self.extractor.extract_main_content(parse_html(html, parser))
+                    actual = content.get_text(" ", strip=True) if content else ""
+                    self.assertEqual(expected, actual, parser)
+
+    def test_code_examples_match_old_pipeline(self):
+        for name, html in DOCUMENTS.items():
+            with self.subTest(document=name):
+                soup = BeautifulSoup(html, "html.parser")
+                expected = [
+                    code for blocks in old_select(soup, self.extractor.code_selectors)
+                    for code in (self.extractor.cleaner.clean_code(b.get_text(strip=True)) for b in blocks)
+                    if code
+                ]
+                for parser in PARSERS:
+                    actual = self.extractor.extract_code_examples(parse_html(html, parser))
+                    self.assertEqual(expected, actual, parser)
+
+
+class PageContentFallbackParityTests(SimpleTestCase):
+    """extract_page_content falls back to the same container text as before in-place cleaning"""
+
+    url = "https://example.com/python/tutorial/loops"
+
+    def setUp(self):
+        self.processor = PageProcessor()
+
+    def old_text(self, html: str) -> str:
+        extractor = self.processor.extractor
+        self.assertEqual(old_main_content_text(extractor, BeautifulSoup(html, "html.parser")), "")
+        soup = BeautifulSoup(html, "html.parser")
+        for selector in self.processor.common_content_selectors:
+            elements = soup.select(selector)
+            if elements and elements[0].get_text().strip():
+                return self.processor.cleaner.clean_text(elements[0].get_text())
+        return ""
+
+    def test_fallback_text_matches(self):
+        for name, html in FALLBACK_DOCUMENTS.items():
+            with self.subTest(document=name):
+                expected = self.old_text(html)
+                self.assertTrue(expected)
+                for parser in PARSERS:
+                    content = self.processor.extract_page_content(parse_html(html, parser), self.url)
+                    self.assertIsNotNone(content, parser)
+                    self.assertEqual(expected, content.text, parser)
@@ -0,0 +1,269 @@
+import asyncio
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from course_gen.services import browser_pool
+from course_gen.services.browser_pool import BrowserPool
+from course_gen.services.extraction_pool import ExtractionPool
+from course_gen.services.http_fetcher import AsyncHTTPFetcher
+from course_gen.services.scheduler import PolitenessScheduler
+from course_gen.utils.loop_state import LoopLocal, SharedSemaphore
+
+
+def run_in_threads(*coroutine_factories):
+    """Run each coroutine with asyncio.run in its own thread, as concurrent requests do"""
+    errors = []
+
+    def target(factory):
+        try:
+            asyncio.run(factory())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target, args=(factory,), daemon=True)
+               for factory in coroutine_factories]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+        if thread.is_alive():
+            errors.append(TimeoutError("request thread did not finish"))
+    return errors
+
+
+class LoopBound:
+    """Fake Playwright object that fails when used from another loop"""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    def check(self):
+        assert self.loop is asyncio.get_running_loop(), "used from another event loop"
+
+
+class FakePage(LoopBound):
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        self.check()
+
+    async def close(self):
+        self.check()
+        self.closed = True
+
+
+class FakeContext(LoopBound):
+    async def add_init_script(self, script):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.check()
+
+
+class FakeBrowser(LoopBound):
+    launched = []
+
+    def __init__(self):
+        super().__init__()
+        FakeBrowser.launched.append(self)
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+    async def close(self):
+        self.check()
+        self.closed = True
+
+
+class InFlight:
+    """Tracks how many holders overlap"""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    async def hold(self, seconds):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        await asyncio.sleep(seconds)
+        with self.lock:
+            self.current -= 1
+
+
+class FakeRateController:
+    def delay_for(self, url):
+        return 0.0
+
+    def blocked_until(self, url):
+        return 0.0
+
+
+class FakeURLManager:
+    class circuit_breaker:
+        @staticmethod
+        def allow(domain):
+            return True
+
+
+class FakePlaywrightManager:
+    class Playwright:
+        class chromium:
+            @staticmethod
+            async def launch(**kwargs):
+                return FakeBrowser()
+
+    async def start(self):
+        return self.Playwright()
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class LoopLocalTests(SimpleTestCase):
+    def test_one_value_per_loop(self):
+        local = LoopLocal(dict)
+        seen = []
+
+        async def use():
+            value = local.get()
+            self.assertIs(value, local.get())
+            seen.append(value)
+
+        asyncio.run(use())
+        asyncio.run(use())
+        self.assertEqual(len(seen), 2)
+        self.assertIsNot(seen[0], seen[1])
+
+
+class SharedSemaphoreTests(SimpleTestCase):
+    def test_limit_holds_across_loops(self):
+        semaphore = SharedSemaphore(2)
+        in_flight = InFlight()
+
+        async def job():
+            await asyncio.gather(*(self._hold(semaphore, in_flight) for _ in range(4)))
+
+        self.assertEqual(run_in_threads(job, job, job), [])
+        self.assertEqual(in_flight.peak, 2)
+
+    async def _hold(self, semaphore, in_flight):
+        async with semaphore:
+            await in_flight.hold(0.02)
+
+    def test_cancelled_waiter_does_not_leak_a_permit(self):
+        semaphore = SharedSemaphore(1)
+
+        async def job():
+            await semaphore.acquire()
+            waiter = asyncio.ensure_future(semaphore.acquire())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            semaphore.release()
+            await asyncio.wait_for(semaphore.acquire(), timeout=1)
+            semaphore.release()
+
+        asyncio.run(job())
+        self.assertEqual(semaphore._value, 1)
+
+
+class SchedulerLoopTests(SimpleTestCase):
+    def test_domain_is_serialized_across_loops(self):
+        scheduler = PolitenessScheduler(FakeURLManager(), max_concurrency=4,
+                                        rate_controller=FakeRateController())
+        in_flight = InFlight()
+
+        async def job():
+            for path in ("a", "b", "c"):
+                async with scheduler.slot(f"https://www.example.com/{path}"):
+                    await in_flight.hold(0.02)
+
+        self.assertEqual(run_in_threads(job, job, job), [])
+        self.assertEqual(in_flight.peak, 1)
+
+
+class BrowserPoolLoopTests(SimpleTestCase):
+    def setUp(self):
+        self._real_playwright = browser_pool.async_playwright
+        browser_pool.async_playwright = FakePlaywrightManager
+        FakeBrowser.launched = []
+
+    def tearDown(self):
+        browser_pool.async_playwright = self._real_playwright
+
+    def test_concurrent_loops_keep_their_own_browsers(self):
+        pool = BrowserPool(size=1)
+        first_inside = threading.Event()
+
+        async def job(pages, wait_for_other):
+            async with pool:
+                first_inside.set()
+                if wait_for_other:
+                    await asyncio.to_thread(first_inside.wait, 5)
+                for _ in range(pages):
+                    async with pool.page("https://example.com/") as page:
+                        page.check()
+                        await asyncio.sleep(0.01)
+
+        errors = run_in_threads(lambda: job(5, False), lambda: job(3, True))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(FakeBrowser.launched), 2)
+        self.assertTrue(all(browser.closed for browser in FakeBrowser.launched))
+        self.assertEqual(pool._loops.values(), [])
+
+
+class HTTPFetcherLoopTests(SimpleTestCase):
+    def test_each_loop_has_its_own_session(self):
+        fetcher = AsyncHTTPFetcher()
+        sessions = []
+        both_inside = threading.Barrier(2, timeout=5)
+
+        async def job(hold):
+            async with fetcher:
+                session = fetcher._get_session()
+                sessions.append(session)
+                await asyncio.to_thread(both_inside.wait)
+                await asyncio.sleep(hold)
+                self.assertFalse(session.closed)
+                self.assertIs(fetcher._get_session(), session)
+
+        self.assertEqual(run_in_threads(lambda: job(0.0), lambda: job(0.05)), [])
+        self.assertEqual(len(sessions), 2)
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertTrue(all(session.closed for session in sessions))
+
+
+class ExtractionPoolLoopTests(SimpleTestCase):
+    def test_pending_limit_holds_across_loops(self):
+        pool = ExtractionPool(max_workers=0, max_pending=2)
+        counter = InFlight()
+
+        def extract(seconds):
+            with counter.lock:
+                counter.current += 1
+                counter.peak = max(counter.peak, counter.current)
+            time.sleep(seconds)
+            with counter.lock:
+                counter.current -= 1
+
+        async def job():
+            await asyncio.gather(*(pool.run(extract, 0.02) for _ in range(3)))
+
+        self.assertEqual(run_in_threads(job, job, job), [])
+        self.assertEqual(counter.peak, 2)
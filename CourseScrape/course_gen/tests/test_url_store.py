@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import tempfile
+
+from django.test import SimpleTestCase
+
+from course_gen.utils.url_store import URLStateStore, STATUS_SCRAPED
+
+
+class FlakyWrites:
+    """Makes the first `failures` writes of `key` raise like a busy database"""
+
+    def __init__(self, store, failures, key):
+        self.failures = failures
+        self.key = key
+        self.real = store._execute_write
+
+    def __call__(self, conn, item):
+        if item[1][0] == self.key and self.failures > 0:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        self.real(conn, item)
+
+
+class WriteRetryTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "url_state.db")
+        self.store = URLStateStore(self.db_path, retry_delay=0.01, write_retries=3)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def committed(self, key):
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT status FROM url_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def test_busy_database_is_retried(self):
+        calls = []
+        self.store._execute_write = FlakyWrites(self.store, 2, "https://example.com/b")
+
+        self.store.mark("https://example.com/a", STATUS_SCRAPED)
+        future = self.store.run_in_writer(calls.append, "deferred")
+        self.store.mark("https://example.com/b", STATUS_SCRAPED)
+        self.store.flush()
+        self.assertIsNone(future.result(timeout=1))
+
+        self.assertEqual(self.committed("https://example.com/a"), STATUS_SCRAPED)
+        self.assertEqual(self.committed("https://example.com/b"), STATUS_SCRAPED)
+        self.assertEqual(calls, ["deferred"])
+
+    def test_batch_is_dropped_after_repeated_failures(self):
+        self.store._execute_write = FlakyWrites(self.store, 100, "https://example.com/a")
+
+        self.store.mark("https://example.com/a", STATUS_SCRAPED)
+        future = self.store.run_in_writer(len, "never runs")
+        with self.assertLogs("course_gen.utils.url_store", level="ERROR"):
+            self.store.flush()
+        self.assertIsInstance(future.exception(timeout=1), sqlite3.OperationalError)
+
+        self.assertIsNone(self.committed("https://example.com/a"))
+        # Reads still see the write through the overlay
+        self.assertEqual(self.store.get_status("https://example.com/a"), STATUS_SCRAPED)
+
+
+class RunInWriterTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = URLStateStore(os.path.join(self.tmp.name, "url_state.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_call_sees_earlier_writes_and_returns_its_result(self):
+        self.store.save_recrawl("https://example.com/a", {"url": "https://example.com/a", "next_check": 0})
+        future = self.store.run_in_writer(self.store.load_recrawl, "https://example.com/a")
+        self.assertEqual(future.result(timeout=5)["url"], "https://example.com/a")
@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase
+
+from course_gen.utils.url_utils import canonicalize_url, canonical_domain, clean_url
+
+
+class CanonicalizeURLTests(SimpleTestCase):
+    def test_variants_share_one_key(self):
+        self.assertEqual(canonicalize_url("http://www.Example.com:80/docs/?b=2&a=1&utm_source=x#top"),
+                         "https://example.com/docs?a=1&b=2")
+        self.assertEqual(canonical_domain("https://www.example.com:443/a"), "example.com")
+
+    def test_content_parameters_are_kept(self):
+        self.assertEqual(canonicalize_url("https://example.com/list?ref=v2&source=rss&fbclid=1"),
+                         "https://example.com/list?ref=v2&source=rss")
+        self.assertNotEqual(canonicalize_url("https://example.com/doc?ref=a"),
+                            canonicalize_url("https://example.com/doc?ref=b"))
+
+    def test_malformed_ports_do_not_raise(self):
+        self.assertEqual(canonicalize_url("http://www.example.com:99999/a/"), "https://example.com:99999/a")
+        self.assertEqual(canonicalize_url("http://example.com:abc/a"), "https://example.com:abc/a")
+        self.assertEqual(canonical_domain("http://example.com:99999/"), "example.com:99999")
+
+    def test_unparseable_urls_are_returned_as_given(self):
+        self.assertEqual(canonicalize_url("http://[::1/x"), "http://[::1/x")
+        self.assertEqual(clean_url("http://[::1/x"), "http://[::1/x")
+        self.assertEqual(canonical_domain("http://[::1/x"), "")
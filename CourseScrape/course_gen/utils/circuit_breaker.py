@@ -0,0 +1,146 @@
+from course_gen.core.globals import (
+    time, logging, dataclass, asdict, Dict, Optional, Tuple
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Error category -> (consecutive failures that open the circuit,
+#                    first open window in seconds, longest open window)
+ERROR_CATEGORIES: Dict[str, Tuple[int, float, float]] = {
+    "network": (3, 60, 6 * 3600),               # timeouts, DNS, resets
+    "server": (3, 120, 6 * 3600),               # 5xx responses
+    "blocked": (1, 600, 24 * 3600),             # 403/429 and bot walls
+    "content": (5, 300, 24 * 3600),             # pages with nothing extractable
+    "paywall": (1, 24 * 3600, 30 * 24 * 3600),  # paywalls and login walls
+    "error": (3, 300, 24 * 3600),               # anything else
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its domain's circuit is open"""
+    pass
+
+
+@dataclass
+class BreakerState:
+    """Circuit state for one domain"""
+    state: str = STATE_CLOSED
+    failures: int = 0
+    trips: int = 0
+    category: str = ""
+    retry_at: float = 0.0
+    probe_started: float = 0.0
+
+
+class DomainCircuitBreaker:
+    """
+    Per-domain circuit breaker replacing permanent domain bans.
+
+    Closed domains are scraped normally. Consecutive failures of one
+    category open the circuit for that category's window, doubling on every
+    re-trip. Once the window passes the domain goes half-open and admits a
+    single probe request: success closes the circuit, failure re-opens it
+    for longer. State is persisted in the URLStateStore so breakers survive
+    restarts.
+    """
+
+    def __init__(self, state_store=None, probe_timeout: float = 300):
+        self.state_store = state_store
+        self.probe_timeout = probe_timeout
+        self._breakers: Optional[Dict[str, BreakerState]] = None
+
+    def _all(self) -> Dict[str, BreakerState]:
+        if self._breakers is None:
+            self._breakers = {}
+            if self.state_store is not None:
+                try:
+                    for domain, data in self.state_store.load_breakers().items():
+                        self._breakers[domain] = BreakerState(**data)
+                except Exception as e:
+                    logger.warning(f"Could not load circuit breakers: {str(e)}")
+        return self._breakers
+
+    def _get(self, domain: str) -> BreakerState:
+        return self._all().setdefault(domain, BreakerState())
+
+    def _save(self, domain: str, breaker: BreakerState) -> None:
+        if self.state_store is not None:
+            self.state_store.save_breaker(domain, asdict(breaker))
+
+    def state(self, domain: str) -> str:
+        breaker = self._all().get(domain)
+        return breaker.state if breaker else STATE_CLOSED
+
+    def is_open(self, domain: str) -> bool:
+        """Whether requests to the domain would currently be refused (claims nothing)"""
+        breaker = self._all().get(domain)
+        if breaker is None or breaker.state == STATE_CLOSED:
+            return False
+
+        now = time.time()
+        if breaker.state == STATE_OPEN and now < breaker.retry_at:
+            return True
+        return bool(breaker.probe_started) and now - breaker.probe_started < self.probe_timeout
+
+    def allow(self, domain: str) -> bool:
+        """
+        Whether a request to the domain may go ahead. When half-open this
+        claims the single probe, so call it right before the actual fetch.
+        """
+        breaker = self._all().get(domain)
+        if breaker is None or breaker.state == STATE_CLOSED:
+            return True
+
+        now = time.time()
+        if breaker.state == STATE_OPEN:
+            if now < breaker.retry_at:
+                return False
+            breaker.state = STATE_HALF_OPEN
+            breaker.probe_started = 0.0
+
+        # Half-open: one probe at a time; a probe that never reported back expires
+        if breaker.probe_started and now - breaker.probe_started < self.probe_timeout:
+            return False
+        breaker.probe_started = now
+        logger.info(f"Probing {domain} after {breaker.category} failures")
+        return True
+
+    def record_success(self, domain: str) -> None:
+        breaker = self._all().get(domain)
+        if breaker is None or (breaker.state == STATE_CLOSED and breaker.failures == 0):
+            return
+
+        if breaker.state != STATE_CLOSED:
+            logger.info(f"Circuit for {domain} closed after successful probe")
+        self._breakers[domain] = BreakerState()
+        self._save(domain, self._breakers[domain])
+
+    def record_failure(self, domain: str, category: str = "error") -> None:
+        threshold, base_window, max_window = ERROR_CATEGORIES.get(category, ERROR_CATEGORIES["error"])
+        breaker = self._get(domain)
+
+        if breaker.category != category and breaker.state == STATE_CLOSED:
+            breaker.failures = 0
+        breaker.category = category
+        breaker.failures += 1
+
+        if breaker.state == STATE_HALF_OPEN or breaker.failures >= threshold:
+            window = min(base_window * (2 ** breaker.trips), max_window)
+            breaker.state = STATE_OPEN
+            breaker.trips += 1
+            breaker.retry_at = time.time() + window
+            breaker.probe_started = 0.0
+            logger.warning(f"Circuit for {domain} opened for {window:.0f}s ({category}, trip {breaker.trips})")
+
+        self._save(domain, breaker)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Breakers that are not fully closed"""
+        return {
+            domain: asdict(breaker) for domain, breaker in self._all().items()
+            if breaker.state != STATE_CLOSED or breaker.failures
+        }
@@ -0,0 +1,203 @@
+from course_gen.core.globals import (
+    time, json, uuid, logging, sqlite3, Lock, Dict, List, Optional, Tuple, Iterable
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+
+URL_PENDING = "pending"
+URL_DONE = "done"
+URL_FAILED = "failed"
+
+KIND_TOPIC = "topic"
+KIND_LINK = "link"
+
+
+class CrawlJobStore:
+    """
+    SQLite (WAL) store for resumable crawl jobs.
+
+    A job keeps its source configuration, a frontier of URLs with a status
+    each, and the items extracted so far. Runners write checkpoints: one
+    transaction marks a batch of URLs done or failed, adds the links they
+    discovered and stores their items, so after a crash every URL is either
+    done with its item saved or still pending.
+    """
+
+    def __init__(self, db_path: str = "crawl_jobs.db"):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_jobs (
+                        job_id TEXT PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        config TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        updated_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_frontier (
+                        job_id TEXT NOT NULL,
+                        url TEXT NOT NULL,
+                        kind TEXT NOT NULL,
+                        source TEXT NOT NULL,
+                        topic TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        error TEXT,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (job_id, url)
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS crawl_frontier_status ON crawl_frontier (job_id, status)")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_items (
+                        job_id TEXT NOT NULL,
+                        url TEXT NOT NULL,
+                        data TEXT NOT NULL,
+                        PRIMARY KEY (job_id, url)
+                    )
+                """)
+                conn.commit()
+                self._conn = conn
+        return self._conn
+
+    def create_job(self, name: str, config: Dict) -> str:
+        """Register a new running job and return its id"""
+        conn = self._get_conn()
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            conn.execute(
+                "INSERT INTO crawl_jobs VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, name, JOB_RUNNING, json.dumps(config), now, now)
+            )
+            conn.commit()
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        conn = self._get_conn()
+        with self._lock:
+            row = conn.execute(
+                "SELECT job_id, name, status, config, created_at, updated_at FROM crawl_jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        return self._job_dict(row) if row else None
+
+    def latest_unfinished(self, name: str) -> Optional[Dict]:
+        """Most recent job with this name that has not completed"""
+        conn = self._get_conn()
+        with self._lock:
+            row = conn.execute(
+                "SELECT job_id, name, status, config, created_at, updated_at FROM crawl_jobs "
+                "WHERE name = ? AND status != ? ORDER BY created_at DESC LIMIT 1",
+                (name, JOB_COMPLETED)
+            ).fetchone()
+        return self._job_dict(row) if row else None
+
+    @staticmethod
+    def _job_dict(row: Tuple) -> Dict:
+        return {
+            "job_id": row[0], "name": row[1], "status": row[2],
+            "config": json.loads(row[3]), "created_at": row[4], "updated_at": row[5]
+        }
+
+    def set_status(self, job_id: str, status: str) -> None:
+        conn = self._get_conn()
+        with self._lock:
+            conn.execute(
+                "UPDATE crawl_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                (status, time.time(), job_id)
+            )
+            conn.commit()
+
+    def add_urls(self, job_id: str, entries: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Add (url, kind, source, topic) entries to the frontier, ignoring known URLs"""
+        conn = self._get_conn()
+        now = time.time()
+        with self._lock:
+            conn.executemany(
+                "INSERT OR IGNORE INTO crawl_frontier VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                [(job_id, url, kind, source, topic, URL_PENDING, now) for url, kind, source, topic in entries]
+            )
+            conn.commit()
+
+    def pending(self, job_id: str, kind: Optional[str] = None) -> List[Dict]:
+        """Frontier entries still to be crawled"""
+        conn = self._get_conn()
+        query = "SELECT url, kind, source, topic FROM crawl_frontier WHERE job_id = ? AND status = ?"
+        params: Tuple = (job_id, URL_PENDING)
+        if kind is not None:
+            query += " AND kind = ?"
+            params += (kind,)
+        with self._lock:
+            rows = conn.execute(query, params).fetchall()
+        return [{"url": r[0], "kind": r[1], "source": r[2], "topic": r[3]} for r in rows]
+
+    def retry_failed(self, job_id: str) -> int:
+        """Put failed URLs back in the frontier; returns how many"""
+        conn = self._get_conn()
+        with self._lock:
+            cursor = conn.execute(
+                "UPDATE crawl_frontier SET status = ?, error = NULL WHERE job_id = ? AND status = ?",
+                (URL_PENDING, job_id, URL_FAILED)
+            )
+            conn.commit()
+        return cursor.rowcount
+
+    def checkpoint(self, job_id: str, results: List[Tuple[str, str, str]],
+                   items: List[Tuple[str, Dict]],
+                   discovered: List[Tuple[str, str, str, str]]) -> None:
+        """
+        Atomically record finished URLs as (url, status, error), their extracted
+        (url, item) pairs and newly discovered (url, kind, source, topic) entries.
+        """
+        conn = self._get_conn()
+        now = time.time()
+        with self._lock:
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO crawl_frontier VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                    [(job_id, url, kind, source, topic, URL_PENDING, now) for url, kind, source, topic in discovered]
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO crawl_items VALUES (?, ?, ?)",
+                    [(job_id, url, json.dumps(item, ensure_ascii=False)) for url, item in items]
+                )
+                conn.executemany(
+                    "UPDATE crawl_frontier SET status = ?, error = ?, updated_at = ? WHERE job_id = ? AND url = ?",
+                    [(status, error, now, job_id, url) for url, status, error in results]
+                )
+                conn.execute("UPDATE crawl_jobs SET updated_at = ? WHERE job_id = ?", (now, job_id))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def items(self, job_id: str) -> List[Dict]:
+        """Every item extracted by the job so far"""
+        conn = self._get_conn()
+        with self._lock:
+            rows = conn.execute("SELECT data FROM crawl_items WHERE job_id = ? ORDER BY rowid", (job_id,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        """Frontier URL counts by status"""
+        conn = self._get_conn()
+        with self._lock:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM crawl_frontier WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall()
+        return {status: count for status, count in rows}
@@ -0,0 +1,114 @@
+from course_gen.core.globals import (
+    urlparse, dataclass, field, Dict, List, Optional, Tuple
+)
+
+
+@dataclass(frozen=True)
+class DomainRule:
+    """Everything URLManager needs to know about a host"""
+    trusted: bool = False
+    avoid: bool = False
+    delay: Tuple[float, float] = (5, 10)
+    priority: int = 0
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    trusted: Optional[bool] = None
+    avoid: Optional[bool] = None
+    delay: Optional[Tuple[float, float]] = None
+    priority: Optional[int] = None
+
+
+class DomainRuleIndex:
+    """
+    Compiled trust/avoid/delay rules keyed by domain suffix.
+
+    Rules are stored in a trie of reversed host labels, so "python.org"
+    matches "docs.python.org" but not "notpython.org", and a lookup costs
+    one step per label of the host regardless of how many rules exist.
+    The most specific matching rule wins for each attribute.
+
+    Entries without a dot (e.g. "pinterest") are brand rules that match
+    any host containing that label, such as pinterest.com or pinterest.co.uk.
+    """
+
+    def __init__(self, default_delay: Tuple[float, float] = (5, 10), default_priority: int = 0):
+        self.default_delay = default_delay
+        self.default_priority = default_priority
+        self._root = _TrieNode()
+        self._label_rules: Dict[str, _TrieNode] = {}
+
+    @classmethod
+    def from_config(cls, trusted_domains: Dict[str, Tuple[float, float]], avoid_domains: List[str],
+                    default_delay: Tuple[float, float] = (5, 10)) -> "DomainRuleIndex":
+        """Build an index from URLManager's trusted_domains / avoid_domains settings"""
+        index = cls(default_delay=default_delay, default_priority=len(trusted_domains))
+        for priority, (domain, delay) in enumerate(trusted_domains.items()):
+            index.add(domain, trusted=True, delay=delay, priority=priority)
+        for domain in avoid_domains:
+            index.add(domain, avoid=True)
+        return index
+
+    @staticmethod
+    def normalize_host(host: str) -> str:
+        return host.strip().lower().split(":", 1)[0].rstrip(".")
+
+    def add(self, domain: str, trusted: Optional[bool] = None, avoid: Optional[bool] = None,
+            delay: Optional[Tuple[float, float]] = None, priority: Optional[int] = None) -> None:
+        """Add or update the rule for a domain suffix"""
+        domain = self.normalize_host(domain)
+        if "." in domain:
+            node = self._root
+            for label in reversed(domain.split(".")):
+                node = node.children.setdefault(label, _TrieNode())
+        else:
+            node = self._label_rules.setdefault(domain, _TrieNode())
+
+        # Duplicate entries keep the first (highest) priority
+        if trusted is not None:
+            node.trusted = trusted
+        if avoid is not None:
+            node.avoid = avoid
+        if delay is not None:
+            node.delay = delay
+        if priority is not None and node.priority is None:
+            node.priority = priority
+
+    def _matching_nodes(self, host: str) -> List[_TrieNode]:
+        """Matching rule nodes, least specific first"""
+        labels = host.split(".")
+        nodes = [self._label_rules[label] for label in labels if label in self._label_rules]
+
+        node = self._root
+        for label in reversed(labels):
+            node = node.children.get(label)
+            if node is None:
+                break
+            nodes.append(node)
+        return nodes
+
+    def lookup_host(self, host: str) -> DomainRule:
+        trusted, avoid = False, False
+        delay, priority = self.default_delay, self.default_priority
+
+        for node in self._matching_nodes(self.normalize_host(host)):
+            if node.trusted is not None:
+                trusted = node.trusted
+            if node.avoid is not None:
+                avoid = node.avoid
+            if node.delay is not None:
+                delay = node.delay
+            if node.priority is not None:
+                priority = node.priority
+
+        return DomainRule(trusted=trusted, avoid=avoid, delay=delay, priority=priority)
+
+    def lookup(self, url: str) -> DomainRule:
+        """Rule for the host of a URL"""
+        try:
+            host = urlparse(url).hostname or ""
+        except ValueError:
+            host = ""
+        return self.lookup_host(host)
@@ -1,7 +1,9 @@
 from course_gen.core.globals import (
-    os, logging, json, Dict, Set, List, Optional, Union, Lock, re
+    os, logging, json, Dict, Set, List, Optional, Union, Lock, re, Tuple
 )
 
+from course_gen.utils.near_duplicates import NearDuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 class FileManager:
@@ -9,6 +11,9 @@ class FileManager:
     
     _instance = None
     _lock = Lock()
+    
+    # Near-duplicate index per knowledge base, valid while the file is unchanged
+    _dedup_indexes: Dict[str, Tuple[float, int, NearDuplicateIndex]] = {}
 
     def __new__(cls):
         """Singleton pattern to ensure thread-safe access."""
@@ -18,8 +23,15 @@ class FileManager:
         return cls._instance
 
     @staticmethod
-    def save_to_knowledge_base(new_data: List[Dict], file_path: str = "knowledge_base.json") -> None:
-        """Append new data to a JSON knowledge base file."""
+    def save_to_knowledge_base(new_data: List[Dict], file_path: str = "knowledge_base.json",
+                               on_duplicate: str = "merge") -> None:
+        """
+        Append new data to a JSON knowledge base file.
+        
+        Items whose content is a near-duplicate of an existing item (mirrors,
+        syndicated copies, repeated pagination text) are merged into that item
+        with on_duplicate="merge", or dropped with on_duplicate="skip".
+        """
         with FileManager._lock:
             try:
                 existing_data = []
@@ -27,14 +39,96 @@ class FileManager:
                     with open(file_path, "r", encoding="utf-8") as f:
                         existing_data = json.load(f) if os.path.getsize(file_path) > 0 else []
                 
-                combined_data = existing_data + new_data
+                index = FileManager._get_dedup_index(file_path, existing_data)
+                added, duplicates = 0, 0
+                for item in new_data:
+                    signature = index.signature(item.get("content", ""))
+                    duplicate_of = index.query(signature)
+                    if duplicate_of is None:
+                        existing_data.append(item)
+                        index.add(len(existing_data) - 1, signature)
+                        added += 1
+                        continue
+                    
+                    duplicates += 1
+                    logger.info(f"Near-duplicate of {existing_data[duplicate_of].get('url', '')}: {item.get('url', '')}")
+                    if on_duplicate == "merge" and FileManager._merge_duplicate(existing_data[duplicate_of], item):
+                        index.add(duplicate_of, signature)
+                
                 with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(combined_data, f, indent=4, ensure_ascii=False)
-                logger.info(f"Saved {len(new_data)} items to {file_path}")
+                    json.dump(existing_data, f, indent=4, ensure_ascii=False)
+                FileManager._dedup_indexes[os.path.abspath(file_path)] = (
+                    os.path.getmtime(file_path), len(existing_data), index
+                )
+                logger.info(f"Saved {added} items to {file_path} ({duplicates} near-duplicates, on_duplicate={on_duplicate})")
             except Exception as e:
                 logger.error(f"Failed to save knowledge: {str(e)}")
                 raise
 
+    @staticmethod
+    def update_knowledge_base(updated: List[Dict], file_path: str = "knowledge_base.json") -> None:
+        """Replace knowledge base items that share a URL with the updated items, appending the rest"""
+        with FileManager._lock:
+            try:
+                existing_data = []
+                if os.path.exists(file_path):
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        existing_data = json.load(f) if os.path.getsize(file_path) > 0 else []
+                
+                positions = {item.get("url"): i for i, item in enumerate(existing_data) if item.get("url")}
+                replaced = 0
+                for item in updated:
+                    position = positions.get(item.get("url"))
+                    if position is None:
+                        existing_data.append(item)
+                    else:
+                        # Keep extra fields gathered since (mirror_urls, merged code)
+                        existing_data[position] = {**existing_data[position], **item}
+                        replaced += 1
+                
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(existing_data, f, indent=4, ensure_ascii=False)
+                
+                # Changed content invalidates the near-duplicate index
+                FileManager._dedup_indexes.pop(os.path.abspath(file_path), None)
+                logger.info(f"Updated {replaced} items in {file_path} ({len(updated) - replaced} added)")
+            except Exception as e:
+                logger.error(f"Failed to update knowledge: {str(e)}")
+                raise
+
+    @staticmethod
+    def _get_dedup_index(file_path: str, existing_data: List[Dict]) -> NearDuplicateIndex:
+        """Reuse the index from the last save, or rebuild it if the file changed since"""
+        cached = FileManager._dedup_indexes.get(os.path.abspath(file_path))
+        if (cached is not None and os.path.exists(file_path) and
+                cached[0] == os.path.getmtime(file_path) and cached[1] == len(existing_data)):
+            return cached[2]
+        
+        index = NearDuplicateIndex()
+        for i, item in enumerate(existing_data):
+            index.add(i, index.signature(item.get("content", "")))
+        return index
+
+    @staticmethod
+    def _merge_duplicate(existing: Dict, new: Dict) -> bool:
+        """Fold a near-duplicate into the existing item; True if its content was replaced"""
+        code_examples = existing.setdefault("code_examples", [])
+        for code in new.get("code_examples", []):
+            if code not in code_examples:
+                code_examples.append(code)
+        
+        if new.get("url") and new.get("url") != existing.get("url"):
+            mirror_urls = existing.setdefault("mirror_urls", [])
+            if new["url"] not in mirror_urls:
+                mirror_urls.append(new["url"])
+        
+        # Keep the most complete copy of the text
+        if len(new.get("content", "")) > len(existing.get("content", "")):
+            existing["content"] = new["content"]
+            existing["title"] = new.get("title", existing.get("title", ""))
+            return True
+        return False
+
     @staticmethod
     def load_knowledge(file_path: str = "knowledge_base.json") -> List[Dict]:
         """Load JSON data from file with validation."""
@@ -0,0 +1,132 @@
+from course_gen.core.globals import (
+    os, re, logging, BeautifulSoup, Tag, Callable, Dict, List, Optional
+)
+from bs4.builder import builder_registry
+
+from course_gen.core import HTML_PARSERS
+
+logger = logging.getLogger(__name__)
+
+_parser_name: Optional[str] = None
+
+
+def available_parsers() -> list:
+    """Configured tree builders that are installed, in order of preference"""
+    return [name for name in HTML_PARSERS if builder_registry.lookup(name) is not None]
+
+
+def get_parser_name() -> str:
+    """
+    Tree builder used for every page parse.
+
+    Picks the first installed entry of HTML_PARSERS (lxml, then the pure
+    Python html.parser); the HTML_PARSER environment variable overrides it.
+    """
+    global _parser_name
+    if _parser_name is None:
+        requested = os.environ.get("HTML_PARSER")
+        if requested and builder_registry.lookup(requested) is None:
+            logger.warning(f"HTML parser {requested} is not installed, falling back")
+            requested = None
+
+        _parser_name = requested or (available_parsers() or ["html.parser"])[0]
+        logger.info(f"Using {_parser_name} to parse HTML")
+    return _parser_name
+
+
+def set_parser_name(name: Optional[str]) -> None:
+    """Force a tree builder (None re-runs auto-detection)"""
+    global _parser_name
+    if name is not None and builder_registry.lookup(name) is None:
+        raise ValueError(f"HTML parser {name} is not installed")
+    _parser_name = name
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse a document with the selected backend"""
+    return BeautifulSoup(html or "", parser or get_parser_name())
+
+
+# tag, .class, #id, [attr] and [attr*='value'], optionally prefixed by a tag name
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?"
+    r"(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)"
+    r"|\[(?P<attr>[\w-]+)(?:\*=(?P<quote>['\"])(?P<value>.*?)(?P=quote))?\])?$"
+)
+
+_compiled_selectors: Dict[str, Optional[List[Callable[[Tag], bool]]]] = {}
+
+
+def _compile_part(part: str) -> Optional[Callable[[Tag], bool]]:
+    match = _SIMPLE_SELECTOR.match(part)
+    if not match or not any(match.group(g) for g in ("tag", "cls", "id", "attr")):
+        return None
+
+    tag, cls, element_id = match.group("tag"), match.group("cls"), match.group("id")
+    attr, value = match.group("attr"), match.group("value")
+    tag = tag.lower() if tag else None
+
+    def matches(element: Tag) -> bool:
+        if tag and element.name != tag:
+            return False
+        if cls and cls not in (element.get("class") or ()):
+            return False
+        if element_id and element.get("id") != element_id:
+            return False
+        if attr:
+            actual = element.get(attr)
+            if actual is None:
+                return False
+            if value is not None:
+                if not isinstance(actual, str):
+                    actual = " ".join(actual)
+                return value in actual
+        return True
+
+    return matches
+
+
+def _compile_selector(selector: str) -> Optional[List[Callable[[Tag], bool]]]:
+    """Predicates for a descendant chain of simple selectors, or None if unsupported"""
+    if selector not in _compiled_selectors:
+        parts = [_compile_part(part) for part in selector.split()]
+        _compiled_selectors[selector] = None if not parts or None in parts else parts
+    return _compiled_selectors[selector]
+
+
+def _matches_chain(element: Tag, chain: List[Callable[[Tag], bool]]) -> bool:
+    if not chain[-1](element):
+        return False
+
+    ancestor = element.parent
+    for predicate in reversed(chain[:-1]):
+        while ancestor is not None and not (isinstance(ancestor, Tag) and predicate(ancestor)):
+            ancestor = ancestor.parent
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+
+def select_each(soup: BeautifulSoup, selectors: List[str]) -> List[List[Tag]]:
+    """
+    Equivalent to [soup.select(s) for s in selectors], in one tree walk.
+
+    Simple selectors (the code and content selector lists) are compiled to
+    plain predicates, which is far cheaper than running soupsieve once per
+    selector on large pages. Anything more complex falls back to select().
+    """
+    chains = [_compile_selector(selector) for selector in selectors]
+    results: List[List[Tag]] = [[] for _ in selectors]
+
+    compiled = [(i, chain) for i, chain in enumerate(chains) if chain is not None]
+    if compiled:
+        for element in soup.find_all(True):
+            for i, chain in compiled:
+                if _matches_chain(element, chain):
+                    results[i].append(element)
+
+    for i, chain in enumerate(chains):
+        if chain is None:
+            results[i] = soup.select(selectors[i])
+    return results
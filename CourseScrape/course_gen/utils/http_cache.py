@@ -0,0 +1,176 @@
+from course_gen.core.globals import (
+    os, re, json, time, logging, hashlib, parsedate_to_datetime,
+    dataclass, field, Dict, Optional
+)
+
+from course_gen.utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Hop-by-hop / encoding headers that no longer apply to the decoded body we store
+UNCACHEABLE_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "set-cookie", "date", "age"
+}
+
+
+@dataclass
+class CachedResponse:
+    """A cached HTTP response and its freshness metadata"""
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body_hash: str = ""
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body: str = ""
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators for revalidating a stale entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "body_hash": self.body_hash,
+            "stored_at": self.stored_at,
+            "expires_at": self.expires_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified
+        }
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk HTTP response cache.
+
+    Entries are keyed by the canonical URL and point at bodies stored under
+    the SHA-256 of their content, so identical pages share one blob. Fresh
+    entries are served without touching the network; stale ones keep their
+    ETag / Last-Modified validators for a conditional request.
+    """
+
+    def __init__(self, cache_dir: str = "http_cache", default_ttl: int = 24 * 3600,
+                 max_heuristic_ttl: int = 7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self.max_heuristic_ttl = max_heuristic_ttl
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, "entries", key[:2], f"{key}.json")
+
+    def _body_path(self, body_hash: str) -> str:
+        return os.path.join(self.cache_dir, "bodies", body_hash[:2], body_hash)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL (fresh or stale), if any"""
+        try:
+            entry_path = self._entry_path(self.cache_key(url))
+            if not os.path.exists(entry_path):
+                return None
+
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = CachedResponse(**json.load(f))
+
+            with open(self._body_path(entry.body_hash), "r", encoding="utf-8") as f:
+                entry.body = f.read()
+            return entry
+        except Exception as e:
+            logger.warning(f"Cache read failed for {url}: {str(e)}")
+            return None
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: str) -> Optional[CachedResponse]:
+        """Store a response unless its headers forbid caching"""
+        headers = {k.lower(): v for k, v in headers.items()}
+        if "no-store" in headers.get("cache-control", "").lower():
+            return None
+
+        try:
+            data = body.encode("utf-8")
+            body_hash = hashlib.sha256(data).hexdigest()
+            body_path = self._body_path(body_hash)
+            if not os.path.exists(body_path):
+                self._write_atomic(body_path, data)
+
+            now = time.time()
+            entry = CachedResponse(
+                url=url,
+                status=status,
+                headers={k: v for k, v in headers.items() if k not in UNCACHEABLE_HEADERS},
+                body_hash=body_hash,
+                stored_at=now,
+                expires_at=now + self._freshness_lifetime(headers, now),
+                etag=headers.get("etag"),
+                last_modified=headers.get("last-modified"),
+                body=body
+            )
+            self._write_entry(entry)
+            return entry
+        except Exception as e:
+            logger.warning(f"Cache write failed for {url}: {str(e)}")
+            return None
+
+    def refresh(self, entry: CachedResponse, headers: Dict[str, str]) -> CachedResponse:
+        """Extend a stale entry after a 304 Not Modified"""
+        headers = {k.lower(): v for k, v in headers.items()}
+        now = time.time()
+        entry.stored_at = now
+        entry.expires_at = now + self._freshness_lifetime({**entry.headers, **headers}, now)
+        entry.etag = headers.get("etag", entry.etag)
+        entry.last_modified = headers.get("last-modified", entry.last_modified)
+
+        try:
+            self._write_entry(entry)
+        except Exception as e:
+            logger.warning(f"Cache refresh failed for {entry.url}: {str(e)}")
+        return entry
+
+    def _write_entry(self, entry: CachedResponse) -> None:
+        data = json.dumps(entry.to_dict(), ensure_ascii=False).encode("utf-8")
+        self._write_atomic(self._entry_path(self.cache_key(entry.url)), data)
+
+    def _freshness_lifetime(self, headers: Dict[str, str], now: float) -> float:
+        """Seconds a response stays fresh, following Cache-Control / Expires when present"""
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control:
+            return 0
+
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        if max_age:
+            return int(max_age.group(1))
+
+        try:
+            if headers.get("expires"):
+                return max(0, parsedate_to_datetime(headers["expires"]).timestamp() - now)
+            if headers.get("last-modified"):
+                # Heuristic freshness: 10% of the time since the last change
+                age = now - parsedate_to_datetime(headers["last-modified"]).timestamp()
+                return min(max(0, age * 0.1), self.max_heuristic_ttl)
+        except Exception:
+            pass
+
+        return self.default_ttl
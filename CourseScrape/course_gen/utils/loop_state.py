@@ -0,0 +1,106 @@
+from course_gen.core.globals import (
+    asyncio, weakref, deque, Lock, Any, Callable, List, Optional
+)
+
+
+class LoopLocal:
+    """
+    One value per running event loop, created by ``factory`` on first use.
+
+    Shared services are entered from several loops at once (every
+    asyncio.run / async_to_sync call in a request thread brings its own),
+    while Playwright, aiohttp and asyncio objects only work on the loop that
+    created them. Entries are dropped with ``discard`` or when their loop is
+    garbage collected.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._values = weakref.WeakKeyDictionary()
+        self._lock = Lock()
+
+    def get(self) -> Any:
+        """Value for the running loop, created if needed"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.get(loop)
+            if value is None:
+                value = self._values[loop] = self._factory()
+            return value
+
+    def peek(self) -> Optional[Any]:
+        """Value for the running loop, or None if it has none yet"""
+        with self._lock:
+            return self._values.get(asyncio.get_running_loop())
+
+    def discard(self) -> None:
+        """Forget the running loop's value"""
+        with self._lock:
+            self._values.pop(asyncio.get_running_loop(), None)
+
+    def values(self) -> List[Any]:
+        """Values of every loop still alive"""
+        with self._lock:
+            return list(self._values.values())
+
+
+class SharedSemaphore:
+    """
+    Async semaphore whose limit holds across event loops.
+
+    asyncio.Semaphore belongs to one loop, so a limit meant for the whole
+    process turns into one limit per concurrent request. This one keeps its
+    count under a thread lock and wakes each waiter on its own loop, in
+    FIFO order.
+    """
+
+    def __init__(self, value: int = 1):
+        self._value = value
+        self._waiters = deque()
+        self._lock = Lock()
+
+    async def acquire(self) -> bool:
+        waiter = asyncio.get_running_loop().create_future()
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return True
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # A permit handed over just before the cancellation goes back
+            if not queued and waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        return True
+
+    def _wake(self, waiter: asyncio.Future) -> None:
+        """Runs on the waiter's loop: give it the permit, or pass it on if it gave up"""
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(True)
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+                    return
+                except RuntimeError:
+                    # The waiter's loop is closed; try the next one
+                    continue
+            self._value += 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
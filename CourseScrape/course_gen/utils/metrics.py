@@ -0,0 +1,253 @@
+from course_gen.core.globals import (
+    time, logging, Lock, contextmanager, Any, Dict, List, Optional, Tuple, Iterable
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds: from a cached parse to a slow browser navigation
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Page sizes in bytes, 1 KB to 10 MB
+BYTE_BUCKETS = (1e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 1e7)
+# Extracted words per page
+WORD_BUCKETS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with labels"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def collect(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    @staticmethod
+    def delta(current: Dict, previous: Dict) -> Dict:
+        return {key: value - previous.get(key, 0.0) for key, value in current.items()
+                if value != previous.get(key, 0.0)}
+
+    def render(self, values: Dict) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value:g}"
+                for key, value in sorted(values.items())]
+
+
+class Histogram(Counter):
+    """Bucketed distribution with labels; each value is (bucket counts, sum)"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = TIME_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts = counts[:]
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block, even if it raises"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    @staticmethod
+    def delta(current: Dict, previous: Dict) -> Dict:
+        result = {}
+        for key, (counts, total) in current.items():
+            if key in previous:
+                old_counts, old_total = previous[key]
+                counts = [a - b for a, b in zip(counts, old_counts)]
+                total -= old_total
+            if sum(counts):
+                result[key] = (counts, total)
+        return result
+
+    def render(self, values: Dict) -> List[str]:
+        lines = []
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                labels = _format_labels(self.labelnames + ("le",), key + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {total:g}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def merge(self, values: Dict, by: str) -> Dict[str, Tuple[List[int], float]]:
+        """Combine series that share the value of label ``by``"""
+        index = self.labelnames.index(by)
+        merged: Dict[str, Tuple[List[int], float]] = {}
+        for key, (counts, total) in values.items():
+            old_counts, old_total = merged.get(key[index], ([0] * len(counts), 0.0))
+            merged[key[index]] = ([a + b for a, b in zip(old_counts, counts)], old_total + total)
+        return merged
+
+    def quantile(self, q: float, counts: List[int]) -> float:
+        """Estimate a quantile by interpolating within buckets, as Prometheus does"""
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        cumulative = 0
+        for i, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """
+    In-process metrics registry rendered in the Prometheus text format.
+
+    Values live in this process only: extraction workers report their
+    timings back through the results they return, and each server worker
+    process exposes its own series. ``snapshot`` and ``summary`` give the
+    difference over one job, for the log line written when it finishes.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter] = {}
+        self._lock = Lock()
+
+    def _register(self, metric: Counter) -> Counter:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = TIME_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Current values of every metric"""
+        return {name: metric.collect() for name, metric in self._metrics.items()}
+
+    def values_since(self, since: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+        """Values accumulated after the given snapshot (all values without one)"""
+        current = self.snapshot()
+        if since is None:
+            return current
+        return {name: self._metrics[name].delta(values, since.get(name, {}))
+                for name, values in current.items()}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type_name}")
+            lines.extend(metric.render(metric.collect()))
+        return "\n".join(lines) + "\n"
+
+    def summary(self, since: Optional[Dict[str, Dict]] = None, top_domains: int = 5) -> str:
+        """Human-readable digest of the scrape metrics recorded since a snapshot"""
+        values = self.values_since(since)
+        lines = []
+
+        stages = values.get(STAGE_SECONDS.name, {})
+        if stages:
+            lines.append("Stage timings:")
+            for stage, (counts, total) in sorted(STAGE_SECONDS.merge(stages, "stage").items(),
+                                                 key=lambda item: -item[1][1]):
+                lines.append(
+                    f"  {stage:<10} n={sum(counts):<5} total={total:.2f}s "
+                    f"p50={STAGE_SECONDS.quantile(0.5, counts):.3f}s "
+                    f"p95={STAGE_SECONDS.quantile(0.95, counts):.3f}s"
+                )
+            by_domain = sorted(STAGE_SECONDS.merge(stages, "domain").items(), key=lambda item: -item[1][1])
+            lines.append("Slowest domains:")
+            for domain, (counts, total) in by_domain[:top_domains]:
+                lines.append(f"  {domain} {total:.2f}s over {sum(counts)} stage runs")
+
+        page_bytes = values.get(PAGE_BYTES.name, {})
+        if page_bytes:
+            for tier, (counts, total) in sorted(PAGE_BYTES.merge(page_bytes, "tier").items()):
+                lines.append(f"Pages ({tier}): {sum(counts)} fetched, {total / 1e6:.2f} MB")
+
+        for metric, title in ((EXTRACTIONS_TOTAL, "Extraction"), (SKIPS_TOTAL, "Skips"),
+                              (ERRORS_TOTAL, "Errors")):
+            totals: Dict[str, float] = {}
+            label_index = len(metric.labelnames) - 1
+            for key, value in values.get(metric.name, {}).items():
+                totals[key[label_index]] = totals.get(key[label_index], 0.0) + value
+            if totals:
+                parts = ", ".join(f"{label} {value:g}" for label, value in
+                                  sorted(totals.items(), key=lambda item: -item[1]))
+                lines.append(f"{title}: {parts}")
+
+        words = values.get(EXTRACTED_WORDS.name, {})
+        if words:
+            pages = sum(sum(counts) for counts, _ in words.values())
+            total = sum(total for _, total in words.values())
+            lines.append(f"Extracted words: {total:g} over {pages} pages ({total / pages:.0f} per page)")
+
+        return "\n".join(lines) if lines else "No scrape metrics recorded"
+
+    def log_summary(self, job: str, since: Optional[Dict[str, Dict]] = None) -> None:
+        """Log the summary for a finished job"""
+        logger.info(f"{job} finished\n{self.summary(since)}")
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "scraper_stage_seconds", "Time spent in each scrape stage", ("stage", "domain")
+)
+PAGE_BYTES = REGISTRY.histogram(
+    "scraper_page_bytes", "Size of fetched page HTML", ("domain", "tier"), BYTE_BUCKETS
+)
+FETCHES_TOTAL = REGISTRY.counter(
+    "scraper_fetches_total", "Page fetches by HTTP status (or cache/error)", ("domain", "tier", "status")
+)
+EXTRACTIONS_TOTAL = REGISTRY.counter(
+    "scraper_extractions_total", "Parse/extract outcomes", ("domain", "tier", "outcome")
+)
+EXTRACTED_WORDS = REGISTRY.histogram(
+    "scraper_extracted_words", "Words of content extracted per page", ("domain",), WORD_BUCKETS
+)
+SKIPS_TOTAL = REGISTRY.counter(
+    "scraper_skips_total", "URLs skipped before fetching, by reason", ("domain", "reason")
+)
+ERRORS_TOTAL = REGISTRY.counter(
+    "scraper_errors_total", "Scrape failures by error class", ("domain", "category")
+)
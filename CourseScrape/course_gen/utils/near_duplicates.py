@@ -0,0 +1,105 @@
+from course_gen.core.globals import (
+    re, hashlib, lazy, defaultdict, Dict, List, Optional, Any
+)
+
+# Mersenne prime for the universal hash family (a * x + b) mod p
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH index for finding near-duplicate texts.
+
+    Texts are reduced to sets of word shingles and summarized by a MinHash
+    signature whose agreement rate estimates Jaccard similarity. Signatures
+    are split into bands and bucketed, so a query only compares against
+    texts that share at least one band instead of the whole collection.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 5,
+                 threshold: float = 0.8, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        np = lazy.np
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        # 32-bit coefficients keep a * x + b within uint64
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MAX_HASH, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _MAX_HASH, size=(num_perm, 1), dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, List[Any]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _shingle_hashes(self, text: str):
+        np = lazy.np
+        words = _WORD_RE.findall(text.lower())
+        if not words:
+            return None
+
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        return np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+             for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+
+    def signature(self, text: str):
+        """MinHash signature of a text, or None if it has no words"""
+        np = lazy.np
+        hashes = self._shingle_hashes(text or "")
+        if hashes is None:
+            return None
+
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Chunked to bound memory on very long pages
+        for start in range(0, len(hashes), 4096):
+            chunk = hashes[start:start + 4096][np.newaxis, :]
+            permuted = (self._a * chunk + self._b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+            signature = np.minimum(signature, permuted.min(axis=1))
+        return signature
+
+    def _band_keys(self, signature) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def similarity(self, first, second) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float((first == second).mean())
+
+    def query(self, signature) -> Optional[Any]:
+        """Key of the most similar indexed text at or above the threshold"""
+        if signature is None:
+            return None
+
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        best_key, best_score = None, self.threshold
+        for key in candidates:
+            score = self.similarity(signature, self._signatures[key])
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def add(self, key: Any, signature) -> None:
+        """Index a signature under a key, replacing any previous one"""
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band][band_key]
+            if key not in bucket:
+                bucket.append(key)
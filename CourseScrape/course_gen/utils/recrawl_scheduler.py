@@ -0,0 +1,116 @@
+from course_gen.core.globals import (
+    re, math, time, hashlib, logging, Dict, List, Optional
+)
+
+from course_gen.utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Markup that changes between fetches without the page's content changing
+_VOLATILE_RE = re.compile(
+    r'<script\b.*?</script>|<style\b.*?</style>|<noscript\b.*?</noscript>|<!--.*?-->',
+    re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def page_fingerprint(html: str) -> str:
+    """Hash of a page's visible text, ignoring scripts, styles, comments and attributes"""
+    text = _TAG_RE.sub(' ', _VOLATILE_RE.sub(' ', html or ''))
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class RecrawlScheduler:
+    """
+    Adaptive revisit schedule for scraped pages.
+
+    Each scraped URL gets a content fingerprint, a last-changed time and
+    counts of checks and detected changes. The change rate is estimated with
+    the Cho & Garcia-Molina estimator for pages polled at intervals, and the
+    next check is scheduled one expected change away, clamped to
+    [min_interval, max_interval]. Pages that never change back off
+    exponentially. State lives in the URLStateStore.
+    """
+
+    def __init__(self, state_store, initial_interval: float = 7 * 24 * 3600,
+                 min_interval: float = 6 * 3600, max_interval: float = 90 * 24 * 3600):
+        self.state_store = state_store
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    @staticmethod
+    def change_rate(state: Dict) -> float:
+        """Estimated changes per second from the page's check history"""
+        checks, changes = state["checks"], state["changes"]
+        if changes == 0 or state["observed"] <= 0:
+            return 0.0
+        changes_per_check = -math.log((checks - changes + 0.5) / (checks + 0.5))
+        return changes_per_check / (state["observed"] / checks)
+
+    def _next_interval(self, state: Dict) -> float:
+        rate = self.change_rate(state)
+        interval = 1.0 / rate if rate > 0 else state["interval"] * 2
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def register(self, url: str, content_hash: str = "", topic: str = "") -> None:
+        """Start tracking a freshly scraped page (or count a re-scrape as a check)"""
+        key = canonicalize_url(url)
+        if self.state_store.load_recrawl(key) is not None:
+            if content_hash:
+                self.record_check(url, content_hash)
+            return
+
+        now = time.time()
+        self.state_store.save_recrawl(key, {
+            "url": url,
+            "topic": topic,
+            "content_hash": content_hash,
+            "first_seen": now,
+            "last_checked": now,
+            "last_changed": now,
+            "checks": 0,
+            "changes": 0,
+            "observed": 0.0,
+            "interval": self.initial_interval,
+            "next_check": now + self.initial_interval
+        })
+
+    def record_check(self, url: str, content_hash: str) -> bool:
+        """Record a revisit's fingerprint, reschedule the page, and return whether it changed"""
+        key = canonicalize_url(url)
+        state = self.state_store.load_recrawl(key)
+        if state is None:
+            self.register(url, content_hash)
+            return True
+
+        now = time.time()
+        changed = content_hash != state["content_hash"]
+        if state["content_hash"]:
+            # Without a baseline fingerprint the check tells nothing about the rate
+            state["checks"] += 1
+            state["changes"] += int(changed)
+            state["observed"] += now - state["last_checked"]
+        if changed:
+            state["content_hash"] = content_hash
+            state["last_changed"] = now
+
+        state["last_checked"] = now
+        state["interval"] = self._next_interval(state)
+        state["next_check"] = now + state["interval"]
+        self.state_store.save_recrawl(key, state)
+        return changed
+
+    def defer(self, url: str) -> None:
+        """Push back a check that could not be made (fetch failed, page gone)"""
+        key = canonicalize_url(url)
+        state = self.state_store.load_recrawl(key)
+        if state is not None:
+            state["next_check"] = time.time() + self.min_interval
+            self.state_store.save_recrawl(key, state)
+
+    def due(self, limit: int = 50, now: Optional[float] = None) -> List[Dict]:
+        """Pages whose next check is due, most overdue first"""
+        return self.state_store.due_recrawls(now if now is not None else time.time(), limit)
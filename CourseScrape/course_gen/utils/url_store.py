@@ -0,0 +1,363 @@
+from course_gen.core.globals import (
+    os, time, json, logging, sqlite3, threading, queue, atexit, Lock,
+    Dict, List, Optional, Tuple, Iterable
+)
+
+from concurrent.futures import Future
+
+from course_gen.utils.file_manager import FileManager
+from course_gen.utils.url_utils import canonicalize_url, canonical_domain
+
+logger = logging.getLogger(__name__)
+
+STATUS_SCRAPED = "scraped"
+STATUS_BAD = "bad"
+
+# PRAGMA user_version once url_state keys are canonical
+SCHEMA_VERSION = 1
+
+
+def canonical_key(key: str) -> str:
+    """Canonical form of a stored URL or bare domain key"""
+    if "://" in key:
+        return canonicalize_url(key)
+    if "/" not in key:
+        return canonical_domain(f"https://{key}")
+    return key
+
+
+class URLStateStore:
+    """
+    SQLite (WAL) store for per-URL and per-domain crawl state.
+
+    Writes (URL status, recrawl schedules, circuit breakers) are O(1)
+    appends to an in-memory queue that a background writer thread commits
+    in batches, so they never block the event loop on disk I/O. Unflushed
+    writes are kept in overlays so reads see them immediately. A batch that
+    fails to commit (e.g. the database is locked) is retried with backoff
+    before it is dropped. The database is opened lazily on first use, and
+    legacy scraped_urls.json / bad_urls.json files are imported once. Keys
+    are canonical URLs and domains; rows stored with raw keys by older
+    versions are rewritten once on open.
+    """
+
+    def __init__(self, db_path: str = "url_state.db", bad_ttl: int = 7 * 24 * 3600,
+                 batch_size: int = 100, flush_interval: float = 2.0,
+                 legacy_files: Optional[Dict[str, str]] = None,
+                 write_retries: int = 5, retry_delay: float = 0.5):
+        self.db_path = db_path
+        self.bad_ttl = bad_ttl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.legacy_files = legacy_files or {}
+        self.write_retries = write_retries
+        self.retry_delay = retry_delay
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = Lock()
+        self._overlay: Dict[str, Tuple] = {}
+        self._recrawl_overlay: Dict[str, Dict] = {}
+        self._overlay_lock = Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database and start the writer on first use"""
+        if self._conn is not None:
+            return self._conn
+
+        with self._conn_lock:
+            if self._conn is None:
+                conn = self._connect()
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS url_state (
+                        key TEXT PRIMARY KEY,
+                        kind TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        reason TEXT,
+                        updated_at REAL NOT NULL,
+                        expires_at REAL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS recrawl_state (
+                        key TEXT PRIMARY KEY,
+                        data TEXT NOT NULL,
+                        next_check REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS recrawl_due ON recrawl_state (next_check)")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS domain_breakers (
+                        domain TEXT PRIMARY KEY,
+                        data TEXT NOT NULL,
+                        updated_at REAL NOT NULL
+                    )
+                """)
+                conn.commit()
+                self._migrate_keys(conn)
+                self._import_legacy_files(conn)
+                self._conn = conn
+
+                self._writer = threading.Thread(target=self._writer_loop, name="url-state-writer", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+        return self._conn
+
+    def _migrate_keys(self, conn: sqlite3.Connection) -> None:
+        """One-time rewrite of raw URL/netloc keys to canonical keys, keeping the newest row per key"""
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        rows = conn.execute(
+            "SELECT key, kind, status, reason, updated_at, expires_at FROM url_state"
+        ).fetchall()
+        merged: Dict[str, Tuple] = {}
+        for row in rows:
+            key = canonical_key(row[0])
+            if key not in merged or row[4] >= merged[key][4]:
+                merged[key] = (key,) + tuple(row[1:])
+
+        try:
+            if len(merged) != len(rows) or any(row[0] not in merged for row in rows):
+                conn.execute("DELETE FROM url_state")
+                conn.executemany("INSERT INTO url_state VALUES (?, ?, ?, ?, ?, ?)", list(merged.values()))
+                logger.info(f"Canonicalized {len(rows)} URL state rows into {len(merged)} keys")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"URL state key migration failed: {str(e)}")
+
+    def _import_legacy_files(self, conn: sqlite3.Connection) -> None:
+        """One-time import of the old JSON URL sets"""
+        if conn.execute("SELECT 1 FROM url_state LIMIT 1").fetchone():
+            return
+
+        now = time.time()
+        for status, file_path in self.legacy_files.items():
+            if not file_path or not os.path.exists(file_path):
+                continue
+            try:
+                data = FileManager.load_json(file_path)
+                keys = data if isinstance(data, list) else []
+                expires_at = now + self.bad_ttl if status == STATUS_BAD else None
+                conn.executemany(
+                    "INSERT OR REPLACE INTO url_state VALUES (?, ?, ?, ?, ?, ?)",
+                    [(canonical_key(key), "domain" if "/" not in key else "url", status, "imported", now, expires_at)
+                     for key in keys]
+                )
+                conn.commit()
+                logger.info(f"Imported {len(keys)} {status} entries from {file_path}")
+            except Exception as e:
+                logger.warning(f"Could not import {file_path}: {str(e)}")
+
+    def mark(self, key: str, status: str, kind: str = "url", reason: str = "",
+             ttl: Optional[float] = None) -> None:
+        """Record a status for a URL or domain; committed asynchronously in batches"""
+        self._get_conn()
+        now = time.time()
+        if ttl is None and status == STATUS_BAD:
+            ttl = self.bad_ttl
+        expires_at = now + ttl if ttl is not None else None
+
+        row = (key, kind, status, reason, now, expires_at)
+        with self._overlay_lock:
+            self._overlay[key] = row
+        self._queue.put(("url", row))
+
+    def get_status(self, key: str) -> Optional[str]:
+        """Current unexpired status for a key, or None"""
+        conn = self._get_conn()
+        with self._overlay_lock:
+            row = self._overlay.get(key)
+
+        if row is None:
+            with self._conn_lock:
+                row = conn.execute(
+                    "SELECT key, kind, status, reason, updated_at, expires_at FROM url_state WHERE key = ?",
+                    (key,)
+                ).fetchone()
+
+        if row is None:
+            return None
+
+        expires_at = row[5]
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return row[2]
+
+    def keys_with_status(self, status: str) -> List[str]:
+        """All unexpired keys with a status (committed entries only)"""
+        conn = self._get_conn()
+        with self._conn_lock:
+            rows = conn.execute(
+                "SELECT key FROM url_state WHERE status = ? AND (expires_at IS NULL OR expires_at >= ?)",
+                (status, time.time())
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_keys(self) -> Iterable[str]:
+        """Every stored key regardless of status or expiry"""
+        conn = self._get_conn()
+        with self._conn_lock:
+            rows = conn.execute("SELECT key FROM url_state").fetchall()
+        for row in rows:
+            yield row[0]
+        with self._overlay_lock:
+            pending = list(self._overlay)
+        yield from pending
+
+    def run_in_writer(self, fn, *args) -> Future:
+        """
+        Run fn(*args) on the writer thread, in order with the queued writes.
+        Load-then-save updates go through here so they cannot interleave.
+        The returned future holds fn's result (asyncio.wrap_future to await it).
+        """
+        self._get_conn()
+        future: Future = Future()
+        self._queue.put(("call", fn, args, future))
+        return future
+
+    def save_breaker(self, domain: str, data: Dict) -> None:
+        """Persist one domain's circuit breaker state (queued; breakers are read once at startup)"""
+        self._get_conn()
+        self._queue.put(("breaker", domain, dict(data)))
+
+    def load_breakers(self) -> Dict[str, Dict]:
+        """Every persisted circuit breaker state by domain"""
+        conn = self._get_conn()
+        with self._conn_lock:
+            rows = conn.execute("SELECT domain, data FROM domain_breakers").fetchall()
+        return {domain: json.loads(data) for domain, data in rows}
+
+    def save_recrawl(self, key: str, data: Dict) -> None:
+        """Persist one page's recrawl state (queued like URL status writes)"""
+        self._get_conn()
+        data = dict(data)
+        with self._overlay_lock:
+            self._recrawl_overlay[key] = data
+        self._queue.put(("recrawl", key, data))
+
+    def load_recrawl(self, key: str) -> Optional[Dict]:
+        """Recrawl state for a canonical URL, or None if it is not scheduled"""
+        conn = self._get_conn()
+        with self._overlay_lock:
+            data = self._recrawl_overlay.get(key)
+        if data is not None:
+            return dict(data)
+
+        with self._conn_lock:
+            row = conn.execute("SELECT data FROM recrawl_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def due_recrawls(self, now: float, limit: int) -> List[Dict]:
+        """Recrawl states whose next check is due, most overdue first"""
+        conn = self._get_conn()
+        with self._overlay_lock:
+            pending = {key: dict(data) for key, data in self._recrawl_overlay.items()}
+        with self._conn_lock:
+            rows = conn.execute(
+                "SELECT key, data FROM recrawl_state WHERE next_check <= ? ORDER BY next_check LIMIT ?",
+                (now, limit + len(pending))
+            ).fetchall()
+
+        states = {key: json.loads(data) for key, data in rows if key not in pending}
+        states.update((key, data) for key, data in pending.items() if data["next_check"] <= now)
+        return sorted(states.values(), key=lambda state: state["next_check"])[:limit]
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue, committing up to batch_size rows at a time"""
+        conn = self._connect()
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._write_batch(conn, batch)
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple]) -> None:
+        """
+        Commit a batch, retrying with backoff while the database is busy.
+
+        Deferred calls commit the writes before them and never run twice: a
+        retry resumes after the last call that ran.
+        """
+        done = 0
+        try:
+            for attempt in range(self.write_retries + 1):
+                try:
+                    for index in range(done, len(batch)):
+                        item = batch[index]
+                        if item[0] == "call":
+                            # Deferred update: commit what precedes it so it reads its own writes
+                            conn.commit()
+                            done = index + 1
+                            try:
+                                item[3].set_result(item[1](*item[2]))
+                            except Exception as e:
+                                logger.error(f"Deferred URL state update failed: {str(e)}")
+                                item[3].set_exception(e)
+                        else:
+                            self._execute_write(conn, item)
+                    conn.commit()
+                    break
+                except Exception as e:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    if attempt == self.write_retries:
+                        logger.error(
+                            f"URL state write failed after {attempt + 1} attempts, "
+                            f"dropping {len(batch) - done} queued writes: {str(e)}"
+                        )
+                        for item in batch[done:]:
+                            if item[0] == "call":
+                                item[3].set_exception(e)
+                        return
+                    delay = min(self.retry_delay * 2 ** attempt, 30.0)
+                    logger.warning(f"URL state write failed, retrying in {delay:.1f}s: {str(e)}")
+                    time.sleep(delay)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+        # Drop overlay entries that are now on disk (unless overwritten since)
+        with self._overlay_lock:
+            for item in batch:
+                if item[0] == "url" and self._overlay.get(item[1][0]) is item[1]:
+                    del self._overlay[item[1][0]]
+                elif item[0] == "recrawl" and self._recrawl_overlay.get(item[1]) is item[2]:
+                    del self._recrawl_overlay[item[1]]
+
+    @staticmethod
+    def _execute_write(conn: sqlite3.Connection, item: Tuple) -> None:
+        if item[0] == "url":
+            conn.execute("INSERT OR REPLACE INTO url_state VALUES (?, ?, ?, ?, ?, ?)", item[1])
+        elif item[0] == "recrawl":
+            conn.execute(
+                "INSERT OR REPLACE INTO recrawl_state VALUES (?, ?, ?)",
+                (item[1], json.dumps(item[2]), item[2]["next_check"])
+            )
+        elif item[0] == "breaker":
+            conn.execute(
+                "INSERT OR REPLACE INTO domain_breakers VALUES (?, ?, ?)",
+                (item[1], json.dumps(item[2]), time.time())
+            )
+
+    def flush(self) -> None:
+        """Block until every queued write has been committed"""
+        if self._conn is not None:
+            self._queue.join()
@@ -0,0 +1,108 @@
+from course_gen.core.globals import (
+    math, hashlib, urlparse, urlencode, parse_qsl, Iterable
+)
+
+# Query parameters that only track the visit and never change page content
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "dclid", "yclid", "mc_cid", "mc_eid",
+    "ref_src", "igshid", "_ga", "_gl", "spm"
+}
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _filtered_query(query: str) -> str:
+    params = [
+        (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    return urlencode(sorted(params))
+
+
+def clean_url(url: str) -> str:
+    """Drop the fragment and tracking parameters; safe to navigate to"""
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return url.strip()
+    return parsed._replace(query=_filtered_query(parsed.query), fragment="").geturl()
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Identity key for a URL: http/https, www., default ports, fragments,
+    tracking parameters, query order and trailing slashes are normalized
+    away so variants of the same page compare equal. Use clean_url for the
+    URL that is actually fetched. Malformed URLs never raise: they are
+    returned as given, and a bad port keeps the host as written.
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return url.strip()
+    scheme = parsed.scheme.lower()
+    if scheme not in ("http", "https"):
+        return url.strip()
+
+    try:
+        host = (parsed.hostname or "").lower()
+        port = str(parsed.port) if parsed.port else ""
+    except ValueError:
+        # Out-of-range or non-numeric port: fall back to the raw netloc
+        host = parsed.netloc.rsplit("@", 1)[-1].lower()
+        port = ""
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parsed.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+
+    query = _filtered_query(parsed.query)
+    return f"https://{host}{path}" + (f"?{query}" if query else "")
+
+
+def canonical_domain(url: str) -> str:
+    """Host part of the canonical URL"""
+    try:
+        return urlparse(canonicalize_url(url)).netloc
+    except ValueError:
+        return ""
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set for "have we seen this?" checks.
+
+    No false negatives; false positives at roughly error_rate once
+    capacity items have been added, so positives must be confirmed
+    against an exact store.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count